@@ -0,0 +1,57 @@
+"""
+Compare batch factoring (remainder-tree trial division) with per-number factor().
+
+Usage:
+    python benchmarks/bench_batch_factoring.py --count 1000000 --digits 12
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# Make pv_sdk importable from a source checkout without installing it
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from pv_sdk.factoring import factor_frequencies, factor_many  # noqa: E402
+
+
+def run(count: int, digits: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    numbers = [rng.randrange(10 ** (digits - 1), 10**digits) for _ in range(count)]
+
+    random.seed(seed)
+    started = time.perf_counter()
+    batched = factor_many(numbers)
+    batch_seconds = time.perf_counter() - started
+
+    random.seed(seed)
+    started = time.perf_counter()
+    single = [factor_frequencies(n) for n in numbers]
+    single_seconds = time.perf_counter() - started
+
+    if batched != single:
+        raise AssertionError("factor_many and factor_frequencies disagree")
+    return {
+        "count": count,
+        "digits": digits,
+        "factor_many_s": batch_seconds,
+        "factor_many_per_s": count / batch_seconds,
+        "per_number_factor_s": single_seconds,
+        "per_number_factor_per_s": count / single_seconds,
+        "speedup": single_seconds / batch_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--digits", type=int, default=12)
+    args = parser.parse_args()
+    print(json.dumps(run(args.count, args.digits), indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare file size and load time of the JSON and binary result exports.
+
+Usage:
+    python benchmarks/bench_documentation.py --limit 10000000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Make pv_sdk importable from a source checkout without installing it
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from pv_sdk.analysis import explore_modular_arithmetic  # noqa: E402
+from pv_sdk.documentation import (  # noqa: E402
+    load_from_binary,
+    save_to_binary,
+    save_to_json,
+)
+from pv_sdk.prime import _sieve_primes  # noqa: E402
+
+
+def run(limit: int, modulus: int = 7) -> dict:
+    primes = _sieve_primes(limit).tolist()
+    content = {
+        "prime_limit": limit,
+        "primes": primes,
+        "modular_results": explore_modular_arithmetic(primes, modulus),
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, "results.json")
+        binary_path = os.path.join(workdir, "results.pvb")
+
+        started = time.perf_counter()
+        save_to_json(json_path, content)
+        json_save = time.perf_counter() - started
+
+        started = time.perf_counter()
+        save_to_binary(binary_path, content)
+        binary_save = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with open(json_path, encoding="utf-8") as file:
+            json.load(file)
+        json_load = time.perf_counter() - started
+
+        started = time.perf_counter()
+        loaded = load_from_binary(binary_path)
+        int(loaded["primes"][-1])
+        binary_load = time.perf_counter() - started
+
+        return {
+            "prime_count": len(primes),
+            "json_bytes": os.path.getsize(json_path),
+            "binary_bytes": os.path.getsize(binary_path)
+            + os.path.getsize(f"{binary_path}.json"),
+            "json_save_s": json_save,
+            "binary_save_s": binary_save,
+            "json_load_s": json_load,
+            "binary_load_s": binary_load,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=1_000_000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.limit), indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measure pv_sdk import cost with ``python -X importtime`` and enforce thresholds.
+
+Each module is imported in a fresh interpreter several times; the best
+cumulative time reported for the module is compared against its threshold.
+The script exits non-zero when any module regresses.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 5] [--scale 1.0]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+# Fresh interpreters import pv_sdk from the source checkout
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Best-of-N cumulative import time in milliseconds
+IMPORT_THRESHOLDS_MS: Dict[str, float] = {
+    "pv_sdk.factoring": 25.0,
+    "pv_sdk.prime": 25.0,
+}
+
+
+def measure_import_ms(module: str, repeat: int = 5) -> float:
+    """
+    Return the best cumulative import time of module across fresh interpreters.
+
+    Args:
+        module (str): Dotted module name to import.
+        repeat (int): Number of fresh interpreter runs.
+
+    Returns:
+        float: Best cumulative import time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPO_ROOT,
+        )
+        for line in completed.stderr.splitlines():
+            # Format: "import time: self [us] | cumulative | imported package"
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                best = min(best, int(fields[1]) / 1000.0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply every threshold."
+    )
+    args = parser.parse_args()
+
+    results, failed = {}, False
+    for module, threshold in IMPORT_THRESHOLDS_MS.items():
+        elapsed = measure_import_ms(module, args.repeat)
+        limit = threshold * args.scale
+        results[module] = {"import_ms": elapsed, "threshold_ms": limit}
+        failed |= elapsed > limit
+
+    print(json.dumps(results, indent=4))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Load-test the local factorization service and report latency and throughput.
+
+Starts ``pvsdk serve`` in a subprocess, then drives it from several client
+threads, each with its own persistent connection, issuing one request at a
+time. Reports p50/p99 latency and overall throughput as JSON.
+
+Usage:
+    python benchmarks/load_test_service.py --clients 16 --requests 500 --digits 14
+"""
+import argparse
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+# Make pv_sdk importable from a source checkout without installing it
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from pv_sdk.service import FactorClient  # noqa: E402
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(clients: int, requests: int, digits: int, workers: int, window_ms: float):
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "pv_sdk.cli",
+            "serve",
+            "--workers",
+            str(workers),
+            "--batch-window-ms",
+            str(window_ms),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    try:
+        port = json.loads(server.stdout.readline())["listening"][1]
+        latencies = [[] for _ in range(clients)]
+
+        def client_loop(index: int):
+            rng = random.Random(index)
+            with FactorClient(port=port) as client:
+                for _ in range(requests):
+                    n = rng.randrange(10 ** (digits - 1), 10**digits)
+                    started = time.perf_counter()
+                    client.factor_frequencies(n)
+                    latencies[index].append(time.perf_counter() - started)
+
+        threads = [
+            threading.Thread(target=client_loop, args=(i,)) for i in range(clients)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        with FactorClient(port=port) as client:
+            server_metrics = client.metrics()
+    finally:
+        # SIGINT lets serve() close the server: the pool and the shared
+        # prime tables are released instead of leaked
+        server.send_signal(signal.SIGINT)
+        server.wait()
+
+    flat = sorted(latency for per_client in latencies for latency in per_client)
+    return {
+        "clients": clients,
+        "requests": len(flat),
+        "throughput_rps": len(flat) / elapsed,
+        "latency_p50_ms": _percentile(flat, 0.50) * 1e3,
+        "latency_p99_ms": _percentile(flat, 0.99) * 1e3,
+        "latency_mean_ms": statistics.fmean(flat) * 1e3,
+        "server": server_metrics,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="Per client.")
+    parser.add_argument("--digits", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--batch-window-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    report = run(
+        args.clients, args.requests, args.digits, args.workers, args.batch_window_ms
+    )
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Benchmark suite for the PrimeVox SDK hot paths with baseline regression checks.
+
+Each benchmark is a parameterized workload (sieve limits, semiprime sizes,
+graph sizes, ...). The runner times every case, writes machine-readable JSON
+and, when given a baseline file, fails if any case's median time regressed
+by more than the allowed fraction.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json \\
+        --max-regression 0.25 --filter factor
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+# Make pv_sdk importable from a source checkout without installing it
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+SIEVE_LIMITS = (10_000, 100_000, 1_000_000)
+PRIME_COUNT_LIMITS = (10**8, 10**10)
+MULTIPLICATIVE_LIMITS = (10**6, 10**7)
+GOLDBACH_LIMITS = (10**6, 10**7)
+FACTOR_RANGE_STARTS = (10**9, 10**12)
+FACTOR_RANGE_LENGTH = 10**6
+SEMIPRIME_DIGITS = (12, 16, 20)
+PRIME_POWER_DIGITS = (8, 12)
+SIQS_DIGITS = (35, 45)
+GRAPH_SIZES = (100, 200)
+RASTER_SIZES = (1024, 4096)
+BITMAP_LIMITS = (10**7, 10**8)
+BITMAP_QUERIES = 10**6
+SEMIPRIMES_PER_CASE = 5
+
+
+@dataclass
+class Benchmark:
+    """A named workload: ``setup(param)`` builds inputs, ``run(inputs)`` is timed."""
+
+    name: str
+    params: tuple
+    setup: Callable[[Any], Any]
+    run: Callable[[Any], Any]
+    rounds: int = 5
+
+
+def _random_prime(digits: int, rng: random.Random) -> int:
+    from pv_sdk.factoring import _is_prime
+
+    while True:
+        candidate = rng.randrange(10 ** (digits - 1), 10**digits) | 1
+        if _is_prime(candidate):
+            return candidate
+
+
+def _semiprimes(digits: int) -> List[int]:
+    rng = random.Random(digits)
+    half = digits // 2
+    return [
+        _random_prime(half, rng) * _random_prime(digits - half, rng)
+        for _ in range(SEMIPRIMES_PER_CASE)
+    ]
+
+
+def _prime_powers(digits: int) -> List[int]:
+    # p**k plus mixed powers p**2 * r**3 with a small prime r
+    rng = random.Random(digits)
+    numbers = []
+    for k in range(2, 8):
+        p, r = _random_prime(digits, rng), _random_prime(6, rng)
+        numbers += [p**k, p**2 * r**3]
+    return numbers
+
+
+def _generate_primes(limit: int):
+    from pv_sdk.prime import generate_primes_and_map
+
+    # A fresh cache path per call so the sieve, not the pickle, is measured
+    with tempfile.TemporaryDirectory() as workdir:
+        generate_primes_and_map(limit, pickle_file=os.path.join(workdir, "c.pkl"))
+
+
+def _factor_all(numbers: List[int]):
+    from pv_sdk.factoring import factor
+
+    # Pollard-Brent draws random parameters; fix them so rounds are comparable
+    random.seed(0)
+    for n in numbers:
+        factor(n)
+
+
+def _factor_range(lo: int):
+    from pv_sdk.factoring import factor_range
+
+    for _ in factor_range(lo, lo + FACTOR_RANGE_LENGTH, compact=True):
+        pass
+
+
+def _prime_bitmap(limit: int):
+    import numpy as np
+
+    from pv_sdk.prime_bitmap import build_prime_bitmap
+
+    # The directory object is returned too so it lives as long as the index
+    workdir = tempfile.TemporaryDirectory()
+    bitmap = build_prime_bitmap(workdir.name, limit)
+    values = np.random.default_rng(limit).integers(0, limit, BITMAP_QUERIES)
+    return workdir, bitmap, values
+
+
+def _bitmap_queries(inputs):
+    _, bitmap, values = inputs
+    bitmap.is_prime_many(values)
+    bitmap.is_twin_many(values)
+
+
+def _siqs_semiprime(digits: int) -> int:
+    rng = random.Random(digits)
+    half = digits // 2
+    return _random_prime(half, rng) * _random_prime(digits - half, rng)
+
+
+def _siqs(n: int):
+    from pv_sdk.siqs import siqs_factor
+
+    siqs_factor(n)
+
+
+def _random_graph(size: int):
+    import networkx as nx
+
+    return nx.gnp_random_graph(size, 0.05, seed=size)
+
+
+def _graph_properties(graph):
+    from pv_sdk.analysis import analyze_graph_properties
+
+    analyze_graph_properties(graph)
+
+
+def _centralities(graph):
+    from pv_sdk.visualization import calculate_centrality_measures
+
+    calculate_centrality_measures(graph)
+
+
+def _twin_primes(limit: int):
+    from pv_sdk.twin_primes import find_twin_primes
+
+    find_twin_primes(limit)
+
+
+def _prime_count(x: int):
+    from pv_sdk.prime import prime_count
+
+    # Bypass the memo so every round does the full computation
+    prime_count.__wrapped__(x)
+
+
+def _goldbach_partitions(limit: int):
+    from pv_sdk.prime import goldbach_partitions
+
+    goldbach_partitions(limit)
+
+
+def _multiplicative_tables(limit: int):
+    from pv_sdk.arithmetic import multiplicative_tables
+
+    multiplicative_tables(limit)
+
+
+def _ulam_spiral(size: int):
+    from pv_sdk.visualization import save_raster, ulam_spiral
+
+    with tempfile.TemporaryDirectory() as workdir:
+        save_raster(ulam_spiral(size), os.path.join(workdir, "ulam.png"))
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark(
+        "prime.generate_primes_and_map", SIEVE_LIMITS, lambda p: p, _generate_primes
+    ),
+    Benchmark("prime.prime_count", PRIME_COUNT_LIMITS, lambda p: p, _prime_count),
+    Benchmark(
+        "prime.goldbach_partitions", GOLDBACH_LIMITS, lambda p: p, _goldbach_partitions
+    ),
+    Benchmark(
+        "arithmetic.multiplicative_tables",
+        MULTIPLICATIVE_LIMITS,
+        lambda p: p,
+        _multiplicative_tables,
+    ),
+    Benchmark("twin_primes.find_twin_primes", SIEVE_LIMITS, lambda p: p, _twin_primes),
+    Benchmark("factoring.factor", SEMIPRIME_DIGITS, _semiprimes, _factor_all),
+    Benchmark(
+        "factoring.factor_prime_powers", PRIME_POWER_DIGITS, _prime_powers, _factor_all
+    ),
+    Benchmark(
+        "factoring.factor_range", FACTOR_RANGE_STARTS, lambda p: p, _factor_range
+    ),
+    Benchmark(
+        "prime_bitmap.membership_queries", BITMAP_LIMITS, _prime_bitmap, _bitmap_queries
+    ),
+    Benchmark("siqs.siqs_factor", SIQS_DIGITS, _siqs_semiprime, _siqs, rounds=3),
+    Benchmark(
+        "analysis.analyze_graph_properties",
+        GRAPH_SIZES,
+        _random_graph,
+        _graph_properties,
+    ),
+    Benchmark(
+        "visualization.calculate_centrality_measures",
+        GRAPH_SIZES,
+        _random_graph,
+        _centralities,
+    ),
+    Benchmark(
+        "visualization.ulam_spiral", RASTER_SIZES, lambda p: p, _ulam_spiral, rounds=3
+    ),
+]
+
+
+def run_benchmarks(name_filter: str = "", rounds: int = 0) -> Dict[str, Dict]:
+    """
+    Time every benchmark case whose ``name[param]`` contains name_filter.
+
+    Args:
+        name_filter (str): Substring selecting cases (empty selects all).
+        rounds (int): Override the per-benchmark round count when > 0.
+
+    Returns:
+        Dict[str, Dict]: ``{"name[param]": {"min", "median", "mean", "rounds"}}``.
+    """
+    results = {}
+    for benchmark in BENCHMARKS:
+        for param in benchmark.params:
+            case = f"{benchmark.name}[{param}]"
+            if name_filter not in case:
+                continue
+            inputs = benchmark.setup(param)
+            timings = []
+            for _ in range(rounds or benchmark.rounds):
+                started = time.perf_counter()
+                benchmark.run(inputs)
+                timings.append(time.perf_counter() - started)
+            results[case] = {
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.fmean(timings),
+                "rounds": len(timings),
+            }
+            print(f"{case:60s} median {results[case]['median'] * 1e3:10.3f} ms")
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], max_regression: float
+) -> List[str]:
+    """
+    Return a message for every case slower than baseline by more than allowed.
+
+    Args:
+        results (Dict[str, Dict]): Current results from run_benchmarks.
+        baseline (Dict[str, Dict]): Stored results from an earlier run.
+        max_regression (float): Allowed slowdown fraction (0.25 means +25%).
+
+    Returns:
+        List[str]: One message per regressed case; empty when all pass.
+    """
+    regressions = []
+    for case, current in results.items():
+        if case not in baseline:
+            continue
+        ratio = current["median"] / baseline[case]["median"]
+        if ratio > 1 + max_regression:
+            regressions.append(
+                f"{case}: median {current['median']:.6f}s vs baseline "
+                f"{baseline[case]['median']:.6f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="Only run matching cases.")
+    parser.add_argument("--rounds", type=int, default=0, help="Rounds per case.")
+    parser.add_argument("--output", help="Write JSON results to this path.")
+    parser.add_argument("--baseline", help="Compare against this results file.")
+    parser.add_argument("--save-baseline", help="Store results as a new baseline.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed median slowdown vs baseline (default: 0.25 = 25%%).",
+    )
+    args = parser.parse_args()
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "results": run_benchmarks(args.filter, args.rounds),
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_to_baseline(
+            report["results"], baseline, args.max_regression
+        )
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
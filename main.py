@@ -1,4 +1,5 @@
-import networkx as nx
+import os
+import time
 
 from pv_sdk.analysis import (
     analyze_graph_properties,
@@ -8,7 +9,12 @@ from pv_sdk.analysis import (
 from pv_sdk.coloring import TerminalColors, colorize
 from pv_sdk.documentation import append_timestamp, save_to_json
 from pv_sdk.factoring import factor, factor_and_map
-from pv_sdk.historical_analysis import append_historical_record, load_historical_data
+from pv_sdk.historical_analysis import (
+    HistoricalStore,
+    append_historical_record,
+    load_historical_data,
+    migrate_json_to_log,
+)
 from pv_sdk.prime import create_composite_mappings, generate_primes_and_map
 from pv_sdk.twin_primes import count_twin_primes, find_twin_primes
 from pv_sdk.visualization import (
@@ -16,9 +22,13 @@ from pv_sdk.visualization import (
     detect_graph_communities,
     graphical_representation_with_labels,
 )
+from pv_sdk.vowel_graph import PrimeVowelGraph
 
 
 def main():
+    import networkx as nx
+
+    run_started = time.perf_counter()
     print(
         colorize(
             "\n🚀 PrimeVox SDK Example Execution Started 🚀\n",
@@ -71,6 +81,13 @@ def main():
     # Use the ORIGINAL lists so you see all 15 primes up to 50
     graphical_representation_with_labels(orig_primes, orig_vowels)
 
+    # Reuse the graph of earlier runs; only primes above its limit are added
+    vowel_graph = PrimeVowelGraph.load("prime_vowel_graph.json")
+    vowel_graph.extend_to(prime_limit)
+    vowel_graph.save("prime_vowel_graph.json")
+    print(colorize("\n🕸️ Prime-vowel graph statistics:", TerminalColors.BLUE))
+    print(vowel_graph.properties(per_node=False))
+
     prime_graph = nx.Graph()
     prime_graph.add_edges_from([(2, 3), (3, 5), (5, 7), (7, 2)])
     communities = detect_graph_communities(prime_graph)
@@ -103,15 +120,34 @@ def main():
     save_to_json(json_filename, results)
 
     # —— Historical Analysis Module ——
+    # Carry the history of earlier runs over from the legacy JSON file once
+    if not os.path.exists("historical_data.jsonl") and os.path.exists(
+        "historical_data.json"
+    ):
+        migrate_json_to_log("historical_data.json", "historical_data.jsonl")
     append_historical_record(
-        "historical_data.json",
+        "historical_data.jsonl",
         "recent_prime_analysis",
         {"prime_limit": prime_limit, "found_primes": len(orig_primes)},
     )
-    historical_data = load_historical_data("historical_data.json")
+    historical_data = load_historical_data("historical_data.jsonl")
     print(colorize("\n🗃️ Historical data loaded:", TerminalColors.GREEN))
     print(historical_data)
 
+    # Keep every run as a timestamped record so trends survive across runs
+    with HistoricalStore("historical_runs.db") as store:
+        store.record(
+            "prime_analysis",
+            {
+                "prime_limit": prime_limit,
+                "found_primes": len(orig_primes),
+                "duration": time.perf_counter() - run_started,
+            },
+        )
+        duration_stats = store.aggregate("prime_analysis", "duration")
+    print(colorize("\n⏱️ Run duration statistics:", TerminalColors.GREEN))
+    print(duration_stats)
+
     print(
         colorize(
             "\n🎯 PrimeVox SDK Example Execution Completed 🎯\n", TerminalColors.BOLD
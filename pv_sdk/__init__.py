@@ -0,0 +1,9 @@
+"""
+PrimeVox SDK: prime generation, factoring and vowel-notation analysis.
+
+Importing any pv_sdk module must stay cheap, because CLI invocations and
+process-pool workers import them on every start. Heavy dependencies (numpy,
+sympy, scipy, networkx, matplotlib) are therefore imported inside the
+functions that use them. Modules only import them at the top under
+``if TYPE_CHECKING:`` for annotations. tests/test_imports.py enforces this.
+"""
@@ -0,0 +1,236 @@
+"""
+asyncio front-end for PrimeVox SDK factoring and sieve jobs.
+
+CPU-bound work runs on a shared process pool so it never blocks the event
+loop. An engine limits how many jobs run at once, applies backpressure to
+streaming sieves, propagates cancellation, and coalesces concurrent
+``afactor`` calls for the same n into a single computation.
+
+Cancellation: cancelling an awaiting task cancels its pool job if the job
+has not started yet. A job already running in a worker process finishes in
+the background and its result is discarded. A coalesced job is only
+cancelled once every caller waiting on it has been cancelled.
+
+Public API:
+  - AsyncEngine(max_workers=None, max_concurrency=None)
+  - afactor(n: int) -> List[int]
+  - aiter_primes(lo: int, hi: int, chunk_size: Optional[int] = None,
+                 prefetch: int = DEFAULT_PREFETCH, tables: Optional[Mapping] = None)
+        -> AsyncIterator
+  - shutdown()
+"""
+import asyncio
+import math
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from multiprocessing import resource_tracker
+from typing import AsyncIterator, Dict, List, Mapping, Optional
+
+from pv_sdk import tuning
+from pv_sdk.factoring import _table_primes, factor
+from pv_sdk.prime import _segment_primes, _sieve_primes
+from pv_sdk.shared_tables import SharedPrimeTables
+
+# Segments sieved ahead of an aiter_primes consumer
+DEFAULT_PREFETCH = 2
+
+
+def _segment_task(lo: int, hi: int, tables: Mapping):
+    """Sieve [lo, hi) in a worker from the base primes held in tables."""
+    return _segment_primes(lo, hi, _table_primes(tables, math.isqrt(hi - 1)))
+
+
+class _SharedJob:
+    """A pool job plus the number of callers currently awaiting it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.waiters = 0
+
+
+class AsyncEngine:
+    """Shared process pool, concurrency limit and in-flight request table."""
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_concurrency: Optional[int] = None
+    ):
+        """
+        Create an engine; the process pool is started on first use.
+
+        Args:
+            max_workers (int, optional): Pool size (default: the tuned
+                workers, see pv_sdk.tuning).
+            max_concurrency (int, optional): Jobs allowed in the pool at once
+                (default: max_workers). Further jobs wait on the event loop.
+        """
+        self.max_workers = tuning.get("workers", max_workers)
+        self.max_concurrency = max_concurrency or self.max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._factoring: Dict[int, _SharedJob] = {}
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Workers must share this process's resource tracker, or the
+            # shared tables they attach to are reported as leaked at exit
+            resource_tracker.ensure_running()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, func, *args):
+        """Run func(*args) in the pool once a concurrency slot is free."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            # asyncio primitives are bound to one event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        async with self._semaphore:
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def afactor(self, n: int) -> List[int]:
+        """
+        Factor n in the process pool without blocking the event loop.
+
+        Concurrent calls for the same n share one computation.
+
+        Args:
+            n: Integer to factor.
+        Returns:
+            A list of prime factors (unsorted), as returned by ``factor``.
+        """
+        shared = self._factoring.get(n)
+        if shared is None or shared.future.done():
+            shared = _SharedJob(asyncio.ensure_future(self.run(factor, n)))
+            self._factoring[n] = shared
+            shared.future.add_done_callback(lambda _: self._forget(n, shared))
+        shared.waiters += 1
+        try:
+            return list(await asyncio.shield(shared.future))
+        except asyncio.CancelledError:
+            # Only the last interested caller may cancel the shared job
+            if shared.waiters == 1:
+                shared.future.cancel()
+            raise
+        finally:
+            shared.waiters -= 1
+
+    def _forget(self, n: int, shared: "_SharedJob"):
+        if self._factoring.get(n) is shared:
+            del self._factoring[n]
+
+    async def aiter_primes(
+        self,
+        lo: int,
+        hi: int,
+        chunk_size: Optional[int] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        tables: Optional[Mapping] = None,
+    ) -> AsyncIterator:
+        """
+        Stream the primes in [lo, hi) as NumPy arrays, one per segment.
+
+        At most ``prefetch`` segments are sieved ahead of the consumer, so a
+        slow consumer naturally throttles the pool. Segment tasks receive a
+        SharedPrimeTables handle rather than a copy of the base primes: the
+        caller's ``tables`` if given, otherwise one published for the stream
+        and unlinked when it ends.
+
+        Args:
+            lo (int): Inclusive lower bound.
+            hi (int): Exclusive upper bound.
+            chunk_size (int, optional): Integers per segment (default: the
+                tuned sieve_segment_size).
+            prefetch (int): Segments computed ahead of the consumer (>= 1).
+            tables (Mapping, optional): Base-prime tables for the segments,
+                typically a SharedPrimeTables from publish_prime_tables;
+                ``tables["primes"]`` must hold every prime <= isqrt(hi - 1).
+        Yields:
+            np.ndarray: Sorted primes of each consecutive segment.
+        Raises:
+            ValueError: If chunk_size or prefetch is not positive, or tables
+                misses a base prime.
+        """
+        chunk_size = tuning.get("sieve_segment_size", chunk_size)
+        if chunk_size < 1 or prefetch < 1:
+            raise ValueError("chunk_size and prefetch must be positive.")
+        lo = max(lo, 2)
+        if hi <= lo:
+            return
+        root = math.isqrt(hi - 1)
+        if tables is None:
+            base_primes = await self.run(_sieve_primes, root)
+            published = SharedPrimeTables({"primes": base_primes}, root)
+        else:
+            _table_primes(tables, root)
+            published = nullcontext(tables)
+        with published as tables:
+            starts = iter(range(lo, hi, chunk_size))
+            pending: List[asyncio.Future] = []
+
+            def submit():
+                start = next(starts, None)
+                if start is not None:
+                    end = min(start + chunk_size, hi)
+                    pending.append(
+                        asyncio.ensure_future(
+                            self.run(_segment_task, start, end, tables)
+                        )
+                    )
+
+            try:
+                for _ in range(prefetch):
+                    submit()
+                while pending:
+                    chunk = await pending.pop(0)
+                    submit()
+                    yield chunk
+            finally:
+                for job in pending:
+                    job.cancel()
+
+    def shutdown(self, wait: bool = True):
+        """Shut the process pool down, cancelling jobs that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        self._semaphore = None
+        self._loop = None
+
+
+_default_engine: Optional[AsyncEngine] = None
+
+
+def get_engine() -> AsyncEngine:
+    """Return the process-wide default AsyncEngine, creating it on first use."""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = AsyncEngine()
+    return _default_engine
+
+
+async def afactor(n: int) -> List[int]:
+    """Factor n on the default engine; see ``AsyncEngine.afactor``."""
+    return await get_engine().afactor(n)
+
+
+def aiter_primes(
+    lo: int,
+    hi: int,
+    chunk_size: Optional[int] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    tables: Optional[Mapping] = None,
+):
+    """Stream primes in [lo, hi) on the default engine; see ``AsyncEngine``."""
+    return get_engine().aiter_primes(lo, hi, chunk_size, prefetch, tables)
+
+
+def shutdown(wait: bool = True):
+    """Shut down the default engine's process pool."""
+    global _default_engine
+    if _default_engine is not None:
+        _default_engine.shutdown(wait)
+        _default_engine = None
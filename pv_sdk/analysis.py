@@ -1,7 +1,9 @@
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-import networkx as nx
-from scipy.stats import chisquare
+from pv_sdk import instrumentation
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 
 def explore_modular_arithmetic(primes: List[int], modulus: int) -> Dict[int, int]:
@@ -22,7 +24,7 @@ def explore_modular_arithmetic(primes: List[int], modulus: int) -> Dict[int, int
     return modular_results
 
 
-def analyze_graph_properties(graph: nx.Graph) -> Dict:
+def analyze_graph_properties(graph: "nx.Graph") -> Dict:
     """
     Analyzes various properties of a given NetworkX graph.
 
@@ -33,6 +35,8 @@ def analyze_graph_properties(graph: nx.Graph) -> Dict:
         Dict: Dictionary of graph properties, including connectivity,
               degree distribution, cliques information, and average degree.
     """
+    import networkx as nx
+
     if len(graph) == 0:
         connectivity = False
         degree_distribution = {}
@@ -40,12 +44,16 @@ def analyze_graph_properties(graph: nx.Graph) -> Dict:
         maximal_cliques_count = 0
         avg_degree = 0.0
     else:
-        connectivity = nx.is_connected(graph)
+        with instrumentation.timer("analysis.connectivity"):
+            connectivity = nx.is_connected(graph)
         degree_distribution = dict(graph.degree())
-        total_cliques = sum(nx.number_of_cliques(graph).values())
-        maximal_cliques = list(nx.find_cliques(graph))
+        with instrumentation.timer("analysis.cliques"):
+            total_cliques = sum(nx.number_of_cliques(graph).values())
+            maximal_cliques = list(nx.find_cliques(graph))
         avg_degree = sum(degree_distribution.values()) / len(degree_distribution)
         maximal_cliques_count = len(maximal_cliques)
+        instrumentation.incr("analysis.graph_nodes", len(graph))
+        instrumentation.incr("analysis.graph_edges", graph.number_of_edges())
 
     return {
         "connectivity": connectivity,
@@ -66,6 +74,8 @@ def perform_statistical_analysis(frequency: Dict[str, int]) -> float:
     Returns:
         float: p-value from the chi-square test indicating pattern significance.
     """
+    from scipy.stats import chisquare
+
     if not frequency:
         print("Warning: Frequency dictionary empty. Returning p-value of 1.0.")
         return 1.0
@@ -75,13 +85,16 @@ def perform_statistical_analysis(frequency: Dict[str, int]) -> float:
         observed_values
     )
 
-    chi2_stat, p_value = chisquare(observed_values, f_exp=expected_values)
+    with instrumentation.timer("analysis.chisquare"):
+        chi2_stat, p_value = chisquare(observed_values, f_exp=expected_values)
 
     return p_value
 
 
 def interactive_analysis():
     """Interactive testing clearly structured for immediate use."""
+    import networkx as nx
+
     # Modular arithmetic exploration clear example:
     primes = [2, 3, 5, 7, 11, 13, 17, 19]
     modulus = 5
@@ -0,0 +1,328 @@
+"""
+Sieve tables of the classic multiplicative functions.
+
+multiplicative_tables computes Euler's totient phi(n), the Moebius function
+mu(n), the divisor count tau(n) and the divisor sum sigma(n) for every
+n <= limit in one linear (Euler) sieve pass: each n is reached exactly once
+as n = p * q with p its smallest prime factor, and f(n) follows from the
+already-known f of the part of n coprime to p. The recurrence only ever looks
+back to q <= n / 2, so it runs block by block over [2^j, 2^(j+1)) with
+vectorized NumPy gathers instead of a per-integer Python loop.
+
+For ranges that do not fit in memory, multiplicative_segment fills the same
+tables for a window [lo, hi) by dividing out each prime <= sqrt(hi) with its
+multiplicity, and iter_multiplicative_segments walks a range window by window.
+
+The point lookups (euler_phi, mobius, divisor_count, divisor_sum) answer from
+a cached table below TABLE_LOOKUP_LIMIT and fall back to factor_frequencies
+beyond it.
+
+Public API:
+  - multiplicative_tables(limit: int, functions=...) -> Dict[str, np.ndarray]
+  - multiplicative_segment(lo: int, hi: int, functions=...) -> Dict[str, np.ndarray]
+  - iter_multiplicative_segments(lo: int, hi: int, ...) -> Iterator[Tuple[int, Dict]]
+  - euler_phi(n: int) -> int
+  - mobius(n: int) -> int
+  - divisor_count(n: int) -> int
+  - divisor_sum(n: int) -> int
+"""
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Tuple
+
+from pv_sdk import instrumentation, tuning
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Function names accepted by the table builders, with their table dtypes
+MULTIPLICATIVE_FUNCTIONS = ("phi", "mu", "tau", "sigma")
+_DTYPES = {"phi": "int64", "mu": "int8", "tau": "int32", "sigma": "int64"}
+
+# Point lookups below this bound are answered from a cached sieve table
+TABLE_LOOKUP_LIMIT = 1 << 20
+
+
+def _check_functions(functions: Iterable[str]) -> Tuple[str, ...]:
+    functions = tuple(functions)
+    unknown = set(functions) - set(MULTIPLICATIVE_FUNCTIONS)
+    if unknown:
+        raise ValueError(
+            f"unknown functions {sorted(unknown)}; "
+            f"choose from {MULTIPLICATIVE_FUNCTIONS}"
+        )
+    return functions
+
+
+def _smallest_prime_factor_table(limit: int, dtype) -> "np.ndarray":
+    """Table t with t[k] = smallest prime factor of k for 2 <= k <= limit."""
+    import numpy as np
+
+    from pv_sdk.prime import _sieve_primes
+
+    spf = np.zeros(limit + 1, dtype=dtype)
+    for p in _sieve_primes(math.isqrt(limit)).tolist():
+        multiples = spf[p * p :: p]
+        multiples[multiples == 0] = p
+    unset = np.flatnonzero(spf == 0)
+    spf[unset] = unset
+    return spf
+
+
+def multiplicative_tables(
+    limit: int, functions: Iterable[str] = MULTIPLICATIVE_FUNCTIONS
+) -> Dict[str, "np.ndarray"]:
+    """
+    Compute multiplicative-function tables for 0 <= n <= limit.
+
+    Args:
+        limit: Largest n in the tables.
+        functions: Any of "phi", "mu", "tau", "sigma"; leaving out unused
+            functions saves their memory.
+
+    Returns:
+        Dict[str, np.ndarray]: One array of length limit + 1 per function,
+        indexed by n. Entries at n = 0 are 0.
+    """
+    import numpy as np
+
+    functions = _check_functions(functions)
+    limit = max(limit, 1)
+    index_dtype = np.int32 if limit < 1 << 31 else np.int64
+    tables = {name: np.zeros(limit + 1, dtype=_DTYPES[name]) for name in functions}
+    for table in tables.values():
+        table[1] = 1
+
+    with instrumentation.timer("arithmetic.multiplicative_tables"):
+        spf = _smallest_prime_factor_table(limit, index_dtype)
+        # n = p^e * rest with p = spf[n] and gcd(p, rest) = 1
+        rest = np.zeros(limit + 1, dtype=index_dtype)
+        exponent = np.zeros(limit + 1, dtype=np.int8)
+        rest[1] = 1
+        lo = 2
+        while lo <= limit:
+            hi = min(2 * lo, limit + 1)
+            p = spf[lo:hi].astype(np.int64)
+            q = np.arange(lo, hi, dtype=np.int64) // p
+            same = spf[q] == p
+            r = np.where(same, rest[q], q)
+            e = np.where(same, exponent[q] + 1, 1).astype(np.int8)
+            rest[lo:hi] = r
+            exponent[lo:hi] = e
+            pk = p**e
+            if "phi" in tables:
+                tables["phi"][lo:hi] = tables["phi"][r] * (pk - pk // p)
+            if "mu" in tables:
+                tables["mu"][lo:hi] = np.where(e == 1, -tables["mu"][r], 0)
+            if "tau" in tables:
+                tables["tau"][lo:hi] = tables["tau"][r] * (e + 1)
+            if "sigma" in tables:
+                tables["sigma"][lo:hi] = tables["sigma"][r] * ((pk * p - 1) // (p - 1))
+            lo = hi
+    instrumentation.incr("arithmetic.table_entries", limit + 1)
+    return tables
+
+
+def multiplicative_segment(
+    lo: int,
+    hi: int,
+    functions: Iterable[str] = MULTIPLICATIVE_FUNCTIONS,
+    base_primes: Optional["np.ndarray"] = None,
+) -> Dict[str, "np.ndarray"]:
+    """
+    Compute multiplicative-function tables for the window [lo, hi).
+
+    Every prime p <= sqrt(hi) is divided out of its multiples with its full
+    multiplicity; what is left above 1 is a single prime larger than sqrt(hi).
+
+    Args:
+        lo: Inclusive start (at least 1).
+        hi: Exclusive end.
+        functions: Any of "phi", "mu", "tau", "sigma".
+        base_primes: Primes up to at least isqrt(hi - 1); computed on demand
+            when omitted.
+
+    Returns:
+        Dict[str, np.ndarray]: One array of length hi - lo per function,
+        where index i holds f(lo + i).
+    """
+    import numpy as np
+
+    from pv_sdk.prime import _sieve_primes
+
+    functions = _check_functions(functions)
+    lo = max(lo, 1)
+    size = max(hi - lo, 0)
+    tables = {name: np.ones(size, dtype=_DTYPES[name]) for name in functions}
+    if size == 0:
+        return tables
+    phi, mu = tables.get("phi"), tables.get("mu")
+    tau, sigma = tables.get("tau"), tables.get("sigma")
+    remaining = np.arange(lo, hi, dtype=np.int64)
+    root = math.isqrt(hi - 1)
+    if base_primes is None:
+        base_primes = _sieve_primes(root)
+
+    for p in base_primes.tolist():
+        if p > root:
+            break
+        multiples = slice(-lo % p, None, p)
+        remaining[multiples] //= p
+        if phi is not None:
+            phi[multiples] *= p - 1
+        if mu is not None:
+            mu[multiples] *= -1
+        if tau is not None:
+            tau[multiples] *= 2
+        if sigma is not None:
+            sigma[multiples] *= p + 1
+        # Multiples of p^k: replace f(p^(k-1)) by f(p^k) in the product
+        pk, k, sigma_pk = p * p, 2, p + 1
+        while pk < hi:
+            multiples = slice(-lo % pk, None, pk)
+            remaining[multiples] //= p
+            if phi is not None:
+                phi[multiples] *= p
+            if mu is not None:
+                mu[multiples] = 0
+            if tau is not None:
+                tau[multiples] = tau[multiples] // k * (k + 1)
+            if sigma is not None:
+                sigma[multiples] = sigma[multiples] // sigma_pk * (sigma_pk * p + 1)
+            pk, k, sigma_pk = pk * p, k + 1, sigma_pk * p + 1
+
+    large = remaining > 1
+    q = remaining[large]
+    if phi is not None:
+        phi[large] *= q - 1
+    if mu is not None:
+        mu[large] *= -1
+    if tau is not None:
+        tau[large] *= 2
+    if sigma is not None:
+        sigma[large] *= q + 1
+    instrumentation.incr("arithmetic.segments_sieved")
+    return tables
+
+
+def iter_multiplicative_segments(
+    lo: int,
+    hi: int,
+    segment_size: Optional[int] = None,
+    functions: Iterable[str] = MULTIPLICATIVE_FUNCTIONS,
+) -> Iterator[Tuple[int, Dict[str, "np.ndarray"]]]:
+    """
+    Walk [lo, hi) window by window, keeping one window in memory at a time.
+
+    Args:
+        lo: Inclusive start (at least 1).
+        hi: Exclusive end.
+        segment_size: Integers per window (default: the tuned
+            sieve_segment_size).
+        functions: Any of "phi", "mu", "tau", "sigma".
+
+    Yields:
+        Tuple[int, Dict[str, np.ndarray]]: The window start and its tables
+        (see multiplicative_segment).
+    """
+    from pv_sdk.prime import _sieve_primes
+
+    functions = _check_functions(functions)
+    segment_size = tuning.get("sieve_segment_size", segment_size)
+    lo = max(lo, 1)
+    if hi <= lo:
+        return
+    base_primes = _sieve_primes(math.isqrt(hi - 1))
+    for start in range(lo, hi, segment_size):
+        end = min(start + segment_size, hi)
+        yield start, multiplicative_segment(start, end, functions, base_primes)
+
+
+@lru_cache(maxsize=1)
+def _lookup_tables() -> Dict[str, "np.ndarray"]:
+    return multiplicative_tables(TABLE_LOOKUP_LIMIT - 1)
+
+
+def _lookup(name: str, n: int) -> Optional[int]:
+    if n < 1:
+        raise ValueError(f"{name} is only defined for positive integers, got {n}")
+    if n < TABLE_LOOKUP_LIMIT:
+        return int(_lookup_tables()[name][n])
+    instrumentation.incr("arithmetic.factoring_fallbacks")
+    return None
+
+
+def _frequencies(n: int) -> Dict[int, int]:
+    from pv_sdk.factoring import factor_frequencies
+
+    return factor_frequencies(n)
+
+
+def euler_phi(n: int) -> int:
+    """
+    Euler's totient: how many 1 <= k <= n are coprime to n.
+
+    Args:
+        n: Positive integer.
+
+    Returns:
+        int: phi(n).
+    """
+    value = _lookup("phi", n)
+    if value is None:
+        value = 1
+        for p, e in _frequencies(n).items():
+            value *= (p - 1) * p ** (e - 1)
+    return value
+
+
+def mobius(n: int) -> int:
+    """
+    The Moebius function: 0 if n has a squared prime factor, otherwise
+    (-1)^k for k distinct prime factors.
+
+    Args:
+        n: Positive integer.
+
+    Returns:
+        int: mu(n).
+    """
+    value = _lookup("mu", n)
+    if value is None:
+        freqs = _frequencies(n)
+        value = 0 if any(e > 1 for e in freqs.values()) else (-1) ** len(freqs)
+    return value
+
+
+def divisor_count(n: int) -> int:
+    """
+    The number of positive divisors of n.
+
+    Args:
+        n: Positive integer.
+
+    Returns:
+        int: tau(n).
+    """
+    value = _lookup("tau", n)
+    if value is None:
+        value = math.prod(e + 1 for e in _frequencies(n).values())
+    return value
+
+
+def divisor_sum(n: int) -> int:
+    """
+    The sum of the positive divisors of n.
+
+    Args:
+        n: Positive integer.
+
+    Returns:
+        int: sigma(n).
+    """
+    value = _lookup("sigma", n)
+    if value is None:
+        value = math.prod(
+            (p ** (e + 1) - 1) // (p - 1) for p, e in _frequencies(n).items()
+        )
+    return value
@@ -0,0 +1,446 @@
+"""
+Non-interactive, batch-oriented command-line interface for PrimeVox SDK.
+
+Every subcommand streams: inputs are read lazily from files or stdin and
+results are written to stdout segment by segment, so the commands can be
+driven from job schedulers and pipelines on inputs far larger than memory.
+
+Subcommands:
+  - sieve   --hi N [--lo M]       primes in [lo, hi]
+  - twins   --hi N [--lo M]       twin-prime pairs (p, p + 2) with p in [lo, hi]
+  - gaps    --hi N [--lo M]       consecutive prime gaps in [lo, hi]
+  - factor  [FILE ...]            factor one integer per input line
+  - export  --hi N --output PATH  binary export of primes, twins and gap stats
+  - serve   [--socket PATH | --port N]  run the local factorization service
+  - job     init|work|status|merge DIR  resumable sieve job in a shared
+            directory (see pv_sdk.sieve_jobs)
+  - calibrate [--quick] [--output PATH]  benchmark this host and save a
+            tuning profile (see pv_sdk.tuning)
+
+Engine options shared by all subcommands:
+  --workers N      process-pool size (default: the tuning profile's, else 1,
+                   i.e. run in-process)
+  --chunk-size N   integers per sieve segment (default: tuned) / input lines
+                   per factor task
+  --cache-dir DIR  directory for cached base-prime tables
+"""
+import argparse
+import csv
+import fileinput
+import itertools
+import json
+import math
+import os
+import sys
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pv_sdk import tuning
+from pv_sdk.factoring import BATCH_TRIAL_DIVISION_BOUND, SPF_TABLE_LIMIT, factor_many
+from pv_sdk.prime import _segment_primes, _sieve_primes
+from pv_sdk.shared_tables import SharedPrimeTables, publish_prime_tables
+from pv_sdk.twin_primes import twin_primes_in_segment
+
+DEFAULT_FACTOR_CHUNK_SIZE = 1024
+
+# How many tasks may be queued per worker before the reader blocks
+_TASKS_IN_FLIGHT_PER_WORKER = 4
+
+
+# —— Engine helpers ——
+def _base_primes(root: int, cache_dir: Optional[str]):
+    """Return primes <= root, reusing a cached ``.npy`` table when possible."""
+    if cache_dir is None:
+        return _sieve_primes(root)
+
+    import numpy as np
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for name in sorted(os.listdir(cache_dir)):
+        if name.startswith("base_primes_") and name.endswith(".npy"):
+            cached_root = int(name[len("base_primes_") : -len(".npy")])
+            if cached_root >= root:
+                table = np.load(os.path.join(cache_dir, name), mmap_mode="r")
+                return table[: np.searchsorted(table, root, side="right")]
+    table = _sieve_primes(root)
+    np.save(os.path.join(cache_dir, f"base_primes_{root}.npy"), table)
+    return table
+
+
+def _segments(lo: int, hi: int, size: int) -> Iterator[Tuple[int, int]]:
+    """Split the inclusive range [lo, hi] into half-open [a, b) segments."""
+    for start in range(lo, hi + 1, size):
+        yield start, min(start + size, hi + 1)
+
+
+def _batched(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+@contextmanager
+def _executor(workers: int):
+    """Yield an ordered ``map(func, iterable)`` that is pooled when workers > 1."""
+    if workers <= 1:
+        yield map
+        return
+    with Pool(workers) as pool:
+
+        def bounded_imap(func, iterable):
+            # Feed the pool in bounded batches so huge inputs are not queued
+            # all at once (Pool.imap would drain the iterator eagerly).
+            for batch in _batched(iterable, workers * _TASKS_IN_FLIGHT_PER_WORKER):
+                yield from pool.imap(func, batch)
+
+        yield bounded_imap
+
+
+# —— Worker tasks (module level so they can be pickled) ——
+def _sieve_task(args):
+    lo, hi, tables = args
+    return _segment_primes(lo, hi, tables["primes"])
+
+
+def _twins_task(args):
+    lo, hi, tables = args
+    return twin_primes_in_segment(lo, hi, tables)
+
+
+def _factor_task(args):
+    numbers, tables = args
+    return list(zip(numbers, factor_many(numbers, tables=tables)))
+
+
+@contextmanager
+def _segment_tables(args, pad: int = 0):
+    """
+    Yield the base-prime tables for the segment tasks of args.
+
+    With a process pool the base primes are published once in shared memory
+    (see pv_sdk.shared_tables), so each task pickles a small handle instead
+    of the whole array; the block is unlinked on exit, after the pool. In
+    process, a plain dict is used.
+    """
+    root = math.isqrt(args.hi + pad)
+    tables = {"primes": _base_primes(root, args.cache_dir)}
+    if args.workers <= 1:
+        yield tables
+        return
+    with SharedPrimeTables(tables, root) as shared:
+        yield shared
+
+
+def _factor_tables(workers: int):
+    """Shared small-prime and smallest-prime-factor tables for factor tasks."""
+    if workers <= 1:
+        return nullcontext()
+    return publish_prime_tables(BATCH_TRIAL_DIVISION_BOUND, SPF_TABLE_LIMIT)
+
+
+def _segment_tasks(args, tables):
+    size = tuning.get("sieve_segment_size", args.chunk_size)
+    for lo, hi in _segments(args.lo, args.hi, size):
+        yield lo, hi, tables
+
+
+# —— Output ——
+class _Writer:
+    """Write records to stdout as NDJSON, CSV or raw little-endian uint64."""
+
+    def __init__(self, fmt: str, fields: List[str], stream=None):
+        self.fmt = fmt
+        self.fields = fields
+        self.stream = stream or sys.stdout
+        if fmt == "csv":
+            self._csv = csv.writer(self.stream, lineterminator="\n")
+            self._csv.writerow(fields)
+
+    def rows(self, rows: Iterable[tuple]):
+        if self.fmt == "ndjson":
+            for row in rows:
+                self.stream.write(json.dumps(dict(zip(self.fields, row))) + "\n")
+        else:
+            self._csv.writerows(rows)
+
+    def columns(self, *columns):
+        """Write NumPy columns; binary output interleaves them as uint64."""
+        if self.fmt == "binary":
+            import numpy as np
+
+            table = np.column_stack(columns).astype("<u8")
+            self.stream.buffer.write(table.tobytes())
+            self.stream.buffer.flush()
+        else:
+            self.rows(zip(*(column.tolist() for column in columns)))
+
+
+# —— Subcommands ——
+def _cmd_sieve(args):
+    from pv_sdk.prime import prime_to_vowel
+
+    writer = _Writer(args.format, ["prime", "vowel"])
+    with _segment_tables(args) as tables, _executor(args.workers) as run:
+        for primes in run(_sieve_task, _segment_tasks(args, tables)):
+            if args.format == "binary":
+                writer.columns(primes)
+            else:
+                writer.rows((p, prime_to_vowel(p)) for p in primes.tolist())
+
+
+def _cmd_twins(args):
+    writer = _Writer(args.format, ["p1", "p2"])
+    with _segment_tables(args, pad=2) as tables, _executor(args.workers) as run:
+        for firsts in run(_twins_task, _segment_tasks(args, tables)):
+            writer.columns(firsts, firsts + 2)
+
+
+def _cmd_gaps(args):
+    import numpy as np
+
+    writer = _Writer(args.format, ["p1", "p2", "gap"])
+    previous = None
+    with _segment_tables(args) as tables, _executor(args.workers) as run:
+        for primes in run(_sieve_task, _segment_tasks(args, tables)):
+            if previous is not None:
+                primes = np.concatenate(([previous], primes))
+            if len(primes) == 0:
+                continue
+            previous = primes[-1]
+            writer.columns(primes[:-1], primes[1:], np.diff(primes))
+
+
+def _read_integers(paths: List[str]) -> Iterator[int]:
+    with fileinput.input(files=paths or ("-",)) as lines:
+        for line in lines:
+            text = line.strip()
+            if not text or text.startswith("#"):
+                continue
+            try:
+                yield int(text)
+            except ValueError:
+                raise SystemExit(
+                    f"pvsdk factor: {fileinput.filename()}:{fileinput.filelineno()}: "
+                    f"not an integer: {text!r}"
+                )
+
+
+def _cmd_factor(args):
+    if args.format == "binary":
+        raise SystemExit("pvsdk factor: binary output is not supported.")
+    writer = _Writer(args.format, ["n", "factors"])
+    chunks = _batched(
+        _read_integers(args.inputs), args.chunk_size or DEFAULT_FACTOR_CHUNK_SIZE
+    )
+    with _factor_tables(args.workers) as tables, _executor(args.workers) as run:
+        for results in run(_factor_task, ((chunk, tables) for chunk in chunks)):
+            if args.format == "ndjson":
+                writer.rows((n, {str(p): e for p, e in f.items()}) for n, f in results)
+            else:
+                writer.rows(
+                    (n, " ".join(f"{p}^{e}" for p, e in sorted(f.items())))
+                    for n, f in results
+                )
+
+
+def _cmd_export(args):
+    import numpy as np
+
+    from pv_sdk.documentation import save_to_binary
+
+    with _segment_tables(args) as tables, _executor(args.workers) as run:
+        primes = np.concatenate(
+            [np.empty(0, dtype=np.int64)]
+            + list(run(_sieve_task, _segment_tasks(args, tables)))
+        )
+    gaps = np.diff(primes)
+    twins = primes[:-1][gaps == 2]
+    content = {
+        "lo": args.lo,
+        "hi": args.hi,
+        "prime_count": int(len(primes)),
+        "twin_prime_count": int(len(twins)),
+        "max_gap": int(gaps.max()) if len(gaps) else 0,
+        "primes": primes,
+        "twin_primes": np.column_stack((twins, twins + 2)),
+    }
+    # stdout carries only data; the save confirmation is a diagnostic
+    with redirect_stdout(sys.stderr):
+        save_to_binary(args.output, content)
+
+
+def _cmd_serve(args):
+    from pv_sdk.service import serve
+
+    serve(
+        socket_path=args.socket,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        batch_window=args.batch_window_ms / 1000.0,
+        max_batch=args.max_batch,
+        cache_size=args.cache_size,
+    )
+
+
+def _cmd_job(args):
+    from pv_sdk import sieve_jobs
+
+    if args.action == "init":
+        if args.hi is None:
+            raise SystemExit("pvsdk job init: --hi is required.")
+        result = sieve_jobs.create_job(
+            args.job_dir,
+            args.lo,
+            args.hi + 1,
+            args.chunk_size or sieve_jobs.DEFAULT_JOB_SEGMENT_SIZE,
+        )
+    elif args.action == "work":
+        stale_after = args.stale_after or sieve_jobs.JOB_STALE_SECONDS
+        sieve_jobs.run_workers(args.job_dir, args.workers, stale_after)
+        result = sieve_jobs.job_status(args.job_dir)
+    elif args.action == "status":
+        result = sieve_jobs.job_status(args.job_dir)
+    else:
+        try:
+            result = sieve_jobs.merge_job(args.job_dir)
+        except RuntimeError as error:
+            raise SystemExit(f"pvsdk job merge: {error}")
+    print(json.dumps(result))
+
+
+def _cmd_calibrate(args):
+    profile = tuning.calibrate(quick=args.quick)
+    if not args.dry_run:
+        profile["path"] = tuning.save_profile(
+            profile["settings"], args.output, profile["measurements"]
+        )
+    print(json.dumps(profile, indent=2))
+
+
+# —— Argument parsing ——
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``pvsdk`` argument parser."""
+    engine = argparse.ArgumentParser(add_help=False)
+    engine.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process-pool size (default: from the tuning profile, else 1).",
+    )
+    engine.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Integers per sieve segment, or input lines per factor task.",
+    )
+    engine.add_argument(
+        "--cache-dir", default=None, help="Directory for cached base-prime tables."
+    )
+
+    def add_range(subparser, formats=("ndjson", "csv", "binary")):
+        subparser.add_argument("--lo", type=int, default=2, help="Inclusive start.")
+        subparser.add_argument("--hi", type=int, required=True, help="Inclusive end.")
+        subparser.add_argument("--format", choices=formats, default="ndjson")
+
+    parser = argparse.ArgumentParser(
+        prog="pvsdk", description="Batch-oriented PrimeVox SDK command line."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sieve = commands.add_parser("sieve", parents=[engine], help="List primes.")
+    add_range(sieve)
+    sieve.set_defaults(handler=_cmd_sieve)
+
+    twins = commands.add_parser("twins", parents=[engine], help="List twin primes.")
+    add_range(twins)
+    twins.set_defaults(handler=_cmd_twins)
+
+    gaps = commands.add_parser("gaps", parents=[engine], help="List prime gaps.")
+    add_range(gaps)
+    gaps.set_defaults(handler=_cmd_gaps)
+
+    factor = commands.add_parser(
+        "factor", parents=[engine], help="Factor one integer per input line."
+    )
+    factor.add_argument("inputs", nargs="*", help="Input files (default: stdin).")
+    factor.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    factor.set_defaults(handler=_cmd_factor)
+
+    export = commands.add_parser(
+        "export", parents=[engine], help="Export primes and twins to a binary file."
+    )
+    export.add_argument("--lo", type=int, default=2, help="Inclusive start.")
+    export.add_argument("--hi", type=int, required=True, help="Inclusive end.")
+    export.add_argument("--output", required=True, help="Binary output path.")
+    export.set_defaults(handler=_cmd_export)
+
+    server = commands.add_parser(
+        "serve", help="Run the local factorization service (see pv_sdk.service)."
+    )
+    server.add_argument("--socket", help="Unix socket path (default: TCP).")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=0, help="0 picks a free port.")
+    server.add_argument(
+        "--workers", type=int, default=None, help="Pool size (default: tuned workers)."
+    )
+    server.add_argument("--batch-window-ms", type=float, default=2.0)
+    server.add_argument("--max-batch", type=int, default=256)
+    server.add_argument("--cache-size", type=int, default=65536)
+    server.set_defaults(handler=_cmd_serve, chunk_size=None)
+
+    job = commands.add_parser(
+        "job",
+        parents=[engine],
+        help="Resumable sieve job coordinated through a shared directory.",
+    )
+    job.add_argument("action", choices=("init", "work", "status", "merge"))
+    job.add_argument("job_dir", help="Job directory shared by all workers.")
+    job.add_argument("--lo", type=int, default=2, help="Inclusive start (init).")
+    job.add_argument("--hi", type=int, default=None, help="Inclusive end (init).")
+    job.add_argument(
+        "--stale-after",
+        type=float,
+        default=None,
+        help="Seconds before another worker's unfinished claim is taken over.",
+    )
+    job.set_defaults(handler=_cmd_job)
+
+    calibrate = commands.add_parser(
+        "calibrate", help="Benchmark this host and save a tuning profile."
+    )
+    calibrate.add_argument(
+        "--output", default=None, help="Profile path (default: see pv_sdk.tuning)."
+    )
+    calibrate.add_argument(
+        "--quick", action="store_true", help="Smaller, less precise benchmarks."
+    )
+    calibrate.add_argument(
+        "--dry-run", action="store_true", help="Print the profile without saving it."
+    )
+    calibrate.set_defaults(handler=_cmd_calibrate, workers=None, chunk_size=None)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point of the ``pvsdk`` console script."""
+    args = build_parser().parse_args(argv)
+    if args.workers is None and args.command not in ("serve", "calibrate"):
+        args.workers = tuning.get("workers")
+    if args.workers is not None and args.workers < 1:
+        raise SystemExit("pvsdk: --workers must be at least 1.")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        raise SystemExit("pvsdk: --chunk-size must be at least 1.")
+    if hasattr(args, "hi"):
+        args.lo = max(args.lo, 2)
+    try:
+        args.handler(args)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. ``head``) closed the pipe early
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
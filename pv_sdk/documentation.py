@@ -3,6 +3,12 @@ import json
 import os
 from datetime import datetime
 
+from pv_sdk import instrumentation
+
+# Array payloads are aligned so every member can be memory-mapped directly
+BINARY_ALIGNMENT = 64
+BINARY_FORMAT_VERSION = 1
+
 
 def save_to_text(filename: str, content: str):
     """
@@ -46,6 +52,150 @@ def save_to_csv(filename: str, headers: list, rows: list):
     print(f"[✅] Data clearly saved to CSV file: {filename}")
 
 
+def _compact_int_array(value):
+    """
+    Convert an integer sequence to the smallest NumPy dtype that holds it.
+
+    Returns None when value is not an integer NumPy array or a non-empty
+    rectangular integer sequence that fits in 64 bits, in which case it is
+    kept as JSON metadata. Empty integer arrays keep their dtype and shape.
+    """
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        array = value
+        if array.size == 0 and array.dtype.kind in "iu":
+            return np.ascontiguousarray(array)
+    elif isinstance(value, (list, tuple)) and value:
+        try:
+            array = np.asarray(value)
+        except (ValueError, OverflowError):
+            return None
+    else:
+        return None
+    if array.size == 0 or array.dtype.kind not in "iu":
+        return None
+    low, high = array.min(), array.max()
+    dtype = np.result_type(np.min_scalar_type(low), np.min_scalar_type(high))
+    if dtype.kind not in "iu":
+        # Negatives mixed with values >= 2**32 promote to float64; the
+        # array's own 64-bit integer dtype is the smallest exact one then
+        dtype = array.dtype
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
+def save_to_binary(filename: str, content: dict):
+    """
+    Save result data as a compact, memory-mappable binary file plus JSON sidecar.
+
+    Integer lists/arrays (e.g. prime lists, twin-prime pairs) are stored as
+    raw arrays in the smallest fitting dtype, and int -> int dicts (e.g.
+    modular results) as a pair of key/value arrays. Everything else goes to
+    the small ``<filename>.json`` sidecar, which also records each array's
+    dtype, shape and byte offset.
+
+    Args:
+        filename (str): Binary data file clearly named (e.g. "results.pvb").
+        content (dict): Dictionary data clearly structured for saving.
+    """
+    import numpy as np
+
+    layout, metadata, arrays = {}, {}, []
+    offset = 0
+
+    def add_array(array):
+        nonlocal offset
+        offset += -offset % BINARY_ALIGNMENT
+        entry = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        arrays.append((offset, array))
+        offset += array.nbytes
+        return entry
+
+    for key, value in content.items():
+        if isinstance(value, dict) and value:
+            keys = _compact_int_array(list(value.keys()))
+            values = _compact_int_array(list(value.values()))
+            if keys is not None and values is not None:
+                layout[key] = {
+                    "kind": "mapping",
+                    "keys": add_array(keys),
+                    "values": add_array(values),
+                }
+                continue
+        array = _compact_int_array(value)
+        if array is not None:
+            layout[key] = {"kind": "array", **add_array(array)}
+        elif isinstance(value, np.ndarray):
+            metadata[key] = value.tolist()
+        else:
+            metadata[key] = value
+
+    with open(filename, "wb") as file:
+        for position, array in arrays:
+            file.write(b"\0" * (position - file.tell()))
+            file.write(array.tobytes())
+        instrumentation.incr("documentation.bytes_written", file.tell())
+
+    sidecar = {
+        "format_version": BINARY_FORMAT_VERSION,
+        "arrays": layout,
+        "metadata": metadata,
+    }
+    with open(f"{filename}.json", "w", encoding="utf-8") as file:
+        json.dump(sidecar, file)
+    print(f"[✅] Data clearly saved to binary file: {filename}")
+
+
+def load_from_binary(filename: str, mmap: bool = True) -> dict:
+    """
+    Load data written by save_to_binary.
+
+    Args:
+        filename (str): Binary data file clearly named.
+        mmap (bool): Memory-map arrays (read-only) instead of reading them.
+
+    Returns:
+        dict: Arrays as NumPy arrays, mappings as {"keys": ..., "values": ...}
+              array pairs, and metadata values as stored.
+    """
+    import numpy as np
+
+    with open(f"{filename}.json", "r", encoding="utf-8") as file:
+        sidecar = json.load(file)
+    if sidecar.get("format_version") != BINARY_FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary format in {filename}.")
+
+    def read_array(entry):
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        count = int(np.prod(shape))
+        if count == 0:
+            # Zero-length regions cannot be memory-mapped
+            return np.empty(shape, dtype=dtype)
+        if mmap:
+            return np.memmap(
+                filename, dtype=dtype, mode="r", offset=entry["offset"], shape=shape
+            )
+        with open(filename, "rb") as file:
+            file.seek(entry["offset"])
+            return np.fromfile(file, dtype=dtype, count=count).reshape(shape)
+
+    content = dict(sidecar["metadata"])
+    for key, entry in sidecar["arrays"].items():
+        if entry["kind"] == "mapping":
+            content[key] = {
+                "keys": read_array(entry["keys"]),
+                "values": read_array(entry["values"]),
+            }
+        else:
+            content[key] = read_array(entry)
+    return content
+
+
 def append_timestamp(filename: str) -> str:
     """
     Append a clear, unique timestamp to filename to prevent overwriting.
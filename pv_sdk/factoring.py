@@ -5,19 +5,93 @@ This module provides functions to factor large composites (up to ~40 digits)
 using Pollard's Rho with Brent's cycle detection, plus a deterministic Miller-Rabin
 primality test for 64-bit numbers.
 
+Composites that survive trial division are first checked for being perfect
+powers (a quadratic-residue filtered square test, then Newton k-th roots)
+and otherwise split by a strategy: a list of stages (Pollard p-1, Williams
+p+1, the quadratic sieve in pv_sdk.siqs, Pollard-Brent rho) tried in order
+of their expected cost for n. factor_with_methods reports which
+stage found each factor.
+
+For large input sets, factor_many strips small prime factors from a whole
+batch at once with a product/remainder tree (Bernstein-style batch trial
+division) and only sends the remaining cofactors to the strategy.
+factor_range factors a whole contiguous interval with a segmented sieve
+and never calls the strategy at all.
+
 Public API:
   - prime_to_vowel_notation(prime: int) -> str
   - factor(n: int) -> List[int]
   - factor_frequencies(n: int) -> Dict[int, int]
+  - factor_with_methods(n: int) -> List[Tuple[int, str]]
+  - make_strategy(...) -> List[FactoringStage]
   - factor_and_map(n: int) -> List[str]
+  - batch_trial_division(numbers: List[int]) -> List[Tuple[Dict[int, int], int]]
+  - factor_many(numbers: List[int]) -> List[Dict[int, int]]
+  - factor_range(lo: int, hi: int, ...) -> Iterator[Tuple[int, List[Dict[int, int]]]]
 """
 import logging
 import math
 import random
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pv_sdk import instrumentation, tuning
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Primes up to this bound are stripped by the batch trial-division stage
+BATCH_TRIAL_DIVISION_BOUND = 1 << 16
+
+# Inputs per product tree; bounds the size of the big-integer products
+BATCH_SIZE = 2048
+
+# Radicals up to this size are split with a smallest-prime-factor table
+SPF_TABLE_LIMIT = 1 << 20
+
+# Default smoothness bounds for the Pollard p-1 and Williams p+1 stages
+PM1_B1 = 10_000
+PM1_B2 = 100_000
+PP1_B1 = 5_000
+# Seeds whose discriminants v^2 - 4 (5, 12, 32) test independent residue
+# characters, so each extra seed halves the chance of a p+1 miss
+PP1_SEEDS = (3, 4, 6)
+
+# Iteration budget of the short rho pass tried before the p-1 / p+1 stages;
+# most cofactors of random inputs have a factor it finds straight away
+RHO_QUICK_ITERATIONS = 1 << 12
+
+# Primes below 100; _is_prime tries the first trial_division_primes of them
+_TRIAL_DIVISION_PRIMES = tuple(
+    p for p in range(2, 100) if all(p % d for d in range(2, math.isqrt(p) + 1))
+)
+
+# The tuned prefix of _TRIAL_DIVISION_PRIMES (None: resolve on next use)
+_trial_division_primes: Optional[Tuple[int, ...]] = None
+
+# Primes handled by the plain trial-division loop in factor()
+TRIAL_DIVISION_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29)
+
+# Quadratic residues modulo a few small moduli. A square is a residue of
+# each; together they reject all but ~0.3% of non-squares before isqrt.
+_SQUARE_FILTERS = tuple(
+    (m, frozenset(x * x % m for x in range(m))) for m in (64, 63, 65, 11)
+)
+
 _digit_to_vowel: Dict[str, str] = {
     "1": "A",  # primes ending in 1 → A
     "3": "E",  # primes ending in 3 → E
@@ -44,16 +118,18 @@ def prime_to_vowel_notation(prime: int) -> str:
     return "".join(_digit_to_vowel.get(d, d) for d in str(prime))
 
 
-def _pollards_rho_brent(n: int, max_iter: int = 100_000) -> Optional[int]:
+def _pollards_rho_brent(n: int, max_iter: Optional[int] = None) -> Optional[int]:
     """
     Pollard's Rho algorithm with Brent's cycle detection to find a nontrivial factor.
 
     Args:
         n: Composite integer to factor.
-        max_iter: Maximum cycle iterations before giving up.
+        max_iter: Maximum cycle iterations before giving up (default: the
+            tuned rho_max_iter).
     Returns:
         A nontrivial factor of n, or None if it fails.
     """
+    max_iter = tuning.get("rho_max_iter", max_iter)
     if n % 2 == 0:
         return 2
     y = random.randrange(1, n)
@@ -61,29 +137,59 @@ def _pollards_rho_brent(n: int, max_iter: int = 100_000) -> Optional[int]:
     m = random.randrange(1, n)
     g = r = q = 1
     x = y
+    # Tallied locally and reported once so the inner loops stay untouched
+    iterations = gcd_calls = 0
 
     while g == 1 and r < max_iter:
         x = y
         for _ in range(r):
             y = (y * y + c) % n
+        iterations += r
         k = 0
         while k < r and g == 1:
             ys = y
             for _ in range(min(m, r - k)):
                 y = (y * y + c) % n
                 q = (q * abs(x - y)) % n
+            iterations += min(m, r - k)
             g = math.gcd(q, n)
+            gcd_calls += 1
             k += m
         r *= 2
 
-    if g is None or g == n:
+    if g == n:
+        # Backtrack through the last batch one step at a time. A step with
+        # gcd > 1 must exist there; if it is n itself, this (x, c) pair
+        # failed and the caller retries with fresh random parameters.
         while True:
             ys = (ys * ys + c) % n  # type: ignore
             g = math.gcd(abs(x - ys), n)
-            if g and g < n:
+            iterations += 1
+            gcd_calls += 1
+            if g > 1:
                 break
 
-    return g if g and g < n else None
+    instrumentation.incr("factoring.rho_calls")
+    instrumentation.incr("factoring.rho_iterations", iterations)
+    instrumentation.incr("factoring.gcd_calls", gcd_calls)
+    return g if 1 < g < n else None
+
+
+def _resolve_trial_division_primes() -> Tuple[int, ...]:
+    global _trial_division_primes
+
+    count = tuning.get("trial_division_primes")
+    _trial_division_primes = _TRIAL_DIVISION_PRIMES[:count]
+    return _trial_division_primes
+
+
+def _reset_trial_division_primes() -> None:
+    global _trial_division_primes
+
+    _trial_division_primes = None
+
+
+tuning.on_change(_reset_trial_division_primes)
 
 
 def _is_prime(n: int) -> bool:
@@ -97,8 +203,7 @@ def _is_prime(n: int) -> bool:
     """
     if n < 2:
         return False
-    small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29)
-    for p in small_primes:
+    for p in _trial_division_primes or _resolve_trial_division_primes():
         if n == p:
             return True
         if n % p == 0:
@@ -108,6 +213,10 @@ def _is_prime(n: int) -> bool:
         d >>= 1
         s += 1
     for a in (2, 325, 9375, 28178, 450775, 9780504, 1795265022):
+        a %= n
+        if a == 0:
+            # The base is a multiple of n and says nothing about primality
+            continue
         x = pow(a, d, n)
         if x == 1 or x == n - 1:
             continue
@@ -120,26 +229,344 @@ def _is_prime(n: int) -> bool:
     return True
 
 
-def factor(n: int) -> List[int]:
+def _exact_sqrt(n: int) -> Optional[int]:
+    """Return the square root of n if n is a perfect square, else None."""
+    for m, residues in _SQUARE_FILTERS:
+        if n % m not in residues:
+            return None
+    root = math.isqrt(n)
+    return root if root * root == n else None
+
+
+def _integer_root(n: int, k: int) -> int:
+    """Return floor(n ** (1/k)) for n >= 1, using Newton's iteration."""
+    if k == 2:
+        return math.isqrt(n)
+    # Start from a power of two above the root; Newton then decreases
+    # monotonically until it reaches the floor
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+def _perfect_power(n: int, min_base: int = 2) -> Optional[Tuple[int, int]]:
     """
-    Recursively factor an integer into its prime factors.
+    Detect whether n is a perfect power b**k with k >= 2.
+
+    Only prime exponents are tried; a hit is reduced further, so e.g.
+    2**12 is found as (2, 12).
 
     Args:
-        n: Integer > 1 to factor.
+        n: Integer > 1.
+        min_base: Known lower bound on every prime factor of n, which
+            caps the exponents worth testing at log(n) / log(min_base).
     Returns:
-        A list of prime factors (unsorted).
+        (b, k) with the largest such k, or None if n is not a perfect power.
+    """
+    base, exponent = n, 1
+    while base > 1:
+        root = _exact_sqrt(base)
+        if root is not None:
+            base, exponent = root, exponent * 2
+            continue
+        max_k = int(math.log(base) / math.log(max(min_base, 2))) + 1
+        for k in range(3, max_k + 1, 2):
+            if not _is_prime(k):
+                continue
+            root = _integer_root(base, k)
+            if root**k == base:
+                base, exponent = root, exponent * k
+                break
+        else:
+            break
+    return (base, exponent) if exponent > 1 else None
+
+
+@lru_cache(maxsize=8)
+def _primes_up_to(limit: int) -> Tuple[int, ...]:
+    from pv_sdk.prime import _sieve_primes
+
+    return tuple(_sieve_primes(limit).tolist())
+
+
+@lru_cache(maxsize=8)
+def _stage1_exponent(b1: int) -> int:
+    """Product of the largest prime powers <= b1 (the stage-1 exponent)."""
+    exponent = 1
+    for p in _primes_up_to(b1):
+        # Integer powers: int(math.log(243, 3)) is 4, not 5
+        q = p
+        while q * p <= b1:
+            q *= p
+        exponent *= q
+    return exponent
+
+
+def _pollard_pm1(n: int, b1: int = PM1_B1, b2: int = PM1_B2) -> Optional[int]:
+    """
+    Pollard's p-1 method with a prime-by-prime stage 2.
+
+    Finds p | n when p - 1 is b1-smooth apart from at most one prime <= b2.
+
+    Args:
+        n: Odd composite integer.
+        b1: Stage-1 smoothness bound.
+        b2: Stage-2 bound (no stage 2 when b2 <= b1).
+    Returns:
+        A nontrivial factor of n, or None if the bounds were not enough.
+    """
+    a = pow(2, _stage1_exponent(b1), n)
+    g = math.gcd(a - 1, n)
+    if 1 < g < n:
+        return g
+    if g == n or b2 <= b1:
+        return None
+
+    # Stage 2: walk the primes q in (b1, b2] using cached a^gap steps
+    primes = [q for q in _primes_up_to(b2) if q > b1]
+    if not primes:
+        return None
+    steps: Dict[int, int] = {}
+    x = pow(a, primes[0], n)
+    accumulated = (x - 1) % n
+    previous = primes[0]
+    for i, q in enumerate(primes[1:], 1):
+        gap = q - previous
+        step = steps.get(gap)
+        if step is None:
+            step = steps[gap] = pow(a, gap, n)
+        x = x * step % n
+        accumulated = accumulated * (x - 1) % n
+        previous = q
+        if i % 256 == 0 or i == len(primes) - 1:
+            g = math.gcd(accumulated, n)
+            if g > 1:
+                return g if g < n else None
+    return None
+
+
+def _lucas_v(v: int, m: int, n: int) -> int:
+    """Return V_m(v) mod n for the Lucas sequence V_0 = 2, V_1 = v."""
+    x, y = v, (v * v - 2) % n
+    for bit in bin(m)[3:]:
+        if bit == "1":
+            x, y = (x * y - v) % n, (y * y - 2) % n
+        else:
+            x, y = (x * x - 2) % n, (x * y - v) % n
+    return x
+
+
+def _williams_pp1(
+    n: int, b1: int = PP1_B1, seeds: Tuple[int, ...] = PP1_SEEDS
+) -> Optional[int]:
+    """
+    Williams' p+1 method (stage 1 only).
+
+    Finds p | n when p + 1 (or p - 1, depending on the seed) is b1-smooth.
+    Each seed succeeds for about half of the primes, so several are tried.
+
+    Args:
+        n: Odd composite integer.
+        b1: Smoothness bound.
+        seeds: Starting values V_1 to try.
+    Returns:
+        A nontrivial factor of n, or None.
+    """
+    exponent = _stage1_exponent(b1)
+    for seed in seeds:
+        g = math.gcd(_lucas_v(seed, exponent, n) - 2, n)
+        if 1 < g < n:
+            return g
+    return None
+
+
+def _pollards_rho_until_found(n: int) -> int:
+    """Retry Pollard-Brent with fresh random parameters until n splits."""
+    while True:
+        divisor = _pollards_rho_brent(n)
+        if divisor is not None:
+            return divisor
+        instrumentation.incr("factoring.rho_retries")
+
+
+class FactoringStage(NamedTuple):
     """
+    One splitting method of a factoring strategy.
+
+    Attributes:
+        name: Method name reported by factor_with_methods.
+        split: Returns a nontrivial factor of an odd composite, or None.
+        cost: Estimated cost for a given n (roughly, in rho iterations).
+        always_succeeds: True for the final fallback (retried until it splits).
+    """
+
+    name: str
+    split: Callable[[int], Optional[int]]
+    cost: Callable[[int], float]
+    always_succeeds: bool = False
+
+
+def _siqs_split(n: int, workers: int) -> Optional[int]:
+    from pv_sdk.siqs import siqs_factor
+
+    return siqs_factor(n, workers=workers)
+
+
+def _siqs_cost(n: int, min_digits: Optional[int]) -> float:
+    digits = n.bit_length() * math.log10(2)
+    # Hard composites with at least this many digits go to the quadratic
+    # sieve; None follows the tuning profile at call time
+    if digits < tuning.get("siqs_min_digits", min_digits):
+        return math.inf
+    # Fitted to single-process runs on balanced semiprimes: ~0.2 s at 30
+    # digits, growing ~1.19x per digit (~3 s at 50, ~35 s at 60)
+    return 6e5 * 1.19 ** (digits - 30)
+
+
+def make_strategy(
+    pm1_bounds: Optional[Tuple[int, int]] = (PM1_B1, PM1_B2),
+    pp1_bound: Optional[int] = PP1_B1,
+    siqs: bool = True,
+    siqs_min_digits: Optional[int] = None,
+    siqs_workers: int = 1,
+) -> List[FactoringStage]:
+    """
+    Build a factoring strategy with configurable p-1 / p+1 / SIQS settings.
+
+    Args:
+        pm1_bounds: (B1, B2) for Pollard p-1, or None to disable it.
+        pp1_bound: B1 for Williams p+1, or None to disable it.
+        siqs: Whether to add the quadratic sieve stage.
+        siqs_min_digits: Smallest composite handed to the quadratic sieve,
+            or None for the tuned siqs_min_digits (see pv_sdk.tuning), read
+            on every call.
+        siqs_workers: Processes the quadratic sieve may use.
+    Returns:
+        The list of stages: a short rho pass, the enabled p-1 / p+1 / SIQS
+        stages and an unbounded Pollard-Brent rho fallback.
+    """
+    # Costs are in units of one rho iteration, measured on CPython for
+    # 40-128 bit n: an exponent bit via pow() ~0.57, a Lucas-chain bit ~1.3
+    # and a stage-2 prime ~1.8
+    stages = [
+        FactoringStage(
+            "pollard_rho",
+            lambda n: _pollards_rho_brent(n, RHO_QUICK_ITERATIONS),
+            lambda n: RHO_QUICK_ITERATIONS,
+        )
+    ]
+    if pm1_bounds is not None:
+        b1, b2 = pm1_bounds
+        stage2_primes = max(b2 / math.log(max(b2, 3)) - b1 / math.log(b1), 0)
+        pm1_cost = 0.57 * 1.44 * b1 + 1.8 * stage2_primes
+        stages.append(
+            FactoringStage(
+                "pollard_pm1",
+                lambda n: _pollard_pm1(n, b1, b2),
+                lambda n: pm1_cost,
+            )
+        )
+    if pp1_bound is not None:
+        pp1_cost = 1.3 * 1.44 * pp1_bound * len(PP1_SEEDS)
+        stages.append(
+            FactoringStage(
+                "williams_pp1",
+                lambda n: _williams_pp1(n, pp1_bound),
+                lambda n: pp1_cost,
+            )
+        )
+    if siqs:
+        stages.append(
+            FactoringStage(
+                "siqs",
+                lambda n: _siqs_split(n, siqs_workers),
+                lambda n: _siqs_cost(n, siqs_min_digits),
+            )
+        )
+    stages.append(
+        FactoringStage(
+            "pollard_rho",
+            _pollards_rho_until_found,
+            # Expected ~1.25 sqrt(p) iterations with p <= sqrt(n)
+            lambda n: 1.25 * 2 ** (n.bit_length() / 4),
+            always_succeeds=True,
+        )
+    )
+    return stages
+
+
+DEFAULT_STRATEGY: List[FactoringStage] = make_strategy()
+
+
+def _split(n: int, strategy: List[FactoringStage]) -> Tuple[int, str]:
+    """Split an odd composite with the cheapest stages first."""
+    for stage in sorted(strategy, key=lambda stage: stage.cost(n)):
+        with instrumentation.timer(f"factoring.{stage.name}"):
+            divisor = stage.split(n)
+        if divisor is not None:
+            instrumentation.incr(f"factoring.found_by.{stage.name}")
+            return divisor, stage.name
+        if stage.always_succeeds:
+            break
+    # Only reached when the strategy has no always-succeeding fallback
+    return _pollards_rho_until_found(n), "pollard_rho"
+
+
+def _factor_tagged(
+    n: int, strategy: List[FactoringStage], method: str
+) -> List[Tuple[int, str]]:
     if n <= 1:
         return []
-    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29):
+    for p in TRIAL_DIVISION_PRIMES:
         if n % p == 0:
-            return [p] + factor(n // p)
+            return [(p, "trial_division")] + _factor_tagged(n // p, strategy, method)
     if _is_prime(n):
-        return [n]
-    divisor = None
-    while divisor is None:
-        divisor = _pollards_rho_brent(n)
-    return factor(divisor) + factor(n // divisor)
+        return [(n, method)]
+    # Collapse prime powers before rho, which splits them poorly
+    power = _perfect_power(n, min_base=TRIAL_DIVISION_PRIMES[-1] + 1)
+    if power is not None:
+        instrumentation.incr("factoring.perfect_powers")
+        base, exponent = power
+        return _factor_tagged(base, strategy, "perfect_power") * exponent
+    divisor, found_by = _split(n, strategy)
+    return _factor_tagged(divisor, strategy, found_by) + _factor_tagged(
+        n // divisor, strategy, found_by
+    )
+
+
+def factor_with_methods(
+    n: int, strategy: Optional[List[FactoringStage]] = None
+) -> List[Tuple[int, str]]:
+    """
+    Factor n and report which method found each prime factor.
+
+    A prime is credited to the stage whose split isolated it
+    ("trial_division", "perfect_power", "pollard_pm1", "williams_pp1",
+    "siqs", "pollard_rho"), or to "primality_test" when n itself is prime.
+
+    Args:
+        n: Integer > 1 to factor.
+        strategy: Stages to use (default: DEFAULT_STRATEGY).
+    Returns:
+        A list of (prime, method) pairs (unsorted).
+    """
+    return _factor_tagged(n, strategy or DEFAULT_STRATEGY, "primality_test")
+
+
+def factor(n: int, strategy: Optional[List[FactoringStage]] = None) -> List[int]:
+    """
+    Recursively factor an integer into its prime factors.
+
+    Args:
+        n: Integer > 1 to factor.
+        strategy: Splitting stages to use (default: DEFAULT_STRATEGY).
+    Returns:
+        A list of prime factors (unsorted).
+    """
+    return [p for p, _ in factor_with_methods(n, strategy)]
 
 
 def factor_frequencies(n: int) -> Dict[int, int]:
@@ -157,6 +584,350 @@ def factor_frequencies(n: int) -> Dict[int, int]:
     return freqs
 
 
+def _product_tree(values: List[int]) -> List[List[int]]:
+    """
+    Build a product tree: level 0 holds values, each level above holds the
+    products of adjacent pairs, and the last level holds the total product.
+    """
+    tree = [values]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append(
+            [
+                level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+        )
+    return tree
+
+
+def _remainder_tree(value: int, tree: List[List[int]]) -> List[int]:
+    """Return value mod every leaf of tree, reducing from the root down."""
+    remainders = [value % tree[-1][0]]
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i >> 1] % node for i, node in enumerate(level)]
+    return remainders
+
+
+@lru_cache(maxsize=4)
+def _small_prime_tree(bound: int) -> Tuple[Tuple[int, ...], ...]:
+    """Product tree over all primes <= bound (cached per bound)."""
+    from pv_sdk.prime import _sieve_primes
+
+    tree = _product_tree(_sieve_primes(bound).tolist())
+    return tuple(tuple(level) for level in tree)
+
+
+@lru_cache(maxsize=4)
+def _small_primes_array(bound: int):
+    """All primes <= bound as an int64 NumPy array (cached per bound)."""
+    from pv_sdk.prime import _sieve_primes
+
+    return _sieve_primes(bound)
+
+
+@lru_cache(maxsize=1)
+def _smallest_prime_factors(limit: int) -> List[int]:
+    """Table t with t[k] = smallest prime factor of k, for 2 <= k <= limit."""
+    import numpy as np
+
+    spf = np.zeros(limit + 1, dtype=np.int64)
+    for p in range(2, math.isqrt(limit) + 1):
+        if spf[p] == 0:
+            multiples = spf[p * p :: p]
+            multiples[multiples == 0] = p
+    unset = np.flatnonzero(spf == 0)
+    spf[unset] = unset
+    return spf.tolist()
+
+
+def _split_radical(g: int, tree, level: int, index: int, found: List[int]):
+    """Collect the primes of the tree dividing g, descending only where needed."""
+    if level == 0:
+        found.append(tree[0][index])
+        return
+    for child in (2 * index, 2 * index + 1):
+        if child < len(tree[level - 1]) and math.gcd(g, tree[level - 1][child]) > 1:
+            _split_radical(g, tree, level - 1, child, found)
+
+
+def _table_primes(tables: Mapping[str, "np.ndarray"], bound: int) -> "np.ndarray":
+    """
+    tables["primes"], after checking that it holds every prime <= bound.
+
+    Raises:
+        ValueError: If a prime <= bound lies beyond the end of the table.
+    """
+    primes = tables["primes"]
+    # A SharedPrimeTables handle knows how far it was sieved; otherwise the
+    # table is complete up to bound iff no prime follows its last entry
+    covered = getattr(tables, "limit", None)
+    if covered is None:
+        covered = int(primes[-1]) if len(primes) else 1
+    while covered < bound:
+        covered += 1
+        if _is_prime(covered):
+            raise ValueError(
+                f'tables["primes"] must hold every prime <= {bound}; '
+                f"it is missing {covered}"
+            )
+    return primes
+
+
+def batch_trial_division(
+    numbers: Iterable[int],
+    bound: int = BATCH_TRIAL_DIVISION_BOUND,
+    batch_size: int = BATCH_SIZE,
+    tables: Optional[Mapping[str, "np.ndarray"]] = None,
+) -> List[Tuple[Dict[int, int], int]]:
+    """
+    Strip all prime factors <= bound from many integers at once.
+
+    The product P of the small primes is computed once. For each batch a
+    remainder tree yields P mod n for every n in quasi-linear total time, and
+    gcd(P mod n, n) is exactly the product of the distinct small primes
+    dividing n. Those primes are read off a smallest-prime-factor table, or
+    found with one vectorized divisibility pass (descending the small-prime
+    product tree for radicals beyond 64 bits), and divided out with their
+    full multiplicity.
+
+    Args:
+        numbers: Integers to process (values <= 1 are passed through).
+        bound: Largest prime stripped by this stage.
+        batch_size: Inputs per remainder tree.
+        tables: Prebuilt tables, e.g. a shared_tables.SharedPrimeTables
+            handle: "primes" (all primes <= bound, at least) and optionally
+            "spf" (a smallest-prime-factor table). Used instead of building
+            this process's own copies.
+    Returns:
+        A list of (small-prime frequencies, remaining cofactor) per input.
+    Raises:
+        ValueError: If tables["primes"] stops short of bound.
+    """
+    prime_tree = _small_prime_tree(bound)
+    top = len(prime_tree) - 1
+    product = prime_tree[top][0]
+    if tables is not None and "spf" in tables:
+        spf = tables["spf"]
+    else:
+        spf = _smallest_prime_factors(SPF_TABLE_LIMIT)
+    spf_limit = len(spf) - 1
+    if tables is not None:
+        shared_primes = _table_primes(tables, bound)
+        small_primes = shared_primes[: shared_primes.searchsorted(bound, "right")]
+    else:
+        small_primes = _small_primes_array(bound)
+    numbers = list(numbers)
+    results: List[Tuple[Dict[int, int], int]] = []
+
+    for start in range(0, len(numbers), batch_size):
+        batch = numbers[start : start + batch_size]
+        valid = [n if n > 1 else 1 for n in batch]
+        remainders = _remainder_tree(product, _product_tree(valid))
+        for n, remainder in zip(batch, remainders):
+            freqs: Dict[int, int] = {}
+            if n > 1:
+                g = math.gcd(remainder, n)
+                if g > 1:
+                    primes: List[int] = []
+                    if g <= spf_limit:
+                        while g > 1:
+                            p = int(spf[g])
+                            primes.append(p)
+                            g //= p
+                    elif g < 1 << 63:
+                        # One vectorized pass over the small primes
+                        primes = small_primes[g % small_primes == 0].tolist()
+                    else:
+                        _split_radical(g, prime_tree, top, 0, primes)
+                    for p in primes:
+                        exponent = 0
+                        while n % p == 0:
+                            n //= p
+                            exponent += 1
+                        freqs[p] = exponent
+            results.append((freqs, n))
+
+    instrumentation.incr("factoring.batch_trial_division_inputs", len(numbers))
+    return results
+
+
+def factor_many(
+    numbers: Iterable[int],
+    bound: int = BATCH_TRIAL_DIVISION_BOUND,
+    batch_size: int = BATCH_SIZE,
+    tables: Optional[Mapping[str, "np.ndarray"]] = None,
+) -> List[Dict[int, int]]:
+    """
+    Factor many integers, sharing the small-prime work across the batch.
+
+    Small factors come from batch_trial_division; a cofactor below bound**2
+    is then known to be prime, and only larger composite cofactors reach
+    Pollard-Brent via factor_frequencies.
+
+    Args:
+        numbers: Integers to factor.
+        bound: Largest prime stripped by the batch stage.
+        batch_size: Inputs per remainder tree.
+        tables: Prebuilt prime tables (see batch_trial_division).
+    Returns:
+        A list of prime -> exponent dicts, one per input, in input order.
+    Raises:
+        ValueError: If tables["primes"] stops short of bound.
+    """
+    results = []
+    for freqs, cofactor in batch_trial_division(numbers, bound, batch_size, tables):
+        if cofactor > 1:
+            if cofactor < bound * bound or _is_prime(cofactor):
+                freqs[cofactor] = freqs.get(cofactor, 0) + 1
+            else:
+                instrumentation.incr("factoring.batch_residual_cofactors")
+                for p, e in factor_frequencies(cofactor).items():
+                    freqs[p] = freqs.get(p, 0) + e
+        results.append(freqs)
+    return results
+
+
+class FactorRangeSegment(NamedTuple):
+    """
+    Factorizations of a run of consecutive integers, in CSR form.
+
+    The primes of lo + i are factors[indptr[i]:indptr[i + 1]] (ascending),
+    with multiplicities exponents[indptr[i]:indptr[i + 1]]. 0 and 1 have no
+    factors.
+    """
+
+    lo: int
+    indptr: "np.ndarray"
+    factors: "np.ndarray"
+    exponents: "np.ndarray"
+
+    def factors_of(self, number: int) -> Dict[int, int]:
+        """prime -> exponent dict of one number in the segment."""
+        start, stop = self.indptr[number - self.lo], self.indptr[number - self.lo + 1]
+        return dict(
+            zip(self.factors[start:stop].tolist(), self.exponents[start:stop].tolist())
+        )
+
+    def frequencies(self) -> List[Dict[int, int]]:
+        """prime -> exponent dicts of every number, as factor_frequencies gives."""
+        factors = self.factors.tolist()
+        exponents = self.exponents.tolist()
+        bounds = self.indptr.tolist()
+        return [
+            dict(zip(factors[start:stop], exponents[start:stop]))
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+
+
+def _sieve_factor_segment(lo: int, hi: int, base_primes):
+    """
+    Factor every integer in [lo, hi) by dividing out each prime <= sqrt(hi)
+    from its multiples; what is left above 1 is one prime > sqrt(hi).
+
+    Returns:
+        Per-integer factor counts, and the primes and exponents of all
+        (integer, prime) pairs, grouped by integer and ascending by prime
+        within an integer.
+    """
+    import numpy as np
+
+    remaining = np.arange(lo, hi, dtype=np.int64)
+    remaining[remaining < 2] = 1
+    rows, primes, exponents = [], [], []
+    root = math.isqrt(hi - 1)
+    for p in base_primes.tolist():
+        if p > root:
+            break
+        start = -lo % p
+        if lo + start == 0:
+            start += p  # 0 has no factorization
+        multiples = np.arange(start, hi - lo, p)
+        if not len(multiples):
+            continue
+        values = remaining[multiples] // p
+        exponent = np.ones(len(multiples), dtype=np.uint8)
+        # Only the multiples of p^2, p^3, ... go around this loop again
+        again = np.flatnonzero(values % p == 0)
+        while len(again):
+            values[again] //= p
+            exponent[again] += 1
+            again = again[values[again] % p == 0]
+        remaining[multiples] = values
+        rows.append(multiples)
+        primes.append(np.full(len(multiples), p, dtype=np.int64))
+        exponents.append(exponent)
+    large = np.flatnonzero(remaining > 1)
+    rows.append(large)
+    primes.append(remaining[large])
+    exponents.append(np.ones(len(large), dtype=np.uint8))
+
+    rows = np.concatenate(rows)
+    # Stable, so primes stay ascending within each row
+    order = np.argsort(rows, kind="stable")
+    counts = np.bincount(rows, minlength=hi - lo)
+    return counts, np.concatenate(primes)[order], np.concatenate(exponents)[order]
+
+
+def factor_range(
+    lo: int,
+    hi: int,
+    segment_size: Optional[int] = None,
+    compact: bool = False,
+    tables: Optional[Mapping[str, "np.ndarray"]] = None,
+) -> Iterator[Tuple[int, Union[List[Dict[int, int]], FactorRangeSegment]]]:
+    """
+    Factor every integer in [lo, hi), segment by segment.
+
+    Instead of one factor() call per integer, each segment is sieved once
+    with the primes <= sqrt(hi): every prime is divided out of its multiples
+    with its full multiplicity on a NumPy remainder array, and a remainder
+    above 1 is then a single prime. No primality test or Pollard-Brent run
+    is needed, so hi is limited only by int64 arithmetic (hi < 2**63).
+
+    Args:
+        lo: Inclusive start (values below 0 are clamped to 0).
+        hi: Exclusive end.
+        segment_size: Integers per segment; one segment is held in memory
+            (default: the tuned sieve_segment_size).
+        compact: Yield CSR FactorRangeSegment objects instead of dicts.
+        tables: Prebuilt tables such as a shared_tables.SharedPrimeTables
+            handle whose "primes" reach isqrt(hi - 1); sieved when omitted.
+
+    Yields:
+        Tuple[int, ...]: The segment start and either one prime -> exponent
+        dict per integer (the factor_frequencies shape) or, with compact,
+        a FactorRangeSegment.
+
+    Raises:
+        ValueError: If hi > 2**63 or tables["primes"] stops short of
+            isqrt(hi - 1).
+    """
+    import numpy as np
+
+    from pv_sdk.prime import _sieve_primes
+
+    lo = max(lo, 0)
+    segment_size = tuning.get("sieve_segment_size", segment_size)
+    if hi <= lo:
+        return
+    if hi > 1 << 63:
+        raise ValueError("factor_range needs hi <= 2**63")
+    if tables is not None:
+        base_primes = _table_primes(tables, math.isqrt(hi - 1))
+    else:
+        base_primes = _sieve_primes(math.isqrt(hi - 1))
+    for start in range(lo, hi, segment_size):
+        end = min(start + segment_size, hi)
+        with instrumentation.timer("factoring.factor_range_segment"):
+            counts, factors, exponents = _sieve_factor_segment(start, end, base_primes)
+        indptr = np.zeros(end - start + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        segment = FactorRangeSegment(start, indptr, factors, exponents)
+        instrumentation.incr("factoring.factor_range_integers", end - start)
+        yield start, segment if compact else segment.frequencies()
+
+
 def factor_and_map(number: int) -> List[str]:
     """
     Factor a composite into primes and map each to vowel notation.
@@ -1,11 +1,488 @@
+import atexit
 import json
 import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # POSIX advisory locking; other platforms fall back to unlocked appends
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class HistoricalLog:
+    """
+    Append-only JSON Lines store for historical records.
+
+    Every ``append`` writes a single ``{"key", "value", "ts"}`` line under an
+    exclusive file lock, so concurrent processes never lose updates and each
+    append costs O(1) instead of rewriting the whole history. The latest value
+    per key is kept in an in-memory index that only ever reads the bytes other
+    writers appended since the last lookup. Superseded records are dropped by
+    ``compact``, which runs automatically once the log grows ``compact_ratio``
+    times larger than the number of live keys.
+
+    A torn trailing line left by a crashed writer is ignored by readers and
+    terminated by the next writer.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        fsync_every: int = 32,
+        compact_ratio: float = 4.0,
+        min_compact_records: int = 1024,
+    ):
+        """
+        Open (or create on first append) a historical log.
+
+        Args:
+            filepath (str): Path of the ``.jsonl`` log file.
+            fsync_every (int): Number of appends between fsync calls.
+            compact_ratio (float): Compact when records exceed this multiple
+                of the number of distinct keys.
+            min_compact_records (int): Never compact logs smaller than this.
+        """
+        self.filepath = filepath
+        self.fsync_every = fsync_every
+        self.compact_ratio = compact_ratio
+        self.min_compact_records = min_compact_records
+        self._index: Dict[str, Any] = {}
+        # Timestamp of the record each index entry came from, kept by compact
+        self._stamps: Dict[str, Optional[float]] = {}
+        self._records = 0
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._writer = None
+        self._pending = 0
+
+    # —— Locking helpers ——
+    @staticmethod
+    def _lock(handle, exclusive: bool):
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    @staticmethod
+    def _unlock(handle):
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # —— Index maintenance ——
+    def _reset_index(self, inode: Optional[int]):
+        self._index = {}
+        self._stamps = {}
+        self._records = 0
+        self._offset = 0
+        self._inode = inode
+
+    def _catch_up(self, handle) -> bool:
+        """
+        Read records appended since the last call into the index.
+
+        Returns:
+            bool: True if the file ends with a torn (unterminated) line.
+        """
+        stat = os.fstat(handle.fileno())
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset_index(stat.st_ino)
+        handle.seek(self._offset)
+        chunk = handle.read()
+        complete = chunk.rfind(b"\n") + 1
+        for line in chunk[:complete].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn line from a crashed writer
+            self._index[record["key"]] = record["value"]
+            self._stamps[record["key"]] = record.get("ts")
+            self._records += 1
+        self._offset += complete
+        return complete < len(chunk)
+
+    def refresh(self):
+        """Bring the in-memory index up to date with the file on disk."""
+        if not os.path.exists(self.filepath):
+            self._reset_index(None)
+            return
+        with open(self.filepath, "rb") as handle:
+            self._lock(handle, exclusive=False)
+            try:
+                self._catch_up(handle)
+            finally:
+                self._unlock(handle)
+
+    def _locked_writer(self):
+        """Return the append handle with an exclusive lock on the live file."""
+        while True:
+            if self._writer is None:
+                self._writer = open(self.filepath, "ab+")
+            self._lock(self._writer, exclusive=True)
+            try:
+                current = os.stat(self.filepath).st_ino
+            except FileNotFoundError:
+                current = None
+            if current == os.fstat(self._writer.fileno()).st_ino:
+                return self._writer
+            # The file was replaced by a compaction; reopen and retry
+            self._unlock(self._writer)
+            self._writer.close()
+            self._writer = None
+
+    # —— Public API ——
+    def append(self, key: str, value):
+        """
+        Append a record; O(1) apart from reading other writers' new records.
+
+        Args:
+            key (str): Record key.
+            value: JSON-serializable record value.
+        """
+        ts = time.time()
+        line = json.dumps({"key": key, "value": value, "ts": ts}, separators=(",", ":"))
+        writer = self._locked_writer()
+        try:
+            torn = self._catch_up(writer)
+            payload = (("\n" if torn else "") + line + "\n").encode("utf-8")
+            writer.seek(0, os.SEEK_END)
+            writer.write(payload)
+            writer.flush()
+            self._offset = writer.tell()
+            self._index[key] = value
+            self._stamps[key] = ts
+            self._records += 1
+            self._pending += 1
+            if self._pending >= self.fsync_every:
+                os.fsync(writer.fileno())
+                self._pending = 0
+        finally:
+            self._unlock(writer)
+
+        if (
+            self._records >= self.min_compact_records
+            and self._records > self.compact_ratio * len(self._index)
+        ):
+            self.compact()
+
+    def get(self, key: str, default=None):
+        """Return the latest value recorded for key."""
+        self.refresh()
+        return self._index.get(key, default)
+
+    def as_dict(self) -> dict:
+        """Return a snapshot of the latest value for every key."""
+        self.refresh()
+        return dict(self._index)
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        self.refresh()
+        return key in self._index
+
+    def sync(self):
+        """Force any batched appends to stable storage."""
+        if self._writer is not None and self._pending:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._pending = 0
+
+    def compact(self):
+        """
+        Rewrite the log with one record per key, atomically replacing it.
+
+        Each kept record retains the timestamp it was originally written with.
+        """
+        writer = self._locked_writer()
+        try:
+            self._catch_up(writer)
+            tmp_path = f"{self.filepath}.{os.getpid()}.compact"
+            with open(tmp_path, "wb") as tmp:
+                for key, value in self._index.items():
+                    record = {"key": key, "value": value}
+                    if self._stamps.get(key) is not None:
+                        record["ts"] = self._stamps[key]
+                    tmp.write(json.dumps(record, separators=(",", ":")).encode())
+                    tmp.write(b"\n")
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, self.filepath)
+        finally:
+            self._unlock(writer)
+            writer.close()
+            self._writer = None
+            self._pending = 0
+        self._reset_index(os.stat(self.filepath).st_ino)
+        self.refresh()
+
+    def close(self):
+        """Sync pending appends and release the file handle."""
+        self.sync()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        self.refresh()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_open_logs: Dict[str, HistoricalLog] = {}
+
+
+def get_historical_log(filepath: str) -> HistoricalLog:
+    """
+    Return the shared HistoricalLog for filepath, opening it on first use.
+
+    Args:
+        filepath (str): Path of the ``.jsonl`` log file.
+
+    Returns:
+        HistoricalLog: Process-wide log instance with a warm index.
+    """
+    path = os.path.abspath(filepath)
+    if path not in _open_logs:
+        _open_logs[path] = HistoricalLog(path)
+    return _open_logs[path]
+
+
+@atexit.register
+def _close_open_logs():
+    for log in _open_logs.values():
+        log.close()
+
+
+def _is_log_path(filepath: str) -> bool:
+    return filepath.endswith(".jsonl")
+
+
+def migrate_json_to_log(json_path: str, log_path: str):
+    """
+    Copy every record of a legacy JSON history file into a JSON Lines log.
+
+    Args:
+        json_path (str): Existing ``historical_data.json`` style file.
+        log_path (str): Destination ``.jsonl`` log.
+    """
+    log = get_historical_log(log_path)
+    for key, value in load_historical_data(json_path).items():
+        log.append(key, value)
+    log.sync()
+
+
+class HistoricalStore:
+    """
+    SQLite time-series store for timestamped run metrics.
+
+    Unlike the key -> latest-value view of HistoricalLog, every record is
+    kept with its timestamp. Records live in a single ``records`` table
+    indexed on ``(key, ts)`` and ``ts``; values are stored as JSON, and range
+    queries, downsampling and aggregates are pushed down to SQL through
+    ``json_extract`` so Python never walks the whole history.
+    """
+
+    _AGGREGATES = {"avg", "min", "max", "sum", "count"}
+
+    def __init__(self, db_path: str):
+        """
+        Open (creating if needed) a historical store.
+
+        Args:
+            db_path (str): SQLite database path, or ":memory:".
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL,
+                ts REAL NOT NULL,
+                value TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_key_ts ON records (key, ts);
+            CREATE INDEX IF NOT EXISTS idx_records_ts ON records (ts);
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _field_path(field: str) -> str:
+        return "$." + field
+
+    @staticmethod
+    def _time_clause(start: Optional[float], end: Optional[float]) -> Tuple[str, list]:
+        clause, params = "", []
+        if start is not None:
+            clause += " AND ts >= ?"
+            params.append(start)
+        if end is not None:
+            clause += " AND ts < ?"
+            params.append(end)
+        return clause, params
+
+    def record(self, key: str, value, ts: Optional[float] = None) -> int:
+        """
+        Insert one timestamped record.
+
+        Args:
+            key (str): Series name, e.g. "prime_analysis".
+            value: JSON-serializable value (usually a dict of metrics).
+            ts (float, optional): Unix timestamp; defaults to now.
+
+        Returns:
+            int: Row id of the inserted record.
+        """
+        ts = time.time() if ts is None else ts
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO records (key, ts, value) VALUES (?, ?, ?)",
+                (key, ts, json.dumps(value)),
+            )
+        return cursor.lastrowid
+
+    def record_many(self, rows: List[Tuple[str, float, Any]]):
+        """
+        Insert many ``(key, ts, value)`` records in one transaction.
+
+        Args:
+            rows (List[Tuple[str, float, Any]]): Records to insert.
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO records (key, ts, value) VALUES (?, ?, ?)",
+                ((key, ts, json.dumps(value)) for key, ts, value in rows),
+            )
+
+    def keys(self) -> List[str]:
+        """Return the distinct series keys in the store."""
+        rows = self._conn.execute("SELECT DISTINCT key FROM records ORDER BY key")
+        return [row[0] for row in rows]
+
+    def query(
+        self,
+        key: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[float, Any]]:
+        """
+        Return the records of a series within [start, end), oldest first.
+
+        Args:
+            key (str): Series name.
+            start (float, optional): Inclusive lower timestamp bound.
+            end (float, optional): Exclusive upper timestamp bound.
+            limit (int, optional): Maximum number of records.
+
+        Returns:
+            List[Tuple[float, Any]]: ``(ts, value)`` pairs.
+        """
+        clause, params = self._time_clause(start, end)
+        sql = f"SELECT ts, value FROM records WHERE key = ?{clause} ORDER BY ts"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self._conn.execute(sql, [key, *params])
+        return [(ts, json.loads(value)) for ts, value in rows]
+
+    def latest(self, key: str):
+        """Return the most recent value of a series, or None."""
+        row = self._conn.execute(
+            "SELECT value FROM records WHERE key = ? ORDER BY ts DESC LIMIT 1",
+            (key,),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def aggregate(
+        self,
+        key: str,
+        field: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Compute count/min/max/mean of a numeric field in SQL.
+
+        Args:
+            key (str): Series name.
+            field (str): Field inside the JSON value, e.g. "duration".
+            start (float, optional): Inclusive lower timestamp bound.
+            end (float, optional): Exclusive upper timestamp bound.
+
+        Returns:
+            Dict[str, Optional[float]]: Keys "count", "min", "max" and "mean".
+        """
+        clause, params = self._time_clause(start, end)
+        count, minimum, maximum, mean = self._conn.execute(
+            "SELECT count(v), min(v), max(v), avg(v) FROM ("
+            " SELECT json_extract(value, ?) AS v FROM records"
+            f" WHERE key = ?{clause}) WHERE v IS NOT NULL",
+            [self._field_path(field), key, *params],
+        ).fetchone()
+        return {"count": count, "min": minimum, "max": maximum, "mean": mean}
+
+    def downsample(
+        self,
+        key: str,
+        field: str,
+        bucket_seconds: float,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        agg: str = "avg",
+    ) -> List[Tuple[float, float]]:
+        """
+        Aggregate a numeric field into fixed-width time buckets in SQL.
+
+        Args:
+            key (str): Series name.
+            field (str): Field inside the JSON value.
+            bucket_seconds (float): Bucket width in seconds (must be > 0).
+            start (float, optional): Inclusive lower timestamp bound.
+            end (float, optional): Exclusive upper timestamp bound.
+            agg (str): One of "avg", "min", "max", "sum", "count".
+
+        Returns:
+            List[Tuple[float, float]]: ``(bucket_start, aggregate)`` pairs.
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive.")
+        if agg not in self._AGGREGATES:
+            raise ValueError(f"agg must be one of {sorted(self._AGGREGATES)}.")
+        clause, params = self._time_clause(start, end)
+        rows = self._conn.execute(
+            f"SELECT CAST(ts / ? AS INTEGER) AS bucket, {agg}(v) FROM ("
+            " SELECT ts, json_extract(value, ?) AS v FROM records"
+            f" WHERE key = ?{clause}) WHERE v IS NOT NULL"
+            " GROUP BY bucket ORDER BY bucket",
+            [bucket_seconds, self._field_path(field), key, *params],
+        )
+        return [(bucket * bucket_seconds, value) for bucket, value in rows]
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 
 def load_historical_data(filepath: str) -> dict:
     """
     Load historical data clearly from JSON file.
 
+    ``.jsonl`` paths are served from the append-only HistoricalLog index.
+
     Args:
         filepath (str): Path clearly structured to historical data file.
 
@@ -15,6 +492,9 @@ def load_historical_data(filepath: str) -> dict:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File clearly not found: {filepath}")
 
+    if _is_log_path(filepath):
+        return get_historical_log(filepath).as_dict()
+
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -37,11 +517,19 @@ def append_historical_record(filepath: str, key: str, value):
     """
     Append new historical record explicitly stated in JSON data clearly.
 
+    ``.jsonl`` paths use an O(1) locked append to the HistoricalLog; legacy
+    ``.json`` files are still rewritten in full.
+
     Args:
         filepath (str): File path clearly structured for historical JSON data.
         key (str): New record's key clearly defined.
         value: New record’s value clearly defined.
     """
+    if _is_log_path(filepath):
+        get_historical_log(filepath).append(key, value)
+        print(f"[✅] Historical record '{key}' clearly appended.")
+        return
+
     data = {}
     if os.path.exists(filepath):
         data = load_historical_data(filepath)
@@ -53,7 +541,7 @@ def append_historical_record(filepath: str, key: str, value):
 
 def interactive_historical_example():
     """Clear interactive example for immediate testing."""
-    example_filepath = "historical_data.json"
+    example_filepath = "historical_data.jsonl"
 
     # Add historical record clearly stated
     key = input("Enter historical record key clearly: ").strip()
@@ -0,0 +1,183 @@
+"""
+Lightweight counters, timers and profiling hooks for PrimeVox SDK hot paths.
+
+Instrumentation is off by default. While no collector is active, ``incr``
+returns immediately and ``timer`` hands back a shared no-op context manager,
+so instrumented code pays one global lookup per call site. Hot loops keep
+their own local tallies and report them once per call.
+
+Usage:
+    from pv_sdk.instrumentation import collect_metrics
+
+    with collect_metrics(profile=True, trace_memory=True) as metrics:
+        factor(2**61 - 1)
+    metrics.write_prometheus("pvsdk.prom")
+    print(metrics.profile_stats())
+
+Public API:
+  - collect_metrics(profile=False, trace_memory=False) -> Metrics
+  - incr(name: str, amount: int = 1)
+  - timer(name: str)
+  - Metrics.as_dict() / to_json() / write_json(path) / to_prometheus() /
+    write_prometheus(path) / profile_stats()
+"""
+import io
+import json
+import re
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+_NULL_TIMER = nullcontext()
+
+# Innermost active collector; None means instrumentation is disabled
+_collector: Optional["Metrics"] = None
+
+
+class Metrics:
+    """Counters and timers gathered by one ``collect_metrics`` block."""
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.timers: Dict[str, Dict[str, float]] = {}
+        self.wall_time = 0.0
+        self.memory_peak_bytes: Optional[int] = None
+        self.memory_top: List[str] = []
+        self._profiler = None
+
+    def incr(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, name: str, seconds: float):
+        entry = self.timers.setdefault(name, {"count": 0, "total": 0.0})
+        entry["count"] += 1
+        entry["total"] += seconds
+
+    @contextmanager
+    def time(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    # —— Export ——
+    def as_dict(self) -> dict:
+        """Return counters, timers and run-level figures as plain data."""
+        data = {
+            "wall_time": self.wall_time,
+            "counters": dict(self.counters),
+            "timers": {name: dict(entry) for name, entry in self.timers.items()},
+        }
+        if self.memory_peak_bytes is not None:
+            data["memory_peak_bytes"] = self.memory_peak_bytes
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=4)
+
+    def write_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+    @staticmethod
+    def _metric_name(name: str) -> str:
+        return "pvsdk_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = self._metric_name(name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, entry in sorted(self.timers.items()):
+            metric = self._metric_name(name) + "_seconds"
+            lines += [
+                f"# TYPE {metric} summary",
+                f"{metric}_sum {entry['total']}",
+                f"{metric}_count {entry['count']}",
+            ]
+        lines += [
+            "# TYPE pvsdk_wall_time_seconds gauge",
+            f"pvsdk_wall_time_seconds {self.wall_time}",
+        ]
+        if self.memory_peak_bytes is not None:
+            lines += [
+                "# TYPE pvsdk_memory_peak_bytes gauge",
+                f"pvsdk_memory_peak_bytes {self.memory_peak_bytes}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Write a textfile-collector compatible ``.prom`` file."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+
+    def profile_stats(self, sort: str = "cumulative", limit: int = 25) -> str:
+        """Return the cProfile report, or an empty string if not profiled."""
+        if self._profiler is None:
+            return ""
+        import pstats
+
+        stream = io.StringIO()
+        pstats.Stats(self._profiler, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+def incr(name: str, amount: int = 1):
+    """Add amount to a counter of the active collector, if any."""
+    if _collector is not None:
+        _collector.incr(name, amount)
+
+
+def timer(name: str):
+    """Context manager timing a block into the active collector, if any."""
+    if _collector is None:
+        return _NULL_TIMER
+    return _collector.time(name)
+
+
+@contextmanager
+def collect_metrics(profile: bool = False, trace_memory: bool = False):
+    """
+    Collect SDK metrics for the duration of a ``with`` block.
+
+    Collectors nest: the innermost one receives the metrics and the outer one
+    is restored on exit.
+
+    Args:
+        profile (bool): Also run cProfile over the block.
+        trace_memory (bool): Also record peak memory and top allocation sites
+            with tracemalloc.
+
+    Yields:
+        Metrics: The collector, populated when the block exits.
+    """
+    global _collector
+
+    metrics = Metrics()
+    previous, _collector = _collector, metrics
+    if trace_memory:
+        import tracemalloc
+
+        tracemalloc.start()
+    if profile:
+        import cProfile
+
+        metrics._profiler = cProfile.Profile()
+        metrics._profiler.enable()
+    started = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_time = time.perf_counter() - started
+        if profile:
+            metrics._profiler.disable()
+        if trace_memory:
+            _, metrics.memory_peak_bytes = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            metrics.memory_top = [
+                str(stat) for stat in snapshot.statistics("lineno")[:10]
+            ]
+            tracemalloc.stop()
+        _collector = previous
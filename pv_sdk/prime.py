@@ -1,9 +1,38 @@
 import csv
 import itertools
+import math
 import os
 import pickle
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from sympy import isprime, primerange
+from pv_sdk import instrumentation, tuning
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Below this bound prime_count simply sieves; above it uses Lucy_Hedgehog's method
+SIEVE_COUNT_THRESHOLD = 1_000_000
+
+# is_prime_many: values below this are answered from a sieve table directly
+PRIMALITY_TABLE_LIMIT = 1 << 20
+
+# is_prime_many: trial-division bound of the vectorized prefilter
+PRIMALITY_PREFILTER_BOUND = 1000
+
+# is_prime_many: survivors >= 2^50 per Python Miller-Rabin task
+PRIMALITY_BATCH_SIZE = 1 << 16
+
+# Deterministic Miller-Rabin bases for all n < 2^64 (as factoring._is_prime)
+_MILLER_RABIN_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+# 2*3*5*7*11*13; residues coprime to it survive the wheel step
+_WHEEL = 30030
+
+# goldbach_partitions: odd-prime indicator entries per FFT block. Products of
+# blocks this size stay far inside float64's exact-rounding range; longer
+# indicators are convolved block pair by block pair.
+GOLDBACH_FFT_BLOCK = 1 << 22
 
 # Efficient vowel mapping dictionary
 PRIME_VOWEL_MAP = {
@@ -18,6 +47,8 @@ PRIME_VOWEL_MAP = {
 
 def is_prime(n: int) -> bool:
     """Reliably check if a number is prime using sympy."""
+    from sympy import isprime
+
     return isprime(n)
 
 
@@ -30,28 +61,339 @@ def prime_to_vowel(prime: int) -> str:
 
 def generate_primes_and_map(limit: int, pickle_file="prime_cache.pkl"):
     """Generate primes up to limit, map to vowels, cache results efficiently."""
+    from sympy import primerange
+
     # Load cached data if available
     if os.path.exists(pickle_file):
-        with open(pickle_file, "rb") as f:
+        with instrumentation.timer("prime.cache_load"), open(pickle_file, "rb") as f:
             data = pickle.load(f)
-            if data.get("limit", 0) >= limit:
-                return data["primes"], data["vowel_mappings"]
+        if data.get("limit", 0) >= limit:
+            instrumentation.incr("prime.cache_hits")
+            return data["primes"], data["vowel_mappings"]
+    instrumentation.incr("prime.cache_misses")
 
     # Generate primes and map vowels
-    primes = list(primerange(2, limit + 1))
-    vowel_mappings = [prime_to_vowel(p) for p in primes]
+    with instrumentation.timer("prime.generate"):
+        primes = list(primerange(2, limit + 1))
+        vowel_mappings = [prime_to_vowel(p) for p in primes]
 
     # Cache the results
     data = {"limit": limit, "primes": primes, "vowel_mappings": vowel_mappings}
     with open(pickle_file, "wb") as f:
         pickle.dump(data, f)
+        instrumentation.incr("prime.cache_bytes_written", f.tell())
 
     return primes, vowel_mappings
 
 
-def create_composite_mappings(primes, vowel_mappings, exponent_limit=20):
+def _sieve_primes(limit: int) -> "np.ndarray":
+    """Return all primes <= limit as an int64 NumPy array (odd-only sieve)."""
+    import numpy as np
+
+    if limit < 2:
+        return np.empty(0, dtype=np.int64)
+    # is_odd_prime[i] represents the odd number 2 * i + 1
+    is_odd_prime = np.ones((limit + 1) // 2, dtype=bool)
+    is_odd_prime[0] = False
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if is_odd_prime[i]:
+            p = 2 * i + 1
+            is_odd_prime[p * p // 2 :: p] = False
+    odd_primes = 2 * np.flatnonzero(is_odd_prime).astype(np.int64) + 1
+    return np.concatenate((np.array([2], dtype=np.int64), odd_primes))
+
+
+def _segment_primes(lo: int, hi: int, base_primes=None) -> "np.ndarray":
+    """
+    Return the primes in the half-open interval [lo, hi) with a segmented sieve.
+
+    Args:
+        lo (int): Inclusive lower bound.
+        hi (int): Exclusive upper bound.
+        base_primes (np.ndarray, optional): Primes up to at least isqrt(hi - 1);
+            computed on demand when omitted.
+
+    Returns:
+        np.ndarray: Sorted int64 array of primes in the interval.
+    """
+    import numpy as np
+
+    lo = max(lo, 2)
+    if hi <= lo:
+        return np.empty(0, dtype=np.int64)
+    root = math.isqrt(hi - 1)
+    if base_primes is None:
+        base_primes = _sieve_primes(root)
+    is_prime_segment = np.ones(hi - lo, dtype=bool)
+    for p in base_primes:
+        p = int(p)
+        if p > root:
+            break
+        start = max(p * p, -(-lo // p) * p)
+        is_prime_segment[start - lo :: p] = False
+    instrumentation.incr("prime.segments_sieved")
+    return np.flatnonzero(is_prime_segment).astype(np.int64) + lo
+
+
+def _lucy_prime_count(x: int) -> int:
+    """
+    Count primes <= x with Lucy_Hedgehog's O(x^(3/4)) combinatorial method.
+
+    S(v) (the number of primes <= v, after sieving by all primes < p) is kept
+    for every distinct value v = x // i: ``small[v]`` for v <= sqrt(x) and
+    ``large[i]`` for v = x // i. Each sieving prime updates both tables with
+    vectorized NumPy slices instead of a Python loop over v.
+    """
+    import numpy as np
+
+    r = math.isqrt(x)
+    indices = np.arange(r + 1, dtype=np.int64)
+    small = indices - 1
+    large = np.zeros(r + 1, dtype=np.int64)
+    large[1:] = x // indices[1:] - 1
+
+    for p in _sieve_primes(r).tolist():
+        sp = int(small[p - 1])
+        p2 = p * p
+        upper = min(r, x // p2)
+        # For i * p <= r, S(x // (i * p)) lives in the large table
+        split = min(upper, r // p)
+        if split >= 1:
+            large[1 : split + 1] -= large[p : split * p + 1 : p] - sp
+        if upper > split:
+            i = indices[split + 1 : upper + 1]
+            large[split + 1 : upper + 1] -= small[x // (i * p)] - sp
+        if p2 <= r:
+            small[p2:] -= small[indices[p2:] // p] - sp
+
+    return int(large[1])
+
+
+@lru_cache(maxsize=None)
+def prime_count(x: int) -> int:
+    """
+    Count the primes <= x (the prime-counting function pi(x)) without
+    enumerating them.
+
+    Small inputs are answered with a sieve; larger ones use Lucy_Hedgehog's
+    sublinear method. Results are cached, so repeated checkpoints are free.
+
+    Args:
+        x (int): Upper bound (inclusive).
+
+    Returns:
+        int: Number of primes p with p <= x.
+    """
+    if x < 2:
+        return 0
+    if x <= SIEVE_COUNT_THRESHOLD:
+        return len(_sieve_primes(x))
+    with instrumentation.timer("prime.lucy_prime_count"):
+        return _lucy_prime_count(x)
+
+
+def nth_prime(k: int) -> int:
+    """
+    Return the k-th prime (1-indexed, so nth_prime(1) == 2).
+
+    Uses Dusart's lower bound p_k >= k (ln k + ln ln k - 1) as a starting
+    point, counts the primes below it with prime_count, and sieves forward
+    segment by segment until the k-th prime is reached.
+
+    Args:
+        k (int): Index of the prime to return (must be >= 1).
+
+    Returns:
+        int: The k-th prime number.
+    """
+    if k < 1:
+        raise ValueError("k must be a positive integer.")
+    if k < 6:
+        return (2, 3, 5, 7, 11)[k - 1]
+
+    log_k = math.log(k)
+    upper = int(k * (log_k + math.log(log_k))) + 1
+    if upper <= SIEVE_COUNT_THRESHOLD:
+        return int(_sieve_primes(upper)[k - 1])
+
+    lower = int(k * (log_k + math.log(log_k) - 1))
+    remaining = k - prime_count(lower)
+    base_primes = _sieve_primes(math.isqrt(upper))
+    lo = lower + 1
+    segment_size = tuning.get("sieve_segment_size")
+    while True:
+        hi = min(lo + segment_size, upper + 1)
+        segment = _segment_primes(lo, hi, base_primes)
+        if len(segment) >= remaining:
+            return int(segment[remaining - 1])
+        remaining -= len(segment)
+        lo = hi
+
+
+@lru_cache(maxsize=1)
+def _primality_tables():
+    """Sieve table for small values, wheel residues and prefilter primes."""
+    import numpy as np
+
+    table = np.zeros(PRIMALITY_TABLE_LIMIT, dtype=bool)
+    table[_sieve_primes(PRIMALITY_TABLE_LIMIT - 1)] = True
+    residues = np.arange(_WHEEL)
+    wheel = np.gcd(residues, _WHEEL) == 1
+    prefilter = _sieve_primes(PRIMALITY_PREFILTER_BOUND)
+    return table, wheel, prefilter[prefilter > 13].astype(np.uint64)
+
+
+def _mulmod_u32(a: "np.ndarray", b: "np.ndarray", n: "np.ndarray") -> "np.ndarray":
+    """a * b mod n for uint64 arrays with n < 2^32 (the product fits)."""
+    return a * b % n
+
+
+def _mulmod_u50(a: "np.ndarray", b: "np.ndarray", n: "np.ndarray") -> "np.ndarray":
+    """
+    a * b mod n for uint64 arrays with n < 2^50.
+
+    The quotient is estimated in float64, which is within one of the exact
+    value at this size; the remainder is then computed in wrapping uint64
+    arithmetic and corrected by at most one multiple of n.
+    """
+    import numpy as np
+
+    q = np.floor(a.astype(np.float64) * b.astype(np.float64) / n).astype(np.uint64)
+    r = (a * b - q * n).view(np.int64)
+    signed_n = n.view(np.int64)
+    r = np.where(r < 0, r + signed_n, r)
+    r = np.where(r >= signed_n, r - signed_n, r)
+    return r.view(np.uint64)
+
+
+def _miller_rabin_vectorized(n: "np.ndarray", bases, mulmod) -> "np.ndarray":
+    """
+    Deterministic Miller-Rabin over an array of odd uint64 values.
+
+    Each base is only applied to the values that passed the previous ones,
+    so composites mostly drop out after the first base.
+    """
+    import numpy as np
+
+    one = np.uint64(1)
+    prime = np.ones(len(n), dtype=bool)
+    d = n - one
+    s = np.zeros(len(n), dtype=np.uint64)
+    while True:
+        even = (d & one) == 0
+        if not even.any():
+            break
+        d[even] >>= one
+        s[even] += one
+
+    for a in bases:
+        live = np.flatnonzero(prime)
+        if not len(live):
+            break
+        m, e, t = n[live], d[live].copy(), s[live]
+        base = np.uint64(a) % m
+        # Bases that are multiples of n carry no information
+        informative = base != 0
+        x = np.ones(len(live), dtype=np.uint64)
+        while e.any():
+            odd = (e & one) == one
+            x = np.where(odd, mulmod(x, base, m), x)
+            base = mulmod(base, base, m)
+            e >>= one
+        minus_one = m - one
+        passed = (x == one) | (x == minus_one)
+        for i in range(1, int(t.max())):
+            x = mulmod(x, x, m)
+            passed |= (x == minus_one) & (np.uint64(i) < t)
+        prime[live] = passed | ~informative
+    return prime
+
+
+def _miller_rabin_task(values: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    from pv_sdk.factoring import _is_prime
+
+    return np.fromiter((_is_prime(v) for v in values.tolist()), bool, len(values))
+
+
+def is_prime_many(values, workers: int = 1) -> "np.ndarray":
+    """
+    Test many integers for primality at once.
+
+    Values below PRIMALITY_TABLE_LIMIT are looked up in a sieve table. The
+    rest go through a vectorized wheel (mod 30030) and small-prime trial
+    division. Survivors below 2^50 get a vectorized deterministic
+    Miller-Rabin; larger ones are tested in Python in batches of
+    PRIMALITY_BATCH_SIZE, optionally spread over a process pool.
+
+    Args:
+        values: Integers in [0, 2^64) (list or NumPy array).
+        workers: Processes for the 64-bit Miller-Rabin batches.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the value is prime.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.uint64)
+    shape = values.shape
+    values = values.ravel()
+    table, wheel, prefilter = _primality_tables()
+    result = np.zeros(len(values), dtype=bool)
+
+    small = values < np.uint64(PRIMALITY_TABLE_LIMIT)
+    result[small] = table[values[small].astype(np.int64)]
+
+    index = np.flatnonzero(~small)
+    index = index[wheel[(values[index] % np.uint64(_WHEEL)).astype(np.int64)]]
+    candidates = values[index]
+    if len(candidates) and candidates.max() < np.uint64(1 << 32):
+        # uint32 division is markedly faster than uint64
+        candidates, prefilter = candidates.astype(np.uint32), prefilter.astype(
+            np.uint32
+        )
+    for p in prefilter:
+        keep = candidates % p != 0
+        candidates, index = candidates[keep], index[keep]
+    candidates = candidates.astype(np.uint64)
+    instrumentation.incr("prime.many_inputs", len(values))
+    instrumentation.incr("prime.many_miller_rabin", len(index))
+
+    # Survivors below bound^2 have no factor <= bound and are prime
+    bound_squared = np.uint64(PRIMALITY_PREFILTER_BOUND**2)
+    result[index[candidates < bound_squared]] = True
+    for lo, hi, bases, mulmod in (
+        # 2, 7, 61 are exact below 4,759,123,141
+        (bound_squared, 1 << 32, (2, 7, 61), _mulmod_u32),
+        (1 << 32, 1 << 50, _MILLER_RABIN_BASES, _mulmod_u50),
+    ):
+        batch = (candidates >= np.uint64(lo)) & (candidates < np.uint64(hi))
+        result[index[batch]] = _miller_rabin_vectorized(
+            candidates[batch], bases, mulmod
+        )
+
+    wide = index[candidates >= np.uint64(1 << 50)]
+    batches = [
+        values[wide[i : i + PRIMALITY_BATCH_SIZE]]
+        for i in range(0, len(wide), PRIMALITY_BATCH_SIZE)
+    ]
+    if workers > 1 and len(batches) > 1:
+        from multiprocessing import Pool
+
+        with Pool(workers) as pool:
+            outcomes = pool.map(_miller_rabin_task, batches)
+    else:
+        outcomes = [_miller_rabin_task(batch) for batch in batches]
+    if outcomes:
+        result[wide] = np.concatenate(outcomes)
+    return result.reshape(shape)
+
+
+def create_composite_mappings(primes, vowel_mappings, exponent_limit=None):
     """Create composites from prime pairs, labeling clearly using itertools."""
     composite_list = []
+    exponent_limit = tuning.get("composite_exponent_limit", exponent_limit)
 
     for (p1, v1), (p2, v2) in itertools.combinations(zip(primes, vowel_mappings), 2):
         composites = {
@@ -72,6 +414,79 @@ def create_composite_mappings(primes, vowel_mappings, exponent_limit=20):
     return composite_list
 
 
+def _self_convolution(values: "np.ndarray", size: int) -> "np.ndarray":
+    """
+    The first size entries of values * values (a 0/1 float array), rounded
+    to exact integers. Long inputs are split into GOLDBACH_FFT_BLOCK blocks
+    whose pairwise products are accumulated at their offsets.
+    """
+    import numpy as np
+
+    block = min(GOLDBACH_FFT_BLOCK, max(len(values), 1))
+    length = 1 << (2 * block - 1).bit_length()
+    spectra = [
+        np.fft.rfft(values[start : start + block], length)
+        for start in range(0, len(values), block)
+    ]
+    result = np.zeros(size, dtype=np.int64)
+    for i in range(len(spectra)):
+        for j in range(i, len(spectra)):
+            offset = (i + j) * block
+            if offset >= size:
+                break
+            product = np.fft.irfft(spectra[i] * spectra[j], length)
+            product = np.rint(product[: min(2 * block, size - offset)])
+            # The (i, j) and (j, i) block products are equal
+            result[offset : offset + len(product)] += (1 if i == j else 2) * (
+                product.astype(np.int64)
+            )
+    return result
+
+
+def goldbach_partitions(limit: int, ordered: bool = False) -> "np.ndarray":
+    """
+    Count the ways to write each n <= limit as a sum of two primes.
+
+    This is the distribution of the pair sums create_composite_mappings lists
+    one by one, computed with an FFT convolution of the prime indicator in
+    O(limit log limit) instead of enumerating O(pi(limit)^2) pairs. Only odd
+    primes go into the transform (all even n > 4 are sums of two of them);
+    the sums involving 2 are added directly.
+
+    Args:
+        limit (int): Largest n counted.
+        ordered (bool): Count ordered pairs (p, q); by default pairs with
+            p <= q are counted once.
+
+    Returns:
+        np.ndarray: int64 array r with r[n] the number of partitions of n,
+        for 0 <= n <= limit. For odd n only n = 2 + q partitions exist.
+    """
+    import numpy as np
+
+    counts = np.zeros(max(limit, 0) + 1, dtype=np.int64)
+    if limit < 4:
+        return counts
+    primes = _sieve_primes(limit)
+    odd_primes = primes[1:]
+    with instrumentation.timer("prime.goldbach_partitions"):
+        # indicator[k] = 1 iff 2k + 1 is prime; index m of the convolution
+        # collects the sums (2i + 1) + (2j + 1) = 2m + 2
+        indicator = np.zeros((limit + 1) // 2, dtype=np.float64)
+        indicator[(odd_primes - 1) // 2] = 1.0
+        sums = _self_convolution(indicator, limit // 2)
+    counts[2::2] = sums[: len(counts[2::2])]
+    counts[4] += 1  # 2 + 2
+    shifted = odd_primes[odd_primes <= limit - 2] + 2
+    counts[shifted] += 2  # (2, q) and (q, 2)
+    if not ordered:
+        # Ordered pairs count p + p once and every other partition twice
+        doubled = primes[2 * primes <= limit] * 2
+        counts[doubled] += 1
+        counts //= 2
+    return counts
+
+
 def save_composites_to_csv(composites, filepath="composite_data.csv"):
     """Save composite data to CSV for easy analysis."""
     with open(filepath, "w", newline="") as f:
@@ -0,0 +1,379 @@
+"""
+Persisted bitmap index for constant-time primality and twin-prime lookups.
+
+Every prime above 5 is coprime to 30, so it falls on one of the eight
+residues 1, 7, 11, 13, 17, 19, 23, 29 mod 30. The index stores one byte per
+30 integers, bit i of byte k standing for 30 * k + WHEEL[i] (8 bits per 30
+integers, about 3.3 GB per 10^11). 2, 3 and 5 are handled apart.
+
+A second bitmap with the same layout marks the first members p of the twin
+pairs (p, p + 2). On the wheel those can only be the residue pairs (11, 13),
+(17, 19) and (29, 31), so it is the prime bitmap ANDed with itself shifted
+by one bit, plus bit 0 of the next byte for residue 29.
+
+Both bitmaps carry a rank directory (the set-bit count before every block of
+BITMAP_RANK_BLOCK bytes), so counting primes or twin pairs below n takes one
+directory lookup and a popcount over less than one block, and the k-th prime
+is found by binary search over the directory.
+
+Directory layout:
+  primes.npy       prime bitmap (uint8)
+  twins.npy        twin-pair bitmap (uint8)
+  prime_ranks.npy  set bits of primes.npy before each block (int64)
+  twin_ranks.npy   set bits of twins.npy before each block (int64)
+  meta.json        index parameters (written last; marks the index complete)
+
+Public API:
+  - build_prime_bitmap(index_dir: str, hi: int, ...) -> PrimeBitmap
+  - open_prime_bitmap(index_dir: str) -> PrimeBitmap
+  - PrimeBitmap.is_prime(n) / is_twin(n) -> bool
+  - PrimeBitmap.is_prime_many(values) / is_twin_many(values) -> np.ndarray
+  - PrimeBitmap.prime_rank(n) / prime_count(lo, hi) / prime_select(k) -> int
+  - PrimeBitmap.twin_rank(n) / twin_count(lo, hi) / twin_select(k) -> int
+"""
+import json
+import math
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from pv_sdk import instrumentation, tuning
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Residues mod 30 coprime to 30; bit i of a byte stands for WHEEL[i]
+WHEEL = (1, 7, 11, 13, 17, 19, 23, 29)
+
+# Bytes per rank-directory block
+BITMAP_RANK_BLOCK = 256
+
+_INDEX_VERSION = 1
+
+# The primes and twin-pair first members that are not on the wheel
+_SMALL_PRIMES = (2, 3, 5)
+_SMALL_TWIN_FIRSTS = (3, 5)
+
+# Bit of each residue mod 30, or -1 for residues sharing a factor with 30
+_BIT_OF = tuple(WHEEL.index(r) if r in WHEEL else -1 for r in range(30))
+
+# Bits standing for residues below r, for r = 0 .. 29
+_LOW_BITS = tuple(sum(1 << i for i, w in enumerate(WHEEL) if w < r) for r in range(30))
+
+
+@lru_cache(maxsize=1)
+def _lookup_tables() -> Tuple["np.ndarray", "np.ndarray"]:
+    """Popcount of every byte, and _BIT_OF as an array."""
+    import numpy as np
+
+    popcount = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+    return popcount, np.array(_BIT_OF, dtype=np.int8)
+
+
+def _wheel_bytes(lo: int, hi: int, base_primes) -> "np.ndarray":
+    """Prime bitmap bytes of [lo, hi); lo and hi are multiples of 30."""
+    import numpy as np
+
+    from pv_sdk.prime import _segment_primes
+
+    is_prime = np.zeros(hi - lo, dtype=bool)
+    is_prime[_segment_primes(lo, hi, base_primes) - lo] = True
+    on_wheel = is_prime.reshape(-1, 30)[:, list(WHEEL)]
+    return np.packbits(on_wheel, axis=1, bitorder="little").ravel()
+
+
+def _twin_bytes(primes: "np.ndarray", following: "np.ndarray") -> "np.ndarray":
+    """
+    Twin-pair bitmap bytes from prime bitmap bytes (shift-AND).
+
+    following[k] is the prime byte after primes[k].
+    """
+    # Bits 3 and 5 (13, 19) move down onto bits 2 and 4 (11, 17); bit 0 of
+    # the next byte (31) moves up onto bit 7 (29)
+    partners = ((primes >> 1) & 0b00010100) | ((following & 1) << 7)
+    return primes & partners
+
+
+def _block_ranks(bitmap: "np.ndarray", counts: list) -> None:
+    """Append the set-bit counts of each BITMAP_RANK_BLOCK-byte block."""
+    import numpy as np
+
+    popcount, _ = _lookup_tables()
+    bits = popcount[bitmap].astype(np.int64)
+    bits = np.pad(bits, (0, -len(bits) % BITMAP_RANK_BLOCK))
+    counts.append(bits.reshape(-1, BITMAP_RANK_BLOCK).sum(axis=1))
+
+
+def _directory(counts: list) -> "np.ndarray":
+    import numpy as np
+
+    return np.concatenate(([0], np.cumsum(np.concatenate(counts))))
+
+
+def build_prime_bitmap(
+    index_dir: str, hi: int, segment_bytes: Optional[int] = None
+) -> "PrimeBitmap":
+    """
+    Build the prime and twin-pair bitmaps of [0, hi).
+
+    Args:
+        index_dir: Directory for the index files (created if needed).
+        hi: Exclusive upper bound, rounded up to a multiple of 30.
+        segment_bytes: Bitmap bytes (of 30 integers each) sieved per build
+            step, rounded to a multiple of BITMAP_RANK_BLOCK; bounds the
+            memory used (default: the tuned sieve_segment_size / 30).
+
+    Returns:
+        PrimeBitmap: The new index, memory-mapped from index_dir.
+    """
+    import numpy as np
+
+    from pv_sdk.prime import _sieve_primes
+
+    n_bytes = max(-(-hi // 30), 1)
+    if segment_bytes is None:
+        segment_bytes = tuning.get("sieve_segment_size") // 30
+    segment_bytes = max(segment_bytes // BITMAP_RANK_BLOCK, 1) * BITMAP_RANK_BLOCK
+    os.makedirs(index_dir, exist_ok=True)
+    meta_path = os.path.join(index_dir, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    open_memmap = np.lib.format.open_memmap
+    with instrumentation.timer("prime_bitmap.build"):
+        # One byte past the end decides the twins among the last primes
+        base_primes = _sieve_primes(math.isqrt(30 * (n_bytes + 1)))
+        after_end = _wheel_bytes(30 * n_bytes, 30 * (n_bytes + 1), base_primes)
+
+        primes = open_memmap(
+            os.path.join(index_dir, "primes.npy"),
+            mode="w+",
+            dtype=np.uint8,
+            shape=(n_bytes,),
+        )
+        prime_counts: list = []
+        for start in range(0, n_bytes, segment_bytes):
+            stop = min(start + segment_bytes, n_bytes)
+            primes[start:stop] = _wheel_bytes(30 * start, 30 * stop, base_primes)
+            _block_ranks(primes[start:stop], prime_counts)
+
+        twins = open_memmap(
+            os.path.join(index_dir, "twins.npy"),
+            mode="w+",
+            dtype=np.uint8,
+            shape=(n_bytes,),
+        )
+        twin_counts: list = []
+        for start in range(0, n_bytes, segment_bytes):
+            stop = min(start + segment_bytes, n_bytes)
+            chunk = np.asarray(primes[start:stop])
+            following = np.concatenate(
+                (chunk[1:], primes[stop : stop + 1] if stop < n_bytes else after_end)
+            )
+            twins[start:stop] = _twin_bytes(chunk, following)
+            _block_ranks(twins[start:stop], twin_counts)
+
+        np.save(os.path.join(index_dir, "prime_ranks.npy"), _directory(prime_counts))
+        np.save(os.path.join(index_dir, "twin_ranks.npy"), _directory(twin_counts))
+        primes.flush()
+        twins.flush()
+        del primes, twins
+
+    meta = {"version": _INDEX_VERSION, "hi": 30 * n_bytes}
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+    instrumentation.incr("prime_bitmap.bytes_written", 2 * n_bytes)
+    return open_prime_bitmap(index_dir)
+
+
+def open_prime_bitmap(index_dir: str) -> "PrimeBitmap":
+    """
+    Memory-map an index written by build_prime_bitmap.
+
+    Args:
+        index_dir: Directory holding the index files.
+
+    Returns:
+        PrimeBitmap: The index.
+
+    Raises:
+        FileNotFoundError: If index_dir holds no complete index.
+    """
+    meta_path = os.path.join(index_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        raise FileNotFoundError(f"no complete prime bitmap in {index_dir}")
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta.get("version") != _INDEX_VERSION:
+        raise ValueError(f"unsupported prime bitmap version in {index_dir}")
+    return PrimeBitmap(index_dir, meta)
+
+
+class PrimeBitmap:
+    """
+    Primality and twin-pair membership, counting and selection for [0, hi).
+
+    Twin pairs are counted and selected by their first member p.
+    """
+
+    def __init__(self, index_dir: str, meta: dict):
+        import numpy as np
+
+        self.index_dir = index_dir
+        self.hi = meta["hi"]
+        self.primes = np.load(os.path.join(index_dir, "primes.npy"), mmap_mode="r")
+        self.twins = np.load(os.path.join(index_dir, "twins.npy"), mmap_mode="r")
+        self.prime_ranks = np.load(os.path.join(index_dir, "prime_ranks.npy"))
+        self.twin_ranks = np.load(os.path.join(index_dir, "twin_ranks.npy"))
+
+    def _check(self, n: int) -> None:
+        if not 0 <= n < self.hi:
+            raise ValueError(f"{n} is outside the indexed range [0, {self.hi})")
+
+    def _bit(self, bitmap: "np.ndarray", n: int) -> bool:
+        bit = _BIT_OF[n % 30]
+        return bit >= 0 and bool(bitmap[n // 30] >> bit & 1)
+
+    def is_prime(self, n: int) -> bool:
+        """Whether n is prime, in O(1)."""
+        if n < 0:
+            return False
+        self._check(n)
+        return n in _SMALL_PRIMES or self._bit(self.primes, n)
+
+    def is_twin(self, n: int) -> bool:
+        """Whether n belongs to a twin pair (n - 2, n) or (n, n + 2), in O(1)."""
+        if n < 0:
+            return False
+        self._check(n)
+        if n <= 7:
+            return n in (3, 5, 7)
+        return self._bit(self.twins, n) or self._bit(self.twins, n - 2)
+
+    def _many(self, bitmap: "np.ndarray", values: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        _, bit_of = _lookup_tables()
+        bits = bit_of[values % 30]
+        result = np.zeros(len(values), dtype=bool)
+        on_wheel = np.flatnonzero(bits >= 0)
+        selected = bitmap[values[on_wheel] // 30] >> bits[on_wheel].astype(np.uint8)
+        result[on_wheel] = (selected & 1).astype(bool)
+        return result
+
+    def _checked_values(self, values) -> Tuple["np.ndarray", "np.ndarray"]:
+        """The values as an array, and flattened with negatives replaced by 0."""
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.int64)
+        flat = values.ravel()
+        if len(flat) and flat.max() >= self.hi:
+            raise ValueError(f"values outside the indexed range [0, {self.hi})")
+        return values, np.maximum(flat, 0)
+
+    def is_prime_many(self, values) -> "np.ndarray":
+        """
+        Vectorized is_prime.
+
+        Args:
+            values: Array-like of integers below hi.
+
+        Returns:
+            np.ndarray: Boolean array of the same shape.
+        """
+        import numpy as np
+
+        values, flat = self._checked_values(values)
+        result = self._many(self.primes, flat) | np.isin(flat, _SMALL_PRIMES)
+        result &= values.ravel() >= 0
+        instrumentation.incr("prime_bitmap.batch_lookups", len(flat))
+        return result.reshape(values.shape)
+
+    def is_twin_many(self, values) -> "np.ndarray":
+        """
+        Vectorized is_twin.
+
+        Args:
+            values: Array-like of integers below hi.
+
+        Returns:
+            np.ndarray: Boolean array of the same shape.
+        """
+        import numpy as np
+
+        values, flat = self._checked_values(values)
+        result = np.isin(flat, (3, 5, 7))
+        large = np.flatnonzero(flat > 7)
+        result[large] = self._many(self.twins, flat[large]) | self._many(
+            self.twins, flat[large] - 2
+        )
+        result &= values.ravel() >= 0
+        instrumentation.incr("prime_bitmap.batch_lookups", len(flat))
+        return result.reshape(values.shape)
+
+    def _rank(self, bitmap: "np.ndarray", ranks: "np.ndarray", n: int) -> int:
+        """Set bits standing for integers below n, 0 <= n <= hi."""
+        popcount, _ = _lookup_tables()
+        byte, residue = divmod(n, 30)
+        block_start = byte - byte % BITMAP_RANK_BLOCK
+        count = int(ranks[byte // BITMAP_RANK_BLOCK])
+        count += int(popcount[bitmap[block_start:byte]].sum(dtype="int64"))
+        if byte < len(bitmap):
+            count += int(popcount[bitmap[byte] & _LOW_BITS[residue]])
+        return count
+
+    def _select(self, bitmap: "np.ndarray", ranks: "np.ndarray", k: int) -> int:
+        """The integer standing for the set bit of rank k (0-based)."""
+        import numpy as np
+
+        popcount, _ = _lookup_tables()
+        if not 0 <= k < ranks[-1]:
+            raise IndexError(f"rank {k} is outside [0, {int(ranks[-1])})")
+        block = int(np.searchsorted(ranks, k, side="right")) - 1
+        start = block * BITMAP_RANK_BLOCK
+        chunk = bitmap[start : start + BITMAP_RANK_BLOCK]
+        cumulative = np.cumsum(popcount[chunk], dtype=np.int64)
+        remaining = k - int(ranks[block])
+        byte = int(np.searchsorted(cumulative, remaining, side="right"))
+        if byte:
+            remaining -= int(cumulative[byte - 1])
+        value = int(chunk[byte])
+        for bit in range(8):
+            if value >> bit & 1:
+                if remaining == 0:
+                    return 30 * (start + byte) + WHEEL[bit]
+                remaining -= 1
+        raise AssertionError("rank directory out of sync with the bitmap")
+
+    def prime_rank(self, n: int) -> int:
+        """The number of primes below n (pi(n - 1)), for n <= hi."""
+        n = min(max(n, 0), self.hi)
+        small = sum(1 for p in _SMALL_PRIMES if p < n)
+        return small + self._rank(self.primes, self.prime_ranks, n)
+
+    def prime_count(self, lo: int, hi: int) -> int:
+        """The number of primes in [lo, hi)."""
+        return max(self.prime_rank(hi) - self.prime_rank(lo), 0)
+
+    def prime_select(self, k: int) -> int:
+        """The k-th prime, counting from prime_select(0) == 2."""
+        if 0 <= k < len(_SMALL_PRIMES):
+            return _SMALL_PRIMES[k]
+        return self._select(self.primes, self.prime_ranks, k - len(_SMALL_PRIMES))
+
+    def twin_rank(self, n: int) -> int:
+        """The number of twin pairs (p, p + 2) with p < n, for n <= hi."""
+        n = min(max(n, 0), self.hi)
+        small = sum(1 for p in _SMALL_TWIN_FIRSTS if p < n)
+        return small + self._rank(self.twins, self.twin_ranks, n)
+
+    def twin_count(self, lo: int, hi: int) -> int:
+        """The number of twin pairs (p, p + 2) with lo <= p < hi."""
+        return max(self.twin_rank(hi) - self.twin_rank(lo), 0)
+
+    def twin_select(self, k: int) -> int:
+        """First member of the k-th twin pair, counting from (3, 5) at k = 0."""
+        if 0 <= k < len(_SMALL_TWIN_FIRSTS):
+            return _SMALL_TWIN_FIRSTS[k]
+        small = len(_SMALL_TWIN_FIRSTS)
+        return self._select(self.twins, self.twin_ranks, k - small)
@@ -1,6 +1,10 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-from sympy import factorint
+import math
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+from pv_sdk import instrumentation, tuning
+
+if TYPE_CHECKING:
+    import numpy as np
 
 digit_to_vowel = {
     "1": "A",
@@ -26,6 +30,8 @@ def prime_to_vowel_notation(prime):
 
 # Factorize the number and map factors to vowel notation
 def factor_and_map(number):
+    from sympy import factorint
+
     factors = factorint(number)
     mapped_factors = []
 
@@ -43,6 +49,9 @@ def factor_and_map(number):
 
 # Visualize factorization graph
 def visualize_factors(number, factors):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.DiGraph()
     G.add_node(str(number), color="lightblue", style="filled")
 
@@ -60,6 +69,253 @@ def visualize_factors(number, factors):
     plt.show()
 
 
+class FactorSharingGraph(NamedTuple):
+    """
+    Bipartite number -> prime-factor graph over a range, in CSR form.
+
+    The factors of the number lo + i are factors[indptr[i]:indptr[i + 1]]
+    (ascending), with multiplicities exponents[indptr[i]:indptr[i + 1]].
+    Numbers below 2 have no factors.
+    """
+
+    lo: int
+    indptr: "np.ndarray"
+    factors: "np.ndarray"
+    exponents: "np.ndarray"
+
+    @property
+    def numbers(self) -> "np.ndarray":
+        import numpy as np
+
+        return np.arange(self.lo, self.lo + len(self.indptr) - 1, dtype=np.int64)
+
+    def factors_of(self, number: int) -> List[Tuple[int, int]]:
+        """(prime, exponent) pairs of one number in the range."""
+        i = number - self.lo
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return list(
+            zip(self.factors[start:stop].tolist(), self.exponents[start:stop].tolist())
+        )
+
+
+def factor_sharing_graph(
+    a: int, b: int, segment_size: Optional[int] = None
+) -> FactorSharingGraph:
+    """
+    Build the number -> prime-factor graph of every integer in [a, b].
+
+    Numbers are factored by a segmented sieve (one pass per segment over the
+    primes <= sqrt(b)), not one factorint call per number.
+
+    Args:
+        a (int): First number (inclusive).
+        b (int): Last number (inclusive).
+        segment_size (int, optional): Integers sieved per step (default: the
+            tuned sieve_segment_size).
+
+    Returns:
+        FactorSharingGraph: The graph as CSR arrays.
+    """
+    import numpy as np
+
+    from pv_sdk.factoring import _sieve_factor_segment
+    from pv_sdk.prime import _sieve_primes
+
+    segment_size = tuning.get("sieve_segment_size", segment_size)
+    a = max(a, 0)
+    b = max(b, a - 1)
+    base_primes = _sieve_primes(math.isqrt(max(b, 0)))
+    counts, factors, exponents = [], [], []
+    with instrumentation.timer("prime_vowel_factorizer.factor_sharing_graph"):
+        for start in range(a, b + 1, segment_size):
+            segment = _sieve_factor_segment(
+                start, min(start + segment_size, b + 1), base_primes
+            )
+            for parts, part in zip((counts, factors, exponents), segment):
+                parts.append(part)
+    indptr = np.zeros(b - a + 2, dtype=np.int64)
+    if counts:
+        np.cumsum(np.concatenate(counts), out=indptr[1:])
+    graph = FactorSharingGraph(
+        a,
+        indptr,
+        np.concatenate(factors) if factors else np.empty(0, dtype=np.int64),
+        np.concatenate(exponents) if exponents else np.empty(0, dtype=np.uint8),
+    )
+    instrumentation.incr("prime_vowel_factorizer.graph_edges", len(graph.factors))
+    return graph
+
+
+def factor_graph_labels(graph: FactorSharingGraph) -> Tuple["np.ndarray", List[str]]:
+    """
+    The distinct prime nodes of a factor graph and their vowel notation.
+
+    Args:
+        graph (FactorSharingGraph): Graph from factor_sharing_graph.
+
+    Returns:
+        Tuple[np.ndarray, List[str]]: Ascending primes and their labels.
+    """
+    import numpy as np
+
+    primes = np.unique(graph.factors)
+    return primes, [prime_to_vowel_notation(p) for p in primes.tolist()]
+
+
+def factor_graph_matrix(graph: FactorSharingGraph):
+    """
+    The graph as a SciPy CSR matrix: rows are numbers, columns index the
+    primes of factor_graph_labels, and entries are exponents.
+
+    Args:
+        graph (FactorSharingGraph): Graph from factor_sharing_graph.
+
+    Returns:
+        scipy.sparse.csr_matrix: Matrix of shape (numbers, distinct primes).
+    """
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    primes, columns = np.unique(graph.factors, return_inverse=True)
+    return csr_matrix(
+        (graph.exponents, columns, graph.indptr),
+        shape=(len(graph.indptr) - 1, len(primes)),
+    )
+
+
+def save_factor_graph(graph: FactorSharingGraph, filename: str) -> None:
+    """
+    Export a factor graph as a compressed NumPy archive.
+
+    Args:
+        graph (FactorSharingGraph): Graph from factor_sharing_graph.
+        filename (str): Output path (.npz).
+    """
+    import numpy as np
+
+    np.savez_compressed(
+        filename,
+        lo=graph.lo,
+        indptr=graph.indptr,
+        factors=graph.factors,
+        exponents=graph.exponents,
+    )
+
+
+def load_factor_graph(filename: str) -> FactorSharingGraph:
+    """
+    Load a factor graph written by save_factor_graph.
+
+    Args:
+        filename (str): Archive path.
+
+    Returns:
+        FactorSharingGraph: The graph.
+    """
+    import numpy as np
+
+    with np.load(filename) as data:
+        return FactorSharingGraph(
+            int(data["lo"]), data["indptr"], data["factors"], data["exponents"]
+        )
+
+
+def sample_factor_graph(
+    graph: FactorSharingGraph, count: int, seed: Optional[int] = 0
+) -> Tuple["np.ndarray", FactorSharingGraph]:
+    """
+    Keep a random subset of the numbers (with all their edges), e.g. for
+    rendering.
+
+    Args:
+        graph (FactorSharingGraph): Graph from factor_sharing_graph.
+        count (int): Numbers to keep.
+        seed (Optional[int]): Random seed.
+
+    Returns:
+        Tuple[np.ndarray, FactorSharingGraph]: The kept numbers (ascending)
+        and their subgraph, whose rows follow that order. The subgraph's lo
+        is the first kept number, so look up rows by position, not value.
+    """
+    import numpy as np
+
+    total = len(graph.indptr) - 1
+    rng = np.random.default_rng(seed)
+    rows = np.sort(rng.choice(total, size=min(count, total), replace=False))
+    starts, stops = graph.indptr[rows], graph.indptr[rows + 1]
+    lengths = stops - starts
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    # Edge positions of all kept rows, without a Python loop over rows
+    edges = np.repeat(starts - indptr[:-1], lengths) + np.arange(indptr[-1])
+    numbers = rows + graph.lo
+    lo = int(numbers[0]) if len(numbers) else graph.lo
+    return numbers, FactorSharingGraph(
+        lo, indptr, graph.factors[edges], graph.exponents[edges]
+    )
+
+
+def draw_factor_graph(
+    graph: FactorSharingGraph,
+    numbers: Optional["np.ndarray"] = None,
+    output_file: str = "factor_graph.png",
+    max_numbers: int = 200,
+):
+    """
+    Draw a factor graph as two columns (numbers, prime factors) joined by
+    line segments, without building a NetworkX graph.
+
+    Args:
+        graph (FactorSharingGraph): Graph to draw; larger graphs are sampled
+            down to max_numbers rows first.
+        numbers (Optional[np.ndarray]): Row labels when graph is a sample
+            (as returned by sample_factor_graph).
+        output_file (str): Image path.
+        max_numbers (int): Most numbers drawn.
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.collections import LineCollection
+
+    if numbers is None:
+        numbers = graph.numbers
+    if len(numbers) > max_numbers:
+        keep, sample = sample_factor_graph(graph, max_numbers)
+        numbers, graph = numbers[keep - graph.lo], sample
+
+    primes, labels = factor_graph_labels(graph)
+    rows = np.repeat(np.arange(len(numbers)), np.diff(graph.indptr))
+    columns = np.searchsorted(primes, graph.factors)
+    # Spread both columns over the same height
+    number_y = np.linspace(1, 0, max(len(numbers), 1))
+    prime_y = np.linspace(1, 0, max(len(primes), 1))
+    segments = np.stack(
+        [
+            np.column_stack((np.zeros(len(rows)), number_y[rows])),
+            np.column_stack((np.ones(len(rows)), prime_y[columns])),
+        ],
+        axis=1,
+    )
+
+    fig, ax = plt.subplots(figsize=(10, max(6, len(numbers) * 0.08)))
+    ax.add_collection(
+        LineCollection(
+            segments, linewidths=0.4 + 0.4 * graph.exponents, colors="gray", alpha=0.6
+        )
+    )
+    ax.scatter(np.zeros(len(numbers)), number_y, s=8, color="lightblue")
+    ax.scatter(np.ones(len(primes)), prime_y, s=8, color="lightgreen")
+    font = max(3, min(8, 600 // max(len(primes), len(numbers), 1)))
+    for y, number in zip(number_y, numbers.tolist()):
+        ax.text(-0.02, y, str(number), ha="right", va="center", fontsize=font)
+    for y, label in zip(prime_y, labels):
+        ax.text(1.02, y, label, ha="left", va="center", fontsize=font)
+    ax.set_xlim(-0.3, 1.3)
+    ax.axis("off")
+    ax.set_title(f"Factor-sharing graph of {len(numbers)} numbers")
+    fig.savefig(output_file, dpi=200, bbox_inches="tight")
+    plt.close(fig)
+
+
 # Main function
 def main():
     composite_number = int(
@@ -0,0 +1,363 @@
+"""
+Local factorization service with request micro-batching.
+
+A long-lived server keeps a warm process pool and an LRU result cache so
+that many short-lived client processes do not each pay import, warm-up and
+cache costs. Requests arriving within ``batch_window`` seconds of each other
+are grouped (up to ``max_batch``) and factored by one pool task.
+
+Protocol: newline-delimited JSON over a Unix socket or local TCP port.
+  request   {"id": 1, "n": 1001}           response {"id": 1, "factors": {"7": 1, ...}}
+  request   {"id": 2, "op": "metrics"}     response {"id": 2, "metrics": {...}}
+  errors    {"id": ..., "error": "message"}
+Responses on one connection may arrive out of order; match them by id.
+
+Public API:
+  - FactorServer(socket_path=None, host="127.0.0.1", port=0, ...)
+  - FactorClient(socket_path=None, host="127.0.0.1", port=None)
+  - serve(...)  run a server until interrupted (used by ``pvsdk serve``)
+"""
+import asyncio
+import json
+import os
+import socket
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from pv_sdk import tuning
+from pv_sdk.factoring import BATCH_TRIAL_DIVISION_BOUND, SPF_TABLE_LIMIT, factor_many
+from pv_sdk.instrumentation import Metrics
+from pv_sdk.shared_tables import SharedPrimeTables, publish_prime_tables
+
+DEFAULT_BATCH_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 256
+DEFAULT_CACHE_SIZE = 65536
+
+
+def _factor_batch(
+    numbers: List[int], tables: Optional[SharedPrimeTables] = None
+) -> List[Dict[int, int]]:
+    return factor_many(numbers, tables=tables)
+
+
+def _warm_up(tables: Optional[SharedPrimeTables] = None) -> int:
+    if tables is not None:
+        # Attach now rather than on the first request
+        tables["spf"]
+    return os.getpid()
+
+
+def _encode_factors(freqs: Dict[int, int]) -> Dict[str, int]:
+    return {str(p): e for p, e in freqs.items()}
+
+
+class FactorServer:
+    """asyncio server wrapping ``factor_many`` with batching and caching."""
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        workers: Optional[int] = None,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Configure a server; nothing is started until ``start``.
+
+        Args:
+            socket_path (str, optional): Listen on this Unix socket instead of TCP.
+            host (str): TCP host when no socket_path is given.
+            port (int): TCP port (0 picks a free port, see ``address``).
+            workers (int, optional): Pool size (default: the tuned workers).
+            batch_window (float): Seconds to wait for more requests to batch.
+            max_batch (int): Maximum numbers per pool task.
+            cache_size (int): Number of factorizations kept in the LRU cache.
+        """
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.workers = tuning.get("workers", workers)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self.metrics = Metrics()
+        self._cache: "OrderedDict[int, Dict[int, int]]" = OrderedDict()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tables: Optional[SharedPrimeTables] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._started = 0.0
+
+    @property
+    def address(self):
+        """The Unix socket path, or the bound ``(host, port)`` pair."""
+        if self.socket_path:
+            return self.socket_path
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self):
+        """Publish the prime tables, warm up the worker pool and start listening."""
+        loop = asyncio.get_running_loop()
+        self._tables = publish_prime_tables(BATCH_TRIAL_DIVISION_BOUND, SPF_TABLE_LIMIT)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _warm_up, self._tables)
+                for _ in range(self.workers)
+            )
+        )
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=self.socket_path
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, self.host, self.port
+            )
+        self._started = time.perf_counter()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening, stop the batcher, shut the pool down and free the tables."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+        # Let dispatched batches finish while the pool is still up
+        await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._tables is not None:
+            self._tables.unlink()
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    # —— Request handling ——
+    async def _handle(self, reader, writer):
+        self.metrics.incr("service.connections")
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            if request.get("op") == "metrics":
+                response = {"id": request_id, "metrics": self.snapshot()}
+            else:
+                freqs = await self.factor(int(request["n"]))
+                response = {"id": request_id, "factors": _encode_factors(freqs)}
+        except Exception as exc:  # reported to the client, not fatal
+            self.metrics.incr("service.errors")
+            response = {"id": request_id, "error": str(exc)}
+        writer.write((json.dumps(response) + "\n").encode())
+        await writer.drain()
+
+    async def factor(self, n: int) -> Dict[int, int]:
+        """Factor n through the cache and the batching queue."""
+        self.metrics.incr("service.requests")
+        if n in self._cache:
+            self._cache.move_to_end(n)
+            self.metrics.incr("service.cache_hits")
+            return self._cache[n]
+        future = self._pending.get(n)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[n] = future
+            self._queue.put_nowait(n)
+        else:
+            self.metrics.incr("service.coalesced")
+        started = time.perf_counter()
+        result = await asyncio.shield(future)
+        self.metrics.add_time("service.request", time.perf_counter() - started)
+        return result
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without awaiting so the next batch can form meanwhile;
+            # the loop only keeps weak references to tasks
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[int]):
+        self.metrics.incr("service.batches")
+        self.metrics.incr("service.batched_numbers", len(batch))
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, _factor_batch, batch, self._tables
+            )
+        except Exception as exc:
+            for n in batch:
+                self._pending.pop(n).set_exception(exc)
+            return
+        self.metrics.add_time("service.batch_compute", time.perf_counter() - started)
+        for n, freqs in zip(batch, results):
+            self._cache[n] = freqs
+            self._pending.pop(n).set_result(freqs)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def snapshot(self) -> dict:
+        """Return server metrics plus queue, cache and uptime figures."""
+        data = self.metrics.as_dict()
+        data["wall_time"] = time.perf_counter() - self._started
+        data["queue_depth"] = self._queue.qsize() if self._queue else 0
+        data["cache_entries"] = len(self._cache)
+        data["workers"] = self.workers
+        return data
+
+
+class FactorClient:
+    """Blocking client keeping one persistent connection to a FactorServer."""
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            socket_path (str, optional): Unix socket of the server.
+            host (str): TCP host when no socket_path is given.
+            port (int, optional): TCP port when no socket_path is given.
+            timeout (float, optional): Socket timeout in seconds.
+        """
+        if socket_path is None and port is None:
+            raise ValueError("Either socket_path or port is required.")
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._next_id = 0
+
+    def _connect(self):
+        if self._sock is None:
+            if self.socket_path:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                address = self.socket_path
+            else:
+                self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                address = (self.host, self.port)
+            self._sock.settimeout(self.timeout)
+            self._sock.connect(address)
+            self._reader = self._sock.makefile("rb")
+        return self._sock
+
+    def _call(self, requests: List[dict]) -> List[dict]:
+        """Send requests pipelined, then read one response per request."""
+        sock = self._connect()
+        ids = []
+        for request in requests:
+            self._next_id += 1
+            ids.append(self._next_id)
+            request["id"] = self._next_id
+        sock.sendall(b"".join((json.dumps(r) + "\n").encode() for r in requests))
+        responses = {}
+        for _ in ids:
+            line = self._reader.readline()
+            if not line:
+                raise ConnectionError("Factor server closed the connection.")
+            response = json.loads(line)
+            responses[response["id"]] = response
+        return [responses[i] for i in ids]
+
+    @staticmethod
+    def _decode(response: dict) -> Dict[int, int]:
+        if "error" in response:
+            raise ValueError(response["error"])
+        return {int(p): e for p, e in response["factors"].items()}
+
+    def factor_frequencies(self, n: int) -> Dict[int, int]:
+        """Return the prime -> exponent dict of n, computed by the server."""
+        return self._decode(self._call([{"n": n}])[0])
+
+    def factor_many(self, numbers: List[int]) -> List[Dict[int, int]]:
+        """Factor many numbers over one round trip (pipelined)."""
+        return [self._decode(r) for r in self._call([{"n": n} for n in numbers])]
+
+    def metrics(self) -> dict:
+        """Return the server's metrics snapshot."""
+        return self._call([{"op": "metrics"}])[0]["metrics"]
+
+    def close(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+            self._sock = self._reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def serve(
+    socket_path: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    workers: Optional[int] = None,
+    batch_window: float = DEFAULT_BATCH_WINDOW,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+):
+    """Run a FactorServer until interrupted, announcing its address on stdout."""
+
+    async def run():
+        server = FactorServer(
+            socket_path, host, port, workers, batch_window, max_batch, cache_size
+        )
+        await server.start()
+        print(json.dumps({"listening": server.address}), flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
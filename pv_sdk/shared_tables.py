@@ -0,0 +1,167 @@
+"""
+Prime tables published once in shared memory for process-pool workers.
+
+publish_prime_tables sieves the primes up to a limit (and optionally a
+smallest-prime-factor table) into one multiprocessing.shared_memory block.
+The returned SharedPrimeTables handle pickles to just the block name and
+array layout, so passing it to pool tasks costs a few hundred bytes;
+workers attach on first use and read the tables as read-only NumPy views
+without copying. Attachments are cached per process.
+
+The publishing process owns the block: use the handle as a context manager
+around the pool (or call unlink) so the segment is removed when the pool is
+done. A finalizer unlinks it as well if the owner forgets. In the owner,
+indexing returns read-only views of the published source arrays rather than
+of the block, so arrays obtained there stay valid after unlink.
+
+factoring.batch_trial_division / factor_many and
+twin_primes.twin_primes_in_segment accept a handle (or any mapping holding the
+same tables); the process pools of the CLI and of the factorization service
+publish one per run.
+
+Public API:
+  - publish_prime_tables(limit: int, spf_limit: int = 0) -> SharedPrimeTables
+  - SharedPrimeTables(arrays: Dict[str, np.ndarray], limit: int)
+  - SharedPrimeTables[name] -> np.ndarray
+"""
+import weakref
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from pv_sdk import instrumentation
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Array offsets inside a block are rounded up to this many bytes
+_ALIGNMENT = 64
+
+# Blocks this process has attached to, by name; kept open for its lifetime
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _unlink(block: shared_memory.SharedMemory) -> None:
+    try:
+        block.close()
+        block.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedPrimeTables:
+    """
+    Handle to named NumPy arrays in one shared-memory block.
+
+    The creating process owns the block and keeps the source arrays; unpickled
+    copies in workers only attach to it.
+    """
+
+    def __init__(self, arrays: Dict[str, "np.ndarray"], limit: int):
+        """
+        Copy arrays into a new shared-memory block.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): Tables to publish.
+            limit (int): Largest integer the tables cover (see publish_prime_tables).
+        """
+        layout: Dict[str, Tuple[str, Tuple[int, ...], int]] = {}
+        size = 0
+        for name, array in arrays.items():
+            size += -size % _ALIGNMENT
+            layout[name] = (array.dtype.str, array.shape, size)
+            size += array.nbytes
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.limit = limit
+        self._name = block.name
+        self._layout = layout
+        self._block = block
+        self._owner = True
+        self._views: Dict[str, "np.ndarray"] = {}
+        for name, array in arrays.items():
+            self._view(name, writeable=True)[...] = array
+            # Closing the block must not invalidate arrays the owner handed out
+            view = array.view()
+            view.flags.writeable = False
+            self._views[name] = view
+        self._finalizer = weakref.finalize(self, _unlink, block)
+        instrumentation.incr("shared_tables.bytes_published", size)
+
+    def __getstate__(self):
+        return {"name": self._name, "layout": self._layout, "limit": self.limit}
+
+    def __setstate__(self, state):
+        self.limit = state["limit"]
+        self._name = state["name"]
+        self._layout = state["layout"]
+        self._block = None
+        self._owner = False
+        self._views = {}
+
+    def _attach(self) -> shared_memory.SharedMemory:
+        if self._block is None:
+            block = _attached.get(self._name)
+            if block is None:
+                block = shared_memory.SharedMemory(name=self._name)
+                _attached[self._name] = block
+                instrumentation.incr("shared_tables.attaches")
+            self._block = block
+        return self._block
+
+    def _view(self, name: str, writeable: bool = False) -> "np.ndarray":
+        import numpy as np
+
+        dtype, shape, offset = self._layout[name]
+        view = np.ndarray(shape, dtype=dtype, buffer=self._attach().buf, offset=offset)
+        view.flags.writeable = writeable
+        return view
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        """Read-only NumPy view of the named table (no copy)."""
+        if name not in self._views:
+            self._views[name] = self._view(name)
+        return self._views[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._layout
+
+    @property
+    def name(self) -> str:
+        """Name of the shared-memory block."""
+        return self._name
+
+    def unlink(self) -> None:
+        """Remove the block (owner only); attached workers keep their mapping."""
+        if self._owner:
+            self._finalizer()
+
+    def __enter__(self) -> "SharedPrimeTables":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
+
+
+def publish_prime_tables(limit: int, spf_limit: int = 0) -> SharedPrimeTables:
+    """
+    Sieve prime tables once and publish them in shared memory.
+
+    Args:
+        limit (int): Publish all primes <= limit as table "primes" (int64).
+            For segment sieving up to N, isqrt(N) is enough.
+        spf_limit (int): If positive, also publish "spf", the smallest prime
+            factor of every k <= spf_limit (int32), as used by
+            factoring.batch_trial_division.
+
+    Returns:
+        SharedPrimeTables: Handle owning the block; unlink it (or use it as a
+        context manager) once the workers are done.
+    """
+    import numpy as np
+
+    from pv_sdk.arithmetic import _smallest_prime_factor_table
+    from pv_sdk.prime import _sieve_primes
+
+    arrays = {"primes": _sieve_primes(limit)}
+    if spf_limit > 0:
+        arrays["spf"] = _smallest_prime_factor_table(spf_limit, np.int32)
+    return SharedPrimeTables(arrays, limit)
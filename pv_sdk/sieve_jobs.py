@@ -0,0 +1,388 @@
+"""
+Resumable, multi-node sieve jobs coordinated through a shared directory.
+
+A job splits [lo, hi) into fixed-size segments described by a manifest in a
+job directory on a shared filesystem. Workers on any number of machines
+claim segments through atomic lock files (O_CREAT | O_EXCL), sieve them and
+write one JSON result per segment (prime count, twin-prime count, gap
+histogram, first and last prime). merge_job combines the segment results,
+including the gaps and twins that straddle segment boundaries. A worker
+that is restarted skips segments that already have a result, and locks left
+behind by dead workers are reclaimed.
+
+Directory layout:
+  manifest.json           job parameters
+  locks/<segment>.lock    claim held by the worker sieving the segment
+  segments/<segment>.json finished segment results
+  result.json             merged result (written by merge_job)
+
+Public API:
+  - create_job(job_dir: str, lo: int, hi: int, segment_size: int) -> dict
+  - run_worker(job_dir: str) -> int
+  - run_workers(job_dir: str, workers: int) -> None
+  - job_status(job_dir: str) -> dict
+  - merge_job(job_dir: str) -> dict
+  - run_local_job(job_dir: str, lo: int, hi: int, workers: int) -> dict
+"""
+import json
+import math
+import os
+import socket
+import time
+import uuid
+from typing import Dict, Optional
+
+from pv_sdk import instrumentation
+
+DEFAULT_JOB_SEGMENT_SIZE = 1 << 24
+
+# A claim older than this is considered abandoned, even on another host
+JOB_STALE_SECONDS = 3600
+
+_MANIFEST_VERSION = 1
+
+
+def _write_json(path: str, data: dict) -> None:
+    """Write JSON atomically so readers never see a partial file."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _segment_name(index: int) -> str:
+    return f"{index:08d}"
+
+
+def _segment_bounds(manifest: dict, index: int):
+    lo = manifest["lo"] + index * manifest["segment_size"]
+    return lo, min(lo + manifest["segment_size"], manifest["hi"])
+
+
+def create_job(
+    job_dir: str, lo: int, hi: int, segment_size: int = DEFAULT_JOB_SEGMENT_SIZE
+) -> dict:
+    """
+    Create (or reopen) a sieve job over [lo, hi).
+
+    Calling it again with the same parameters, e.g. from every node of a
+    cluster or after a restart, returns the existing manifest.
+
+    Args:
+        job_dir: Job directory on a filesystem shared by all workers.
+        lo: Inclusive start of the range.
+        hi: Exclusive end of the range.
+        segment_size: Integers per segment task.
+
+    Returns:
+        dict: The job manifest.
+
+    Raises:
+        ValueError: If the directory already holds a job with other parameters.
+    """
+    lo = max(lo, 2)
+    if hi <= lo or segment_size < 1:
+        raise ValueError("need lo < hi and a positive segment_size")
+    manifest = {
+        "version": _MANIFEST_VERSION,
+        "lo": lo,
+        "hi": hi,
+        "segment_size": segment_size,
+        "segments": -(-(hi - lo) // segment_size),
+    }
+    os.makedirs(os.path.join(job_dir, "locks"), exist_ok=True)
+    os.makedirs(os.path.join(job_dir, "segments"), exist_ok=True)
+    path = os.path.join(job_dir, "manifest.json")
+    if os.path.exists(path):
+        existing = _read_json(path)
+        if existing != manifest:
+            raise ValueError(f"{job_dir} already holds a different job: {existing}")
+        return existing
+    _write_json(path, manifest)
+    return manifest
+
+
+def _load_manifest(job_dir: str) -> dict:
+    path = os.path.join(job_dir, "manifest.json")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"no sieve job in {job_dir} (run create_job first)")
+    return _read_json(path)
+
+
+def _lock_is_stale(lock_path: str, stale_after: float) -> bool:
+    try:
+        age = time.time() - os.path.getmtime(lock_path)
+    except OSError:
+        # Vanished; its owner released it
+        return False
+    if age > stale_after:
+        # Also covers empty or torn locks of workers that died mid-write
+        return True
+    try:
+        owner = _read_json(lock_path)
+    except (OSError, ValueError):
+        # Vanished, or caught between creation and the first write
+        return False
+    if owner.get("host") != socket.gethostname():
+        return False
+    try:
+        os.kill(owner["pid"], 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+def _claim(job_dir: str, name: str, stale_after: float) -> bool:
+    """Atomically claim a segment; reclaim locks of dead or overdue workers."""
+    lock_path = os.path.join(job_dir, "locks", f"{name}.lock")
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not _lock_is_stale(lock_path, stale_after):
+                return False
+            # Only one of several competing reclaimers wins the rename
+            try:
+                os.rename(lock_path, f"{lock_path}.{uuid.uuid4().hex}.stale")
+            except FileNotFoundError:
+                return False
+            instrumentation.incr("sieve_jobs.stale_locks_reclaimed")
+            continue
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {"host": socket.gethostname(), "pid": os.getpid(), "at": time.time()},
+                f,
+            )
+        return True
+    return False
+
+
+def _sieve_segment(lo: int, hi: int, base_primes) -> dict:
+    """Sieve [lo, hi) and summarize it (primes, twins, gap histogram)."""
+    import numpy as np
+
+    from pv_sdk.prime import _segment_primes
+
+    # Two extra integers decide whether the last primes start a twin pair
+    primes = _segment_primes(lo, hi + 2, base_primes)
+    twins = int(np.count_nonzero((np.diff(primes) == 2) & (primes[:-1] < hi)))
+    primes = primes[primes < hi]
+    gaps = np.diff(primes)
+    sizes, counts = np.unique(gaps, return_counts=True)
+    largest = int(np.argmax(gaps)) if len(gaps) else None
+    return {
+        "lo": lo,
+        "hi": hi,
+        "prime_count": int(len(primes)),
+        "twin_count": twins,
+        "first_prime": int(primes[0]) if len(primes) else None,
+        "last_prime": int(primes[-1]) if len(primes) else None,
+        "gap_counts": {str(g): int(c) for g, c in zip(sizes.tolist(), counts.tolist())},
+        "max_gap": (
+            [int(gaps[largest]), int(primes[largest])] if largest is not None else None
+        ),
+    }
+
+
+def run_worker(
+    job_dir: str,
+    max_segments: Optional[int] = None,
+    stale_after: float = JOB_STALE_SECONDS,
+) -> int:
+    """
+    Claim and sieve segments of a job until none are left.
+
+    Safe to run concurrently on any number of hosts sharing job_dir, and to
+    rerun after a crash: finished segments are skipped.
+
+    Args:
+        job_dir: Job directory created by create_job.
+        max_segments: Stop after this many segments (None: run to the end).
+        stale_after: Age in seconds after which another worker's claim on an
+            unfinished segment is taken over.
+
+    Returns:
+        int: Number of segments this call sieved.
+    """
+    from pv_sdk.prime import _sieve_primes
+
+    manifest = _load_manifest(job_dir)
+    base_primes = _sieve_primes(math.isqrt(manifest["hi"] + 1))
+    done = 0
+    for index in range(manifest["segments"]):
+        if max_segments is not None and done >= max_segments:
+            break
+        name = _segment_name(index)
+        result_path = os.path.join(job_dir, "segments", f"{name}.json")
+        if os.path.exists(result_path) or not _claim(job_dir, name, stale_after):
+            continue
+        # A worker may have finished it between the check and the claim
+        if os.path.exists(result_path):
+            continue
+        started = time.perf_counter()
+        with instrumentation.timer("sieve_jobs.segment"):
+            result = _sieve_segment(*_segment_bounds(manifest, index), base_primes)
+        result["seconds"] = time.perf_counter() - started
+        result["worker"] = f"{socket.gethostname()}:{os.getpid()}"
+        _write_json(result_path, result)
+        done += 1
+    instrumentation.incr("sieve_jobs.segments_sieved", done)
+    return done
+
+
+def job_status(job_dir: str) -> Dict[str, int]:
+    """
+    Count finished, claimed and pending segments of a job.
+
+    Args:
+        job_dir: Job directory created by create_job.
+
+    Returns:
+        dict: {"segments", "done", "claimed", "pending"}.
+    """
+    manifest = _load_manifest(job_dir)
+    finished = {
+        name[: -len(".json")]
+        for name in os.listdir(os.path.join(job_dir, "segments"))
+        if name.endswith(".json")
+    }
+    claimed = {
+        name[: -len(".lock")]
+        for name in os.listdir(os.path.join(job_dir, "locks"))
+        if name.endswith(".lock")
+    } - finished
+    total = manifest["segments"]
+    return {
+        "segments": total,
+        "done": len(finished),
+        "claimed": len(claimed),
+        "pending": total - len(finished) - len(claimed),
+    }
+
+
+def merge_job(job_dir: str) -> dict:
+    """
+    Combine the segment results of a finished job into result.json.
+
+    Args:
+        job_dir: Job directory created by create_job.
+
+    Returns:
+        dict: Prime and twin-prime counts, the gap histogram (including gaps
+        across segment boundaries), the largest gap and the first and last
+        primes of the whole range.
+
+    Raises:
+        RuntimeError: If some segments have no result yet.
+    """
+    manifest = _load_manifest(job_dir)
+    status = job_status(job_dir)
+    if status["done"] < status["segments"]:
+        raise RuntimeError(
+            f"job incomplete: {status['done']} of {status['segments']} segments done"
+        )
+    prime_count = twin_count = 0
+    gap_counts: Dict[int, int] = {}
+    max_gap = None
+    first_prime = previous = None
+    for index in range(manifest["segments"]):
+        name = _segment_name(index)
+        segment = _read_json(os.path.join(job_dir, "segments", f"{name}.json"))
+        prime_count += segment["prime_count"]
+        twin_count += segment["twin_count"]
+        for gap, count in segment["gap_counts"].items():
+            gap_counts[int(gap)] = gap_counts.get(int(gap), 0) + count
+        candidates = [segment["max_gap"]] if segment["max_gap"] else []
+        if segment["first_prime"] is None:
+            continue
+        if previous is not None:
+            # The gap straddling the boundary belongs to neither segment
+            gap = segment["first_prime"] - previous
+            gap_counts[gap] = gap_counts.get(gap, 0) + 1
+            candidates.append([gap, previous])
+        for candidate in candidates:
+            if max_gap is None or candidate[0] > max_gap[0]:
+                max_gap = candidate
+        first_prime = first_prime if first_prime is not None else segment["first_prime"]
+        previous = segment["last_prime"]
+
+    merged = {
+        "lo": manifest["lo"],
+        "hi": manifest["hi"],
+        "segments": manifest["segments"],
+        "prime_count": prime_count,
+        "twin_prime_count": twin_count,
+        "first_prime": first_prime,
+        "last_prime": previous,
+        "max_gap": {"gap": max_gap[0], "after": max_gap[1]} if max_gap else None,
+        "gap_counts": {str(g): gap_counts[g] for g in sorted(gap_counts)},
+    }
+    _write_json(os.path.join(job_dir, "result.json"), merged)
+    return merged
+
+
+def _worker_process(job_dir: str, stale_after: float) -> None:
+    run_worker(job_dir, stale_after=stale_after)
+
+
+def run_workers(
+    job_dir: str, workers: int = 1, stale_after: float = JOB_STALE_SECONDS
+) -> None:
+    """
+    Run independent worker processes on this host until the job is done.
+
+    Args:
+        job_dir: Job directory created by create_job.
+        workers: Worker processes (1 = run in this process).
+        stale_after: See run_worker.
+    """
+    if workers <= 1:
+        run_worker(job_dir, stale_after=stale_after)
+        return
+
+    from multiprocessing import Process
+
+    processes = [
+        Process(target=_worker_process, args=(job_dir, stale_after))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def run_local_job(
+    job_dir: str,
+    lo: int,
+    hi: int,
+    workers: int = 1,
+    segment_size: int = DEFAULT_JOB_SEGMENT_SIZE,
+    stale_after: float = JOB_STALE_SECONDS,
+) -> dict:
+    """
+    Run a whole job on this machine, with one process per simulated node.
+
+    Args:
+        job_dir: Job directory (created or resumed).
+        lo: Inclusive start of the range.
+        hi: Exclusive end of the range.
+        workers: Independent worker processes competing for segments.
+        segment_size: Integers per segment task.
+        stale_after: See run_worker.
+
+    Returns:
+        dict: The merged result (see merge_job).
+    """
+    create_job(job_dir, lo, hi, segment_size)
+    run_workers(job_dir, workers, stale_after)
+    return merge_job(job_dir)
@@ -0,0 +1,447 @@
+"""
+Self-initializing quadratic sieve (SIQS) for PrimeVox SDK.
+
+Splits odd composites of roughly 30-65 digits that have no small factors,
+typically the balanced semiprimes that Pollard-Brent cannot reach. The
+sieve runs on NumPy arrays, partial relations with one large prime are
+paired up, and the GF(2) matrix is eliminated with bit-packed Python int
+rows. Polynomial batches (one A coefficient and all of its B values) can be
+spread over a process pool.
+
+pv_sdk.factoring selects this stage automatically for hard cofactors of at
+least the tuned siqs_min_digits (see pv_sdk.tuning).
+
+Public API:
+  - siqs_factor(n: int, workers: int = 1) -> Optional[int]
+"""
+import bisect
+import logging
+import math
+import random
+from collections import Counter
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
+
+from pv_sdk import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# (bits of kN, factor base size, large-prime multiplier, sieve half-width M),
+# interpolated by bit size; after msieve's table
+SIQS_PARAMETERS = (
+    (64, 100, 40, 1 << 14),
+    (100, 200, 40, 1 << 15),
+    (128, 450, 40, 1 << 15),
+    (160, 1200, 60, 1 << 15),
+    (183, 2000, 80, 1 << 16),
+    (200, 3000, 100, 1 << 16),
+    (216, 5000, 120, 3 << 15),
+)
+
+# Factor-base primes below this are not sieved (small prime variation)
+SIQS_SMALL_PRIME = 30
+
+# Sieve threshold slack, in multiples of log2 of the largest factor-base prime
+SIQS_THRESHOLD_SLACK = 2.2
+
+# Relations collected beyond the number of matrix columns
+SIQS_EXTRA_RELATIONS = 16
+
+# Squarefree odd multipliers considered by Knuth-Schroeppel
+_MULTIPLIERS = (1, 3, 5, 7, 11, 13, 15, 17, 19, 21, 23, 29, 31, 33, 35, 37, 39, 41)
+
+# Per-process sieve state, set up once per n by _init_state
+_state: Dict = {}
+
+
+def _parameters(bits: int) -> Tuple[int, int, int]:
+    """Interpolate (factor base size, large-prime multiplier, M) for kN."""
+    table = SIQS_PARAMETERS
+    if bits <= table[0][0]:
+        return table[0][1:]
+    for (b0, f0, l0, m0), (b1, f1, l1, m1) in zip(table, table[1:]):
+        if bits <= b1:
+            t = (bits - b0) / (b1 - b0)
+            return int(f0 + t * (f1 - f0)), int(l0 + t * (l1 - l0)), max(m0, m1)
+    return table[-1][1:]
+
+
+def _sqrt_mod_prime(a: int, p: int) -> int:
+    """Tonelli-Shanks: return x with x * x = a (mod p) for a residue a."""
+    a %= p
+    if p == 2 or a == 0:
+        return a
+    if p % 4 == 3:
+        return pow(a, (p + 1) // 4, p)
+    q, s = p - 1, 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+    m, c, t, r = s, pow(z, q, p), pow(a, q, p), pow(a, (q + 1) // 2, p)
+    while t != 1:
+        i, t2 = 0, t
+        while t2 != 1:
+            t2 = t2 * t2 % p
+            i += 1
+        b = pow(c, 1 << (m - i - 1), p)
+        m, c, t, r = i, b * b % p, t * b * b % p, r * b % p
+    return r
+
+
+def _small_primes(limit: int) -> List[int]:
+    from pv_sdk.prime import _sieve_primes
+
+    return _sieve_primes(limit).tolist()
+
+
+def _choose_multiplier(n: int) -> int:
+    """Knuth-Schroeppel: the multiplier k giving kN the most small residues."""
+    primes = _small_primes(1000)[1:]
+    best, best_score = 1, -math.inf
+    for k in _MULTIPLIERS:
+        kn = k * n
+        score = -0.5 * math.log(k)
+        if kn % 8 == 1:
+            score += 2 * math.log(2)
+        elif kn % 8 == 5:
+            score += math.log(2)
+        elif kn % 4 == 3:
+            score += 0.5 * math.log(2)
+        for p in primes:
+            if k % p == 0:
+                score += math.log(p) / p
+            elif pow(kn % p, (p - 1) // 2, p) == 1:
+                score += 2 * math.log(p) / (p - 1)
+        if score > best_score:
+            best, best_score = k, score
+    return best
+
+
+def _init_state(n: int, kn: int, fb_size: int, large_mult: int, m: int) -> None:
+    """Build the factor base and sieve bands for kN in this process."""
+    import numpy as np
+
+    primes, roots = [2], [kn % 2]
+    bound = 4 * fb_size * max(int(math.log(fb_size)), 1) + 100
+    while len(primes) < fb_size:
+        for p in _small_primes(bound)[1:]:
+            if len(primes) == fb_size:
+                break
+            if p > primes[-1] and pow(kn % p, (p - 1) // 2, p) == 1:
+                primes.append(p)
+                roots.append(_sqrt_mod_prime(kn, p))
+        bound *= 2
+
+    p_arr = np.array(primes, dtype=np.int64)
+    # Sieve bands: primes within a factor 2 of each other share a hit count,
+    # so each band's hit offsets form one dense (primes x hits) matrix
+    sieved = np.nonzero(p_arr >= SIQS_SMALL_PRIME)[0]
+    bands, length = [], 2 * m
+    start = 0
+    while start < len(sieved):
+        lo = int(p_arr[sieved[start]])
+        stop = start
+        while stop < len(sieved) and p_arr[sieved[stop]] < 2 * lo:
+            stop += 1
+        index = sieved[start:stop]
+        hits = -(-2 * m // lo)
+        offsets = p_arr[index][:, None] * np.arange(hits, dtype=np.int64)
+        bands.append((index, offsets))
+        length = max(length, int(offsets[:, -1].max() + p_arr[index].max()) + 1)
+        start = stop
+
+    _state.clear()
+    _state.update(
+        n=n,
+        kn=kn,
+        m=m,
+        primes=primes,
+        p_arr=p_arr,
+        roots=np.array(roots, dtype=np.int64),
+        log_p=np.log2(p_arr.astype(np.float64)),
+        bands=bands,
+        length=length,
+        large_bound=primes[-1] * large_mult,
+        threshold=math.log2(m)
+        + kn.bit_length() / 2
+        - 0.5
+        - SIQS_THRESHOLD_SLACK * math.log2(primes[-1]),
+    )
+
+
+def _choose_a(rng: random.Random) -> Optional[Tuple[int, List[int]]]:
+    """Pick A as a product of factor-base primes close to sqrt(2kN) / M."""
+    primes, kn, m = _state["primes"], _state["kn"], _state["m"]
+    target = math.isqrt(2 * kn) // m
+    window = max(4, len(primes) // 20)
+    # q's stay above the small primes, so distinct A's share few factors
+    lo, hi = bisect.bisect(primes, 100), len(primes) - 1 - window
+    if hi - lo < 4 * window:
+        return None
+    s = 2
+    while target ** (1 / s) > primes[hi]:
+        s += 1
+    for _ in range(100):
+        a, chosen = 1, []
+        # Each q is drawn near the size that would leave equal-sized
+        # remaining factors; the last one is the best fit for what is left
+        for remaining in range(s, 1, -1):
+            center = bisect.bisect(primes, (target / a) ** (1 / remaining))
+            i = min(max(center + rng.randint(-window, window), lo), hi)
+            chosen.append(i)
+            a *= primes[i]
+        remainder = target // a
+        center = bisect.bisect(primes, remainder)
+        near = [i for i in range(center - 1, center + 1) if lo <= i < len(primes)]
+        if not near:
+            continue
+        best = min(near, key=lambda i: abs(primes[i] - remainder))
+        chosen.append(best)
+        a *= primes[best]
+        if len(set(chosen)) == s and target // 2 <= a <= target * 2:
+            return a, sorted(chosen)
+    return None
+
+
+def _sieve_batch(seed: int) -> Tuple[List, List]:
+    """
+    Sieve every B polynomial of one randomly chosen A.
+
+    Args:
+        seed: Seed for the choice of A.
+    Returns:
+        (full relations, partial relations). A relation is (u, indices,
+        large_prime) with u^2 = product of the factor-base entries in indices
+        (index 0 is -1, index j + 1 is primes[j]) times large_prime, mod kN.
+    """
+    import numpy as np
+
+    state = _state
+    kn, m, primes = state["kn"], state["m"], state["primes"]
+    p_arr, roots, log_p = state["p_arr"], state["roots"], state["log_p"]
+    chosen_a = _choose_a(random.Random(seed))
+    if chosen_a is None:
+        return [], []
+    a, q_index = chosen_a
+    qs = [primes[i] for i in q_index]
+
+    # B = sum of +-B_l with B_l^2 = kN (mod q_l) and B_l = 0 (mod other q's)
+    b_terms = []
+    for q in qs:
+        a_q = a // q
+        gamma = _sqrt_mod_prime(kn, q) * pow(a_q, -1, q) % q
+        b_terms.append(a_q * min(gamma, q - gamma))
+    b = sum(b_terms)
+
+    a_inv = np.array(
+        [pow(a % p, -1, p) if a % p else 0 for p in primes], dtype=np.int64
+    )
+    b_inv2 = [
+        np.array([2 * term % p for p in primes], dtype=np.int64) * a_inv % p_arr
+        for term in b_terms
+    ]
+    b_mod = np.array([b % p for p in primes], dtype=np.int64)
+    root1 = (a_inv * ((roots - b_mod) % p_arr) + m) % p_arr
+    root2 = (a_inv * ((-roots - b_mod) % p_arr) + m) % p_arr
+
+    # Primes dividing A have a single root; they are found by trial division
+    weights = log_p.copy()
+    weights[q_index] = 0
+    band_weights = np.concatenate(
+        [
+            np.repeat(weights[index], offsets.shape[1])
+            for index, offsets in state["bands"]
+        ]
+    )
+    band_weights = np.concatenate([band_weights, band_weights])
+    divisible_check = np.ones(len(primes), dtype=bool)
+    divisible_check[q_index] = False
+    divisible_check[0] = False
+
+    full, partial = [], []
+    signs = [1] * len(b_terms)
+    polys = 1 << (len(b_terms) - 1)
+    for poly in range(polys):
+        if poly:
+            # Gray code: flip the sign of one B_l per polynomial
+            v = (poly & -poly).bit_length()
+            signs[v] = -signs[v]
+            b += 2 * signs[v] * b_terms[v]
+            shift = b_inv2[v] if signs[v] > 0 else p_arr - b_inv2[v]
+            root1 = (root1 - shift) % p_arr
+            root2 = (root2 - shift) % p_arr
+        c = (b * b - kn) // a
+
+        positions = [
+            (r[index][:, None] + offsets).ravel()
+            for r in (root1, root2)
+            for index, offsets in state["bands"]
+        ]
+        sieve = np.bincount(
+            np.concatenate(positions), weights=band_weights, minlength=state["length"]
+        )[: 2 * m]
+        candidates = np.nonzero(sieve > state["threshold"])[0]
+        instrumentation.incr("siqs.candidates", len(candidates))
+
+        for i in candidates.tolist():
+            x = i - m
+            value = (a * x + 2 * b) * x + c
+            indices = [j + 1 for j in q_index]
+            if value < 0:
+                value = -value
+                indices.append(0)
+            hit = divisible_check & (
+                ((i - root1) % p_arr == 0) | ((i - root2) % p_arr == 0)
+            )
+            hit[0] = value % 2 == 0
+            hit[q_index] = True
+            for j in np.nonzero(hit)[0].tolist():
+                p = primes[j]
+                while value % p == 0:
+                    value //= p
+                    indices.append(j + 1)
+            u = a * x + b
+            if value == 1:
+                full.append((u, indices, 1))
+            elif value < state["large_bound"]:
+                partial.append((u, indices, value))
+    instrumentation.incr("siqs.polynomials", polys)
+    return full, partial
+
+
+def _init_worker(args) -> None:
+    _init_state(*args)
+
+
+def _find_dependencies(vectors: List[int]) -> List[int]:
+    """
+    Gaussian elimination over GF(2) on bit-packed rows.
+
+    Args:
+        vectors: Parity vector of each relation as a Python int bitmask.
+    Returns:
+        Bitmasks over relation indices, each selecting a set of relations
+        whose vectors XOR to zero.
+    """
+    pivots: Dict[int, Tuple[int, int]] = {}
+    dependencies = []
+    for i, vec in enumerate(vectors):
+        history = 1 << i
+        # Each pivot row has a distinct lowest set bit; reducing by it only
+        # sets higher bits, so the loop ends with a new pivot or with zero
+        while vec:
+            low = vec & -vec
+            pivot = pivots.get(low)
+            if pivot is None:
+                pivots[low] = (vec, history)
+                break
+            vec ^= pivot[0]
+            history ^= pivot[1]
+        else:
+            dependencies.append(history)
+    return dependencies
+
+
+def _combine(relations: List[Tuple[int, List[int], int]], n: int) -> Optional[int]:
+    """Try each GF(2) dependency for a congruence of squares mod n."""
+    primes = _state["primes"]
+    vectors = []
+    for _, indices, _ in relations:
+        vec = 0
+        for j in indices:
+            vec ^= 1 << j
+        vectors.append(vec)
+    for dependency in _find_dependencies(vectors):
+        x = y = 1
+        exponents: Counter = Counter()
+        i = 0
+        while dependency:
+            if dependency & 1:
+                u, indices, large = relations[i]
+                x = x * u % n
+                y = y * large % n
+                exponents.update(indices)
+            dependency >>= 1
+            i += 1
+        for j, e in exponents.items():
+            if j:
+                y = y * pow(primes[j - 1], e // 2, n) % n
+        g = math.gcd(x - y, n)
+        if 1 < g < n:
+            return g
+    return None
+
+
+def siqs_factor(n: int, workers: int = 1, seed: int = 0) -> Optional[int]:
+    """
+    Find a nontrivial factor of n with the self-initializing quadratic sieve.
+
+    Args:
+        n: Odd composite that is not a perfect power and has no prime
+            factor in the factor base (trial division has already run).
+        workers: Processes sieving polynomial batches (1 = in-process).
+        seed: Seed for the choice of A coefficients.
+    Returns:
+        A nontrivial factor of n, or None if every dependency was trivial.
+    """
+    k = _choose_multiplier(n)
+    kn = k * n
+    fb_size, large_mult, m = _parameters(kn.bit_length())
+    args = (n, kn, fb_size, large_mult, m)
+    _init_state(*args)
+    for p in _state["primes"]:
+        if n % p == 0 and p < n:
+            return p
+    wanted = fb_size + 1 + SIQS_EXTRA_RELATIONS
+    logger.debug("SIQS: %d digits, k=%d, fb=%d, M=%d", len(str(n)), k, fb_size, m)
+
+    relations: List[Tuple[int, List[int], int]] = []
+    seen = set()
+    partials: Dict[int, Tuple[int, List[int], int]] = {}
+
+    def absorb(batch):
+        full, partial = batch
+        for relation in full:
+            if relation[0] not in seen:
+                seen.add(relation[0])
+                relations.append(relation)
+        for u, indices, large in partial:
+            other = partials.get(large)
+            if other is None:
+                partials[large] = (u, indices, large)
+            elif other[0] != u:
+                # Two partials with the same large prime make a full relation
+                relations.append((u * other[0], indices + other[1], large))
+                instrumentation.incr("siqs.combined_partials")
+
+    pool = (
+        Pool(workers, initializer=_init_worker, initargs=(args,))
+        if workers > 1
+        else None
+    )
+    try:
+        next_seed = seed
+        while True:
+            while len(relations) < wanted:
+                if pool is None:
+                    absorb(_sieve_batch(next_seed))
+                    next_seed += 1
+                else:
+                    batch_seeds = range(next_seed, next_seed + 2 * workers)
+                    for batch in pool.imap_unordered(_sieve_batch, batch_seeds):
+                        absorb(batch)
+                    next_seed += 2 * workers
+            with instrumentation.timer("siqs.linear_algebra"):
+                factor = _combine(relations, n)
+            if factor is not None:
+                instrumentation.incr("siqs.relations", len(relations))
+                return factor
+            wanted = len(relations) + SIQS_EXTRA_RELATIONS
+            if next_seed - seed > 100_000:
+                return None
+    finally:
+        if pool is not None:
+            pool.terminate()
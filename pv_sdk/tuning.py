@@ -0,0 +1,458 @@
+"""
+Machine-calibrated thresholds and chunk sizes for PrimeVox SDK.
+
+The performance-sensitive constants of the SDK (Pollard-Brent's iteration
+budget, the trial-division primes of the primality test, the rho / SIQS
+crossover, the sieve segment size, the default pool size, ...) are looked up
+here instead of being hard-coded at their call sites. Their values come, in
+order of precedence, from:
+
+  1. an explicit argument at the call site (e.g. factor_range(segment_size=...)),
+  2. an active overrides(...) block,
+  3. the tuning profile, a JSON file written by calibrate / ``pvsdk calibrate``,
+  4. the built-in defaults in TUNABLES.
+
+The profile is read once, on first use, from $PVSDK_TUNING_PROFILE or
+$XDG_CONFIG_HOME/pvsdk/tuning.json (~/.config/pvsdk/tuning.json).
+
+calibrate micro-benchmarks the host: sieve throughput per segment size
+(which tracks the cache sizes also recorded from sysfs), Pollard-Brent and
+SIQS speed on this core, process-pool start-up cost and multi-process
+scaling, and derives the settings from those measurements.
+
+Public API:
+  - TUNABLES: Dict[str, int]
+  - get(name: str, override: Optional[int] = None) -> int
+  - overrides(**settings)  context manager
+  - on_change(callback: Callable[[], None]) -> None
+  - profile_path() -> str
+  - load_profile(path: Optional[str] = None) -> Dict[str, int]
+  - save_profile(settings, path=None, measurements=None) -> str
+  - calibrate(quick: bool = False) -> Dict[str, Dict]
+"""
+import json
+import logging
+import math
+import os
+import platform
+import random
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from pv_sdk import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Tunable settings and their built-in defaults
+TUNABLES: Dict[str, int] = {
+    # Iterations of one Pollard-Brent attempt before it restarts
+    "rho_max_iter": 100_000,
+    # Small primes tried by trial division before Miller-Rabin (at most 25)
+    "trial_division_primes": 10,
+    # Smallest composite (in digits) the default strategy hands to SIQS
+    "siqs_min_digits": 30,
+    # Integers per segment of the segmented sieves (CLI, factor_range, aio,
+    # the index builds, rasters, multiplicative tables, nth_prime)
+    "sieve_segment_size": 1 << 20,
+    # Default process-pool size of the CLI engine, AsyncEngine and FactorServer
+    "workers": 1,
+    # create_composite_mappings computes base**exponent below this exponent
+    "composite_exponent_limit": 20,
+}
+
+# Environment variable naming the profile file
+PROFILE_ENV = "PVSDK_TUNING_PROFILE"
+
+# Target duration of one Pollard-Brent attempt when calibrating rho_max_iter
+RHO_ATTEMPT_SECONDS = 0.05
+
+# Segment sizes tried when calibrating sieve_segment_size
+SEGMENT_SIZE_CANDIDATES = tuple(1 << k for k in range(15, 25, 2))
+
+# Trial-division prime counts tried when calibrating trial_division_primes
+TRIAL_DIVISION_CANDIDATES = (4, 10, 16, 25)
+
+# SIQS is only considered for composites in this digit range
+SIQS_DIGIT_RANGE = (20, 60)
+
+_PROFILE_VERSION = 1
+
+# Settings read from the profile (None: not loaded yet)
+_profile: Optional[Dict[str, int]] = None
+
+# Stack of overrides(...) blocks, innermost last
+_overrides: List[Dict[str, int]] = []
+
+# Callbacks run whenever the active profile or the overrides change
+_listeners: List[Callable[[], None]] = []
+
+
+def profile_path() -> str:
+    """The tuning profile location ($PVSDK_TUNING_PROFILE or the config dir)."""
+    path = os.environ.get(PROFILE_ENV)
+    if path:
+        return path
+    config_dir = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        os.path.expanduser("~"), ".config"
+    )
+    return os.path.join(config_dir, "pvsdk", "tuning.json")
+
+
+def _validated(settings: Dict) -> Dict[str, int]:
+    valid = {}
+    for name, value in settings.items():
+        if name not in TUNABLES:
+            logger.warning("Ignoring unknown tuning setting %r", name)
+        elif not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            logger.warning("Ignoring invalid tuning setting %s=%r", name, value)
+        else:
+            valid[name] = value
+    return valid
+
+
+def load_profile(path: Optional[str] = None) -> Dict[str, int]:
+    """
+    (Re)load the tuning profile and make it the active one.
+
+    A missing file leaves the built-in defaults in effect; an unreadable one
+    is logged and ignored.
+
+    Args:
+        path (str, optional): Profile file (default: profile_path()).
+
+    Returns:
+        Dict[str, int]: The settings read from the profile.
+    """
+    global _profile
+
+    path = path or profile_path()
+    settings: Dict[str, int] = {}
+    try:
+        with open(path) as f:
+            settings = _validated(json.load(f).get("settings", {}))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, AttributeError) as error:
+        logger.warning("Ignoring unreadable tuning profile %s: %s", path, error)
+    _profile = settings
+    _changed()
+    return dict(settings)
+
+
+def save_profile(
+    settings: Dict[str, int],
+    path: Optional[str] = None,
+    measurements: Optional[Dict] = None,
+) -> str:
+    """
+    Write a tuning profile (atomically) and make it the active one.
+
+    Args:
+        settings (Dict[str, int]): Values for names in TUNABLES.
+        path (str, optional): Profile file (default: profile_path()).
+        measurements (Dict, optional): Calibration data stored alongside.
+
+    Returns:
+        str: The path written.
+    """
+    global _profile
+
+    path = path or profile_path()
+    settings = _validated(settings)
+    data = {
+        "version": _PROFILE_VERSION,
+        "host": platform.node(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "settings": settings,
+        "measurements": measurements or {},
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+    _profile = settings
+    _changed()
+    return path
+
+
+def get(name: str, override: Optional[int] = None) -> int:
+    """
+    The value of a tunable setting.
+
+    Args:
+        name (str): A key of TUNABLES.
+        override (int, optional): Per-call value; returned as is when given.
+
+    Returns:
+        int: The override, else the innermost overrides(...) value, else the
+        profile value, else the built-in default.
+    """
+    default = TUNABLES[name]
+    if override is not None:
+        return override
+    for settings in reversed(_overrides):
+        if name in settings:
+            return settings[name]
+    if _profile is None:
+        load_profile()
+    return _profile.get(name, default)
+
+
+def on_change(callback: Callable[[], None]) -> None:
+    """
+    Call callback whenever the profile is (re)loaded or overrides change.
+
+    Hot paths use it to drop values they derived from get() instead of
+    resolving a setting on every call.
+    """
+    _listeners.append(callback)
+
+
+def _changed() -> None:
+    for callback in _listeners:
+        callback()
+
+
+@contextmanager
+def overrides(**settings: int):
+    """
+    Temporarily override tunable settings in this process.
+
+    Example:
+        with tuning.overrides(rho_max_iter=1 << 20):
+            factor(n)
+    """
+    _overrides.append(_validated(settings))
+    _changed()
+    try:
+        yield
+    finally:
+        _overrides.pop()
+        _changed()
+
+
+# —— Calibration ——
+def _cache_sizes() -> Dict[str, int]:
+    """CPU cache sizes in bytes from Linux sysfs, e.g. {"L1d": 49152, ...}."""
+    sizes = {}
+    base = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        entries = sorted(os.listdir(base))
+    except OSError:
+        return sizes
+    for entry in entries:
+        try:
+            with open(os.path.join(base, entry, "level")) as f:
+                level = f.read().strip()
+            with open(os.path.join(base, entry, "type")) as f:
+                kind = f.read().strip()
+            with open(os.path.join(base, entry, "size")) as f:
+                size = f.read().strip()
+        except OSError:
+            continue
+        suffix = {"Data": "d", "Instruction": "i"}.get(kind, "")
+        scale = {"K": 1 << 10, "M": 1 << 20}.get(size[-1:], 1)
+        sizes[f"L{level}{suffix}"] = int(size.rstrip("KM")) * scale
+    return sizes
+
+
+def _usable_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _best_of(func, rounds: int) -> float:
+    """Fastest of several timed calls, in seconds."""
+    best = math.inf
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _sieve_span(lo: int, span: int, segment_size: int) -> None:
+    from pv_sdk.prime import _segment_primes, _sieve_primes
+
+    base_primes = _sieve_primes(math.isqrt(lo + span))
+    for start in range(lo, lo + span, segment_size):
+        _segment_primes(start, min(start + segment_size, lo + span), base_primes)
+
+
+def _calibrate_segment_size(span: int, rounds: int) -> Dict[int, float]:
+    """Sieve throughput (integers per second) per candidate segment size."""
+    lo = 10**10
+    return {
+        size: span / _best_of(lambda: _sieve_span(lo, span, size), rounds)
+        for size in SEGMENT_SIZE_CANDIDATES
+    }
+
+
+def _random_prime(digits: int, rng: random.Random) -> int:
+    from pv_sdk.factoring import _is_prime
+
+    while True:
+        candidate = rng.randrange(10 ** (digits - 1), 10**digits) | 1
+        if _is_prime(candidate):
+            return candidate
+
+
+def _rho_rate() -> float:
+    """Pollard-Brent iterations per second on a composite it cannot split."""
+    from pv_sdk.factoring import _pollards_rho_brent
+
+    rng = random.Random(0)
+    n = _random_prime(20, rng) * _random_prime(20, rng)
+    with instrumentation.collect_metrics() as metrics:
+        seconds = _best_of(lambda: _pollards_rho_brent(n, 1 << 16), 3)
+    # Iterations of the three calls together
+    iterations = metrics.as_dict()["counters"]["factoring.rho_iterations"] / 3
+    return iterations / seconds
+
+
+def _siqs_seconds(digits: int, samples: int) -> float:
+    """Median single-process SIQS time on balanced semiprimes of this size."""
+    from pv_sdk.siqs import siqs_factor
+
+    rng = random.Random(digits)
+    times = []
+    for _ in range(samples):
+        half = digits // 2
+        n = _random_prime(half, rng) * _random_prime(digits - half, rng)
+        times.append(_best_of(lambda: siqs_factor(n), 1))
+    return sorted(times)[len(times) // 2]
+
+
+def _siqs_crossover(rho_rate: float, siqs_times: Dict[int, float]) -> int:
+    """
+    Smallest digit count at which SIQS beats Pollard-Brent on a balanced
+    semiprime (expected ~1.25 * 10^(d/4) rho iterations), extrapolating the
+    measured SIQS times geometrically.
+    """
+    (d0, t0), (d1, t1) = min(siqs_times.items()), max(siqs_times.items())
+    growth = (t1 / t0) ** (1 / (d1 - d0)) if d1 > d0 and t1 > t0 else 1.19
+    lo, hi = SIQS_DIGIT_RANGE
+    for digits in range(lo, hi + 1):
+        siqs = t0 * growth ** (digits - d0)
+        rho = 1.25 * 10 ** (digits / 4) / rho_rate
+        if siqs < rho:
+            return digits
+    return hi
+
+
+def _trial_division_times(rounds: int) -> Dict[int, float]:
+    """Seconds per _is_prime call on random odd integers, per prime count."""
+    from pv_sdk.factoring import _is_prime
+
+    rng = random.Random(0)
+    numbers = [rng.randrange(1, 1 << 62) | 1 for _ in range(2000)]
+
+    def run():
+        for n in numbers:
+            _is_prime(n)
+
+    times = {}
+    for count in TRIAL_DIVISION_CANDIDATES:
+        with overrides(trial_division_primes=count):
+            times[count] = _best_of(run, rounds) / len(numbers)
+    return times
+
+
+def _pool_startup_seconds() -> float:
+    from multiprocessing import Pool
+
+    def start():
+        with Pool(2) as pool:
+            pool.map(abs, range(2))
+
+    return _best_of(start, 2)
+
+
+def _sieve_task(bounds) -> int:
+    from pv_sdk.prime import _segment_primes
+
+    return len(_segment_primes(*bounds))
+
+
+def _pool_throughput(workers: int, tasks: int, segment_size: int) -> float:
+    """Integers sieved per second by a fresh pool, start-up included."""
+    from multiprocessing import Pool
+
+    lo = 10**10
+    bounds = [
+        (lo + i * segment_size, lo + (i + 1) * segment_size) for i in range(tasks)
+    ]
+    started = time.perf_counter()
+    if workers == 1:
+        for task in bounds:
+            _sieve_task(task)
+    else:
+        with Pool(workers) as pool:
+            pool.map(_sieve_task, bounds)
+    return tasks * segment_size / (time.perf_counter() - started)
+
+
+def _calibrate_workers(segment_size: int, tasks_per_worker: int) -> Dict[int, float]:
+    cpus = _usable_cpus()
+    candidates = sorted({1, cpus} | {1 << k for k in range(cpus.bit_length())})
+    return {
+        workers: _pool_throughput(
+            workers, tasks_per_worker * max(cpus, 2), segment_size
+        )
+        for workers in candidates
+        if workers <= cpus
+    }
+
+
+def calibrate(quick: bool = False) -> Dict[str, Dict]:
+    """
+    Micro-benchmark this host and derive tuning settings.
+
+    Takes a few seconds with quick=True and some tens of seconds otherwise.
+    composite_exponent_limit changes results, not just speed, so it is left
+    at its default.
+
+    Args:
+        quick (bool): Use smaller workloads and fewer repetitions.
+
+    Returns:
+        Dict[str, Dict]: {"settings": ..., "measurements": ...}; pass both to
+        save_profile to persist them.
+    """
+    rounds = 1 if quick else 3
+    with instrumentation.timer("tuning.calibrate"):
+        throughput = _calibrate_segment_size(1 << (22 if quick else 24), rounds)
+        segment_size = max(throughput, key=throughput.get)
+
+        rho_rate = _rho_rate()
+        rho_max_iter = 1 << round(math.log2(rho_rate * RHO_ATTEMPT_SECONDS))
+
+        siqs_digits = (24, 30) if quick else (26, 32, 38)
+        siqs_times = {d: _siqs_seconds(d, 1 if quick else 3) for d in siqs_digits}
+
+        trial_times = _trial_division_times(rounds)
+        pool_startup = _pool_startup_seconds()
+        scaling = _calibrate_workers(segment_size, 2 if quick else 8)
+
+    settings = {
+        "rho_max_iter": rho_max_iter,
+        "trial_division_primes": min(trial_times, key=trial_times.get),
+        "siqs_min_digits": _siqs_crossover(rho_rate, siqs_times),
+        "sieve_segment_size": segment_size,
+        "workers": max(scaling, key=scaling.get),
+    }
+    measurements = {
+        "cpus": _usable_cpus(),
+        "cache_bytes": _cache_sizes(),
+        "sieve_integers_per_second": {str(k): v for k, v in throughput.items()},
+        "rho_iterations_per_second": rho_rate,
+        "siqs_seconds": {str(k): v for k, v in siqs_times.items()},
+        "is_prime_seconds": {str(k): v for k, v in trial_times.items()},
+        "pool_startup_seconds": pool_startup,
+        "pool_integers_per_second": {str(k): v for k, v in scaling.items()},
+    }
+    return {"settings": settings, "measurements": measurements}
@@ -1,21 +1,38 @@
 import csv
-from typing import List, Tuple
+import math
+from typing import TYPE_CHECKING, List, Mapping, Optional, Tuple
 
-from sympy import isprime, primerange
+from pv_sdk import instrumentation
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def is_twin_prime(p1: int, p2: int) -> bool:
+    from pv_sdk.prime_bitmap import PrimeBitmap
+
+
+def is_twin_prime(p1: int, p2: int, bitmap: Optional["PrimeBitmap"] = None) -> bool:
     """
     Check clearly if two prime numbers form a twin prime pair.
 
     Args:
         p1 (int): First prime number.
         p2 (int): Second prime number.
+        bitmap (PrimeBitmap, optional): Index from pv_sdk.prime_bitmap
+            covering both numbers, for an O(1) lookup instead of two
+            primality tests.
 
     Returns:
         bool: True if twin primes; False otherwise.
     """
-    return abs(p1 - p2) == 2 and isprime(p1) and isprime(p2)
+    instrumentation.incr("twin_primes.membership_checks")
+    if abs(p1 - p2) != 2:
+        return False
+    if bitmap is not None:
+        return bitmap.is_prime(p1) and bitmap.is_prime(p2)
+
+    from sympy import isprime
+
+    return isprime(p1) and isprime(p2)
 
 
 def find_twin_primes(limit: int) -> List[Tuple[int, int]]:
@@ -28,15 +45,54 @@ def find_twin_primes(limit: int) -> List[Tuple[int, int]]:
     Returns:
         List[Tuple[int, int]]: List of clearly structured twin-prime pairs.
     """
-    primes = list(primerange(2, limit + 1))
-    twin_prime_pairs = [
-        (primes[i], primes[i + 1])
-        for i in range(len(primes) - 1)
-        if primes[i + 1] - primes[i] == 2
-    ]
+    from sympy import primerange
+
+    with instrumentation.timer("twin_primes.find_twin_primes"):
+        primes = list(primerange(2, limit + 1))
+        twin_prime_pairs = [
+            (primes[i], primes[i + 1])
+            for i in range(len(primes) - 1)
+            if primes[i + 1] - primes[i] == 2
+        ]
+    instrumentation.incr("twin_primes.primes_scanned", len(primes))
+    instrumentation.incr("twin_primes.pairs_found", len(twin_prime_pairs))
     return twin_prime_pairs
 
 
+def twin_primes_in_segment(
+    lo: int, hi: int, tables: Optional[Mapping[str, "np.ndarray"]] = None
+) -> "np.ndarray":
+    """
+    Sieve the first members of the twin-prime pairs (p, p + 2) with lo <= p < hi.
+
+    Args:
+        lo (int): Inclusive start of the segment.
+        hi (int): Exclusive end of the segment.
+        tables (Mapping, optional): Prebuilt tables such as a
+            shared_tables.SharedPrimeTables handle, whose "primes" must reach
+            isqrt(hi + 1); sieved on demand when omitted.
+
+    Returns:
+        np.ndarray: The first members p, in increasing order.
+
+    Raises:
+        ValueError: If tables["primes"] stops short of isqrt(hi + 1).
+    """
+    from pv_sdk.factoring import _table_primes
+    from pv_sdk.prime import _segment_primes, _sieve_primes
+
+    if tables is not None:
+        base_primes = _table_primes(tables, math.isqrt(hi + 1))
+    else:
+        base_primes = _sieve_primes(math.isqrt(hi + 1))
+    # Two extra integers decide whether the last primes start a pair
+    primes = _segment_primes(lo, hi + 2, base_primes)
+    firsts = primes[:-1][primes[1:] - primes[:-1] == 2]
+    firsts = firsts[firsts < hi]
+    instrumentation.incr("twin_primes.pairs_found", len(firsts))
+    return firsts
+
+
 def save_twin_primes_to_csv(
     twin_primes: List[Tuple[int, int]], filepath="twin_primes.csv"
 ):
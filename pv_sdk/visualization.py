@@ -1,13 +1,31 @@
-from typing import Dict, List
+import math
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import matplotlib.pyplot as plt
-import networkx as nx
-from networkx.algorithms.community import girvan_newman
+from pv_sdk import tuning
+
+if TYPE_CHECKING:
+    import networkx as nx
+    import numpy as np
+
+# Raster functions compute this many image rows (or, per the tuned
+# sieve_segment_size, integers) at a time, so their temporaries stay bounded
+# whatever the image size
+RASTER_BAND_ROWS = 256
+
+# Colors of the vowel classes, shared by the node-link and raster views
+VOWEL_COLORS = {
+    "A": "red",
+    "E": "blue",
+    "I": "green",
+    "O": "orange",
+    "U": "purple",
+    "Y": "gray",
+}
 
 
 def graphical_representation_with_labels(
     primes: List[int], vowel_mappings: List[str], output_file="prime_vowel_graph.png"
-) -> nx.Graph:
+) -> "nx.Graph":
     """
     Visualize prime-vowel mappings with explicit labels and save to a specified file.
 
@@ -19,17 +37,13 @@ def graphical_representation_with_labels(
     Returns:
         nx.Graph: The constructed NetworkX graph.
     """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     graph = nx.Graph()
 
     # Define node colors according to vowel assignments
-    color_map = {
-        "A": "red",
-        "E": "blue",
-        "I": "green",
-        "O": "orange",
-        "U": "purple",
-        "Y": "gray",
-    }
+    color_map = VOWEL_COLORS
 
     vowel_groups = {}
     for prime, vowel in zip(primes, vowel_mappings):
@@ -76,7 +90,7 @@ def graphical_representation_with_labels(
     return graph
 
 
-def detect_graph_communities(graph: nx.Graph) -> List[List[int]]:
+def detect_graph_communities(graph: "nx.Graph") -> List[List[int]]:
     """
     Detect and return communities within a graph using Girvan-Newman algorithm.
 
@@ -86,12 +100,14 @@ def detect_graph_communities(graph: nx.Graph) -> List[List[int]]:
     Returns:
         List[List[int]]: Detected communities represented as lists of nodes.
     """
+    from networkx.algorithms.community import girvan_newman
+
     communities_generator = girvan_newman(graph)
     communities = next(communities_generator)
     return [list(community) for community in communities]
 
 
-def calculate_centrality_measures(graph: nx.Graph) -> Dict[str, Dict[int, float]]:
+def calculate_centrality_measures(graph: "nx.Graph") -> Dict[str, Dict[int, float]]:
     """
     Calculates centrality measures (degree, betweenness, closeness).
 
@@ -101,6 +117,8 @@ def calculate_centrality_measures(graph: nx.Graph) -> Dict[str, Dict[int, float]
     Returns:
         Dict[str, Dict[int, float]]: A dictionary of centrality dictionaries.
     """
+    import networkx as nx
+
     return {
         "degree_centrality": nx.degree_centrality(graph),
         "betweenness_centrality": nx.betweenness_centrality(graph),
@@ -108,6 +126,176 @@ def calculate_centrality_measures(graph: nx.Graph) -> Dict[str, Dict[int, float]
     }
 
 
+def _prime_bitmap(lo: int, hi: int, base_primes=None) -> "np.ndarray":
+    """Boolean array whose entry i tells whether lo + i is prime, for [lo, hi)."""
+    import numpy as np
+
+    from pv_sdk.prime import _segment_primes
+
+    bitmap = np.zeros(max(hi - lo, 0), dtype=bool)
+    bitmap[_segment_primes(lo, hi, base_primes) - lo] = True
+    return bitmap
+
+
+def _spiral_values(x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+    """
+    Position of each (x, y) along the square spiral that starts with 1 at
+    the origin and turns counter-clockwise: (1, 0) -> 2, (1, 1) -> 3, ...
+    """
+    import numpy as np
+
+    k = np.maximum(np.abs(x), np.abs(y))
+    corner = (2 * k + 1) ** 2  # value at (k, -k), where ring k ends
+    return np.select(
+        [y == -k, x == -k, y == k],
+        [corner - (k - x), corner - 3 * k - y, corner - 5 * k - x],
+        default=corner - 7 * k + y,
+    )
+
+
+def ulam_spiral(size: int, start: int = 1) -> "np.ndarray":
+    """
+    Primality of the integers on a size x size Ulam spiral.
+
+    Args:
+        size (int): Image width and height in cells.
+        start (int): Integer at the center of the spiral.
+
+    Returns:
+        np.ndarray: Boolean image, True where the integer is prime (row 0
+        is the top of the spiral).
+    """
+    import numpy as np
+
+    from pv_sdk.prime import _sieve_primes
+
+    center = (size - 1) // 2
+    # For even sizes the outermost ring is only partly on the image
+    outer = size - 1 - center
+    hi = start + (2 * outer + 1) ** 2
+    base_primes = _sieve_primes(math.isqrt(max(hi - 1, 1)))
+    bitmap = _prime_bitmap(start, hi, base_primes)
+    x = np.arange(size, dtype=np.int64) - center
+    image = np.empty((size, size), dtype=bool)
+    for top in range(0, size, RASTER_BAND_ROWS):
+        rows = np.arange(top, min(top + RASTER_BAND_ROWS, size), dtype=np.int64)
+        values = _spiral_values(x[None, :], (center - rows)[:, None])
+        image[top : top + len(rows)] = bitmap[values - 1]
+    return image
+
+
+def vowel_class_grid(lo: int, width: int, height: int) -> "np.ndarray":
+    """
+    Vowel class of every integer in a row-major width x height grid.
+
+    Args:
+        lo (int): Integer in the top-left cell.
+        width (int): Cells per row.
+        height (int): Rows.
+
+    Returns:
+        np.ndarray: int8 image; 0 for composites, otherwise 1 + the index of
+        the prime's vowel (pv_sdk.prime.prime_to_vowel) in VOWEL_COLORS.
+    """
+    import numpy as np
+
+    from pv_sdk.prime import PRIME_VOWEL_MAP
+
+    vowels = list(VOWEL_COLORS)
+    # Class code per last digit; 2 and 5 are the only primes ending in 2 or 5
+    by_digit = np.zeros(10, dtype=np.int8)
+    for digit, vowel in PRIME_VOWEL_MAP.items():
+        by_digit[digit] = 1 + vowels.index(vowel)
+
+    hi = lo + width * height
+    image = np.zeros(width * height, dtype=np.int8)
+    segment_size = tuning.get("sieve_segment_size")
+    for start in range(lo, hi, segment_size):
+        stop = min(start + segment_size, hi)
+        bitmap = _prime_bitmap(start, stop)
+        offsets = np.flatnonzero(bitmap)
+        image[start - lo + offsets] = by_digit[(start + offsets) % 10]
+    return image.reshape(height, width)
+
+
+def residue_heatmap(hi: int, modulus: int, bins: int, lo: int = 2) -> "np.ndarray":
+    """
+    Count primes per residue class and range bin.
+
+    Args:
+        hi (int): Exclusive end of the range.
+        modulus (int): Residues 0 .. modulus - 1 form the rows.
+        bins (int): Equal-width range bins over [lo, hi) form the columns.
+        lo (int): Inclusive start of the range.
+
+    Returns:
+        np.ndarray: int64 array of shape (modulus, bins).
+    """
+    import numpy as np
+
+    from pv_sdk.prime import _segment_primes, _sieve_primes
+
+    if modulus < 1 or bins < 1:
+        raise ValueError("modulus and bins must be positive.")
+    counts = np.zeros(modulus * bins, dtype=np.int64)
+    width = max(hi - lo, 1) / bins
+    base_primes = _sieve_primes(math.isqrt(max(hi - 1, 1)))
+    segment_size = tuning.get("sieve_segment_size")
+    for start in range(lo, hi, segment_size):
+        primes = _segment_primes(start, min(start + segment_size, hi), base_primes)
+        columns = np.minimum(((primes - lo) / width).astype(np.int64), bins - 1)
+        counts += np.bincount(
+            (primes % modulus) * bins + columns, minlength=modulus * bins
+        )
+    return counts.reshape(modulus, bins)
+
+
+def save_raster(
+    image: "np.ndarray",
+    output_file: str,
+    cmap=None,
+    title: Optional[str] = None,
+):
+    """
+    Write a raster image to PNG with matplotlib's Agg renderer.
+
+    Without a title the array is written one cell per pixel (plt.imsave),
+    which is the fast path for large images; with a title it is drawn with
+    imshow, axes and a colorbar. Neither touches the pyplot backend.
+
+    Args:
+        image (np.ndarray): 2-D array from ulam_spiral, vowel_class_grid or
+            residue_heatmap.
+        output_file (str): PNG path.
+        cmap: Matplotlib colormap (name or object). Defaults to the vowel
+            colors for int8 class grids and "gray_r" otherwise.
+        title (Optional[str]): Figure title.
+    """
+    from matplotlib.colors import ListedColormap
+    from matplotlib.figure import Figure
+    from matplotlib.image import imsave
+
+    vmin = vmax = None
+    if cmap is None and image.dtype.name == "int8":
+        cmap = ListedColormap(["white", *VOWEL_COLORS.values()])
+        vmin, vmax = 0, len(VOWEL_COLORS)
+    elif cmap is None:
+        cmap = "gray_r"
+
+    if title is None:
+        imsave(output_file, image, cmap=cmap, vmin=vmin, vmax=vmax)
+        return
+    # A bare Figure renders with Agg without touching the pyplot backend
+    fig = Figure(figsize=(10, 10 * image.shape[0] / image.shape[1]))
+    ax = fig.subplots()
+    shown = ax.imshow(
+        image, cmap=cmap, vmin=vmin, vmax=vmax, interpolation="nearest", aspect="auto"
+    )
+    fig.colorbar(shown, ax=ax)
+    ax.set_title(title)
+    fig.savefig(output_file, dpi=150, bbox_inches="tight")
+
+
 def interactive_visualization():
     """Interactive visualization and analysis tool for quick validation."""
     primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
@@ -0,0 +1,264 @@
+"""
+Incrementally maintained prime-vowel graph and its analytics.
+
+graphical_representation_with_labels joins two primes exactly when they share
+a vowel, so the graph is a disjoint union of cliques, one per vowel class.
+Every statistic analyze_graph_properties and calculate_centrality_measures
+report therefore follows from the class sizes alone: a node in a class of
+size s has degree s - 1, zero betweenness and closeness (s - 1) / (n - 1),
+each class is one maximal clique and one connected component.
+
+PrimeVowelGraph keeps the classes and updates the size-based statistics in
+O(new primes) per append instead of rebuilding the graph and rerunning the
+NetworkX algorithms. Per-node results are cached and only the parts an append
+invalidates are recomputed: betweenness just gains entries for the new nodes,
+while degree and closeness centralities, whose normalization depends on the
+node count, are rebuilt lazily on the next request. The explicit NetworkX
+graph is only built on demand, and then extended edge by edge.
+
+The state (primes and their vowels) persists to JSON, so a run can reload
+the previous graph and append only the primes above its limit.
+
+Public API:
+  - PrimeVowelGraph(primes: List[int] = (), vowel_mappings: List[str] = ())
+  - PrimeVowelGraph.add_primes(primes, vowel_mappings) -> int
+  - PrimeVowelGraph.extend_to(limit: int) -> int
+  - PrimeVowelGraph.properties() -> Dict
+  - PrimeVowelGraph.communities() -> List[List[int]]
+  - PrimeVowelGraph.centralities() -> Dict[str, Dict[int, float]]
+  - PrimeVowelGraph.save(path: str) / PrimeVowelGraph.load(path: str)
+"""
+import json
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from pv_sdk import instrumentation
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+class PrimeVowelGraph:
+    """
+    The graph of primes joined by shared vowel mapping, kept up to date as
+    primes are appended.
+    """
+
+    def __init__(self, primes: Iterable[int] = (), vowel_mappings: Iterable[str] = ()):
+        """
+        Create a graph, optionally seeded with primes and their vowels.
+
+        Args:
+            primes (Iterable[int]): Initial primes.
+            vowel_mappings (Iterable[str]): Vowel of each initial prime.
+        """
+        self.limit = 0
+        self._vowel_of: Dict[int, str] = {}
+        self._classes: Dict[str, List[int]] = {}
+        self._edges = 0
+        self._graph: Optional["nx.Graph"] = None
+        # Per-node results kept between appends; see _invalidate
+        self._betweenness: Dict[int, float] = {}
+        self._scaled: Dict[str, Dict[int, float]] = {}
+        self.add_primes(primes, vowel_mappings)
+
+    def __len__(self) -> int:
+        return len(self._vowel_of)
+
+    def __contains__(self, prime: int) -> bool:
+        return prime in self._vowel_of
+
+    def add_primes(self, primes: Iterable[int], vowel_mappings: Iterable[str]) -> int:
+        """
+        Append primes, updating the statistics in O(len(primes)).
+
+        Args:
+            primes (Iterable[int]): Primes to add; ones already present are skipped.
+            vowel_mappings (Iterable[str]): Vowel of each prime.
+
+        Returns:
+            int: Number of primes added.
+        """
+        added = []
+        for prime, vowel in zip(primes, vowel_mappings):
+            if prime in self._vowel_of:
+                continue
+            members = self._classes.setdefault(vowel, [])
+            self._edges += len(members)
+            if self._graph is not None:
+                self._graph.add_node(prime)
+                self._graph.add_edges_from((prime, other) for other in members)
+            members.append(prime)
+            self._vowel_of[prime] = vowel
+            self.limit = max(self.limit, prime)
+            added.append(prime)
+        if added:
+            self._invalidate(added)
+        instrumentation.incr("vowel_graph.primes_added", len(added))
+        return len(added)
+
+    def extend_to(self, limit: int) -> int:
+        """
+        Add the primes in (self.limit, limit], mapped with prime.prime_to_vowel.
+
+        Args:
+            limit (int): New inclusive prime limit.
+
+        Returns:
+            int: Number of primes added.
+        """
+        from pv_sdk.prime import _segment_primes, prime_to_vowel
+
+        if limit <= self.limit:
+            return 0
+        new_primes = _segment_primes(self.limit + 1, limit + 1).tolist()
+        added = self.add_primes(new_primes, (prime_to_vowel(p) for p in new_primes))
+        self.limit = limit
+        return added
+
+    def _invalidate(self, added: List[int]) -> None:
+        # Betweenness is 0 inside a clique whatever the sizes, so old entries
+        # stay valid; degree and closeness are normalized by the node count.
+        for prime in added:
+            self._betweenness[prime] = 0.0
+        self._scaled.clear()
+
+    def class_sizes(self) -> Dict[str, int]:
+        """Number of primes per vowel class."""
+        return {vowel: len(members) for vowel, members in self._classes.items()}
+
+    def number_of_edges(self) -> int:
+        return self._edges
+
+    def degree_histogram(self) -> Dict[int, int]:
+        """Number of nodes per degree, in O(number of classes)."""
+        histogram: Dict[int, int] = {}
+        for members in self._classes.values():
+            degree = len(members) - 1
+            histogram[degree] = histogram.get(degree, 0) + len(members)
+        return histogram
+
+    def properties(self, per_node: bool = True) -> Dict:
+        """
+        The statistics of analyze_graph_properties, from the class sizes.
+
+        Args:
+            per_node (bool): Include the per-node degree_distribution, which
+                costs O(nodes); the other entries cost O(classes).
+
+        Returns:
+            Dict: connectivity, degree_distribution, total_cliques,
+            maximal_cliques_count and avg_degree as in
+            analyze_graph_properties, plus components, degree_histogram and
+            vowel_class_sizes.
+        """
+        n = len(self)
+        sizes = self.class_sizes()
+        result = {
+            "connectivity": len(sizes) == 1,
+            "degree_distribution": {},
+            # Every node lies in exactly one maximal clique: its class
+            "total_cliques": n,
+            "maximal_cliques_count": len(sizes),
+            "avg_degree": 2 * self._edges / n if n else 0.0,
+            "components": len(sizes),
+            "degree_histogram": self.degree_histogram(),
+            "vowel_class_sizes": sizes,
+        }
+        if per_node:
+            result["degree_distribution"] = {
+                prime: len(self._classes[vowel]) - 1
+                for prime, vowel in self._vowel_of.items()
+            }
+        return result
+
+    def communities(self) -> List[List[int]]:
+        """The vowel classes, which are the graph's connected components."""
+        return [list(members) for members in self._classes.values()]
+
+    def centralities(self) -> Dict[str, Dict[int, float]]:
+        """
+        The centralities of calculate_centrality_measures.
+
+        Returns:
+            Dict[str, Dict[int, float]]: degree_centrality,
+            betweenness_centrality and closeness_centrality per prime.
+        """
+        if not self._scaled:
+            n = len(self)
+            scale = 1.0 / (n - 1) if n > 1 else 0.0
+            degree = {
+                prime: (len(self._classes[vowel]) - 1) * scale
+                for prime, vowel in self._vowel_of.items()
+            }
+            if n == 1:
+                # NetworkX's convention for the single-node graph
+                degree = {prime: 1.0 for prime in degree}
+            self._scaled = {
+                "degree_centrality": degree,
+                # In a clique both equal (s - 1) / (n - 1)
+                "closeness_centrality": dict(degree)
+                if n > 1
+                else {prime: 0.0 for prime in degree},
+            }
+            instrumentation.incr("vowel_graph.centrality_rebuilds")
+        return {
+            "degree_centrality": dict(self._scaled["degree_centrality"]),
+            "betweenness_centrality": dict(self._betweenness),
+            "closeness_centrality": dict(self._scaled["closeness_centrality"]),
+        }
+
+    @property
+    def graph(self) -> "nx.Graph":
+        """The explicit NetworkX graph, built once and then extended on append."""
+        if self._graph is None:
+            import networkx as nx
+
+            graph = nx.Graph()
+            graph.add_nodes_from(self._vowel_of)
+            for members in self._classes.values():
+                graph.add_edges_from(
+                    (members[i], members[j])
+                    for i in range(len(members))
+                    for j in range(i + 1, len(members))
+                )
+            self._graph = graph
+        return self._graph
+
+    def save(self, path: str) -> None:
+        """
+        Persist the graph to a JSON file (written atomically).
+
+        Args:
+            path (str): Output file.
+        """
+        data = {"limit": self.limit, "classes": self._classes}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PrimeVowelGraph":
+        """
+        Load a graph written by save, or return an empty one if path is missing.
+
+        Args:
+            path (str): File written by save.
+
+        Returns:
+            PrimeVowelGraph: The restored graph.
+        """
+        graph = cls()
+        if not os.path.exists(path):
+            return graph
+        with open(path) as f:
+            data = json.load(f)
+        entries = sorted(
+            (prime, vowel)
+            for vowel, members in data["classes"].items()
+            for prime in members
+        )
+        graph.add_primes((p for p, _ in entries), (v for _, v in entries))
+        graph.limit = data["limit"]
+        return graph
@@ -0,0 +1,368 @@
+"""
+Persisted inverted index over the vowel notation of a prime range.
+
+The vowel notation of pv_sdk.factoring.prime_to_vowel_notation rewrites the
+odd decimal digits 1, 3, 5, 7, 9 as A, E, Y, I, O and keeps the even digits,
+so it is a one-to-one recoding of the decimal digits (2 alone is spelled
+"U"). A notation pattern therefore maps to exactly one digit pattern, and the
+index works on digits:
+
+  - prefix queries binary-search the sorted prime array once per digit
+    length, since the primes starting with a digit string d and having L
+    digits form the contiguous value range [d * 10^k, (d + 1) * 10^k);
+  - substring queries intersect posting lists of digit n-grams (one sorted
+    list of prime positions per n-gram, stored CSR-style as an offsets and a
+    postings array) and verify longer patterns with vectorized digit checks.
+
+build_vowel_index writes the arrays as .npy files in two segmented passes
+(count n-grams, then fill), so building never holds the postings in memory;
+open_vowel_index memory-maps them.
+
+The older notation of pv_sdk.prime_vowel_factorizer writes every even digit
+as "1" and so cannot be inverted; its vowel-only patterns mean the same in
+both notations.
+
+Directory layout:
+  primes.npy    sorted primes in [lo, hi)
+  offsets.npy   postings of n-gram g are postings[offsets[g]:offsets[g + 1]]
+  postings.npy  positions in primes.npy, ascending within each n-gram
+  meta.json     index parameters (written last; marks the index complete)
+
+Public API:
+  - build_vowel_index(index_dir: str, hi: int, lo: int = 2, ...) -> VowelIndex
+  - open_vowel_index(index_dir: str) -> VowelIndex
+  - VowelIndex.starts_with(pattern: str) -> np.ndarray
+  - VowelIndex.contains(pattern: str) -> np.ndarray
+"""
+import json
+import math
+import os
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from pv_sdk import instrumentation, tuning
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Digits per indexed n-gram; 10^n posting lists
+VOWEL_INDEX_GRAM_SIZE = 3
+
+_INDEX_VERSION = 1
+
+# Inverse of pv_sdk.factoring._digit_to_vowel; even digits stand for themselves
+_VOWEL_TO_DIGIT = {"A": "1", "E": "3", "Y": "5", "I": "7", "O": "9"}
+_VOWEL_TO_DIGIT.update({d: d for d in "02468"})
+
+
+def _pattern_digits(pattern: str) -> str:
+    """Translate a vowel-notation pattern into the equivalent digit string."""
+    try:
+        return "".join(_VOWEL_TO_DIGIT[c] for c in pattern.upper())
+    except KeyError:
+        raise ValueError(
+            f"invalid vowel-notation pattern {pattern!r} "
+            "(use A, E, Y, I, O, U and the digits 0, 2, 4, 6, 8)"
+        ) from None
+
+
+def _digit_lengths(values: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    powers = np.array([10**k for k in range(1, 20)], dtype=np.uint64)
+    return np.searchsorted(powers, values, side="right") + 1
+
+
+def _length_groups(values: "np.ndarray") -> Iterator[Tuple[int, int, int]]:
+    """Yield (digit length, start, stop) for the runs of a sorted array."""
+    import numpy as np
+
+    lengths = _digit_lengths(values)
+    for length in np.unique(lengths).tolist():
+        start, stop = np.searchsorted(lengths, [length, length + 1])
+        yield length, int(start), int(stop)
+
+
+def _gram_keys(primes: "np.ndarray", gram_size: int) -> "np.ndarray":
+    """
+    Sorted, de-duplicated keys gram * len(primes) + i for every n-gram of the
+    decimal digits of primes[i].
+    """
+    import numpy as np
+
+    modulus = np.uint64(10**gram_size)
+    keys: List["np.ndarray"] = []
+    for length, start, stop in _length_groups(primes):
+        if length < gram_size:
+            continue
+        block = primes[start:stop]
+        positions = np.arange(start, stop, dtype=np.int64)
+        for shift in range(length - gram_size + 1):
+            grams = (block // np.uint64(10**shift)) % modulus
+            keys.append(grams.astype(np.int64) * len(primes) + positions)
+    if not keys:
+        return np.empty(0, dtype=np.int64)
+    keys = np.sort(np.concatenate(keys))
+    # A gram repeated inside one prime ("1111") is posted once
+    return keys[np.concatenate(([True], np.diff(keys) != 0))]
+
+
+def _prime_chunks(lo: int, hi: int, segment_size: int) -> Iterator["np.ndarray"]:
+    import numpy as np
+
+    from pv_sdk.prime import _segment_primes, _sieve_primes
+
+    base_primes = _sieve_primes(math.isqrt(max(hi - 1, 1)))
+    for start in range(lo, hi, segment_size):
+        primes = _segment_primes(start, min(start + segment_size, hi), base_primes)
+        yield primes.astype(np.uint64)
+
+
+def build_vowel_index(
+    index_dir: str,
+    hi: int,
+    lo: int = 2,
+    gram_size: int = VOWEL_INDEX_GRAM_SIZE,
+    segment_size: Optional[int] = None,
+) -> "VowelIndex":
+    """
+    Build the vowel-notation index of all primes in [lo, hi).
+
+    Args:
+        index_dir: Directory for the index files (created if needed).
+        hi: Exclusive upper bound of the prime range.
+        lo: Inclusive lower bound of the prime range.
+        gram_size: Digits per n-gram posting list.
+        segment_size: Integers sieved per build step; bounds the memory used
+            (default: the tuned sieve_segment_size).
+
+    Returns:
+        VowelIndex: The new index, memory-mapped from index_dir.
+    """
+    import numpy as np
+
+    segment_size = tuning.get("sieve_segment_size", segment_size)
+    lo = max(lo, 2)
+    hi = max(hi, lo)
+    os.makedirs(index_dir, exist_ok=True)
+    meta_path = os.path.join(index_dir, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    n_grams = 10**gram_size
+
+    with instrumentation.timer("vowel_index.build"):
+        # Pass 1: count primes and postings per n-gram
+        prime_count = 0
+        gram_counts = np.zeros(n_grams, dtype=np.int64)
+        for primes in _prime_chunks(lo, hi, segment_size):
+            keys = _gram_keys(primes, gram_size)
+            gram_counts += np.bincount(keys // max(len(primes), 1), minlength=n_grams)
+            prime_count += len(primes)
+
+        offsets = np.concatenate(([0], np.cumsum(gram_counts)))
+        prime_dtype = np.uint32 if hi <= 1 << 32 else np.uint64
+        position_dtype = np.uint32 if prime_count < 1 << 32 else np.uint64
+        open_memmap = np.lib.format.open_memmap
+        all_primes = open_memmap(
+            os.path.join(index_dir, "primes.npy"),
+            mode="w+",
+            dtype=prime_dtype,
+            shape=(prime_count,),
+        )
+        postings = open_memmap(
+            os.path.join(index_dir, "postings.npy"),
+            mode="w+",
+            dtype=position_dtype,
+            shape=(int(offsets[-1]),),
+        )
+        np.save(os.path.join(index_dir, "offsets.npy"), offsets)
+
+        # Pass 2: append each chunk's postings behind the earlier chunks'
+        cursor = offsets[:-1].copy()
+        base = 0
+        for primes in _prime_chunks(lo, hi, segment_size):
+            count = len(primes)
+            all_primes[base : base + count] = primes
+            keys = _gram_keys(primes, gram_size)
+            grams, positions = np.divmod(keys, max(count, 1))
+            rank = np.arange(len(grams)) - np.searchsorted(grams, grams)
+            postings[cursor[grams] + rank] = positions + base
+            cursor += np.bincount(grams, minlength=n_grams)
+            base += count
+        all_primes.flush()
+        postings.flush()
+        del all_primes, postings
+
+    meta = {
+        "version": _INDEX_VERSION,
+        "lo": lo,
+        "hi": hi,
+        "gram_size": gram_size,
+        "prime_count": prime_count,
+    }
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+    instrumentation.incr("vowel_index.primes_indexed", prime_count)
+    return open_vowel_index(index_dir)
+
+
+def open_vowel_index(index_dir: str) -> "VowelIndex":
+    """
+    Memory-map an index written by build_vowel_index.
+
+    Args:
+        index_dir: Directory holding the index files.
+
+    Returns:
+        VowelIndex: The index.
+
+    Raises:
+        FileNotFoundError: If index_dir holds no complete index.
+    """
+    meta_path = os.path.join(index_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        raise FileNotFoundError(f"no complete vowel index in {index_dir}")
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta.get("version") != _INDEX_VERSION:
+        raise ValueError(f"unsupported vowel index version in {index_dir}")
+    return VowelIndex(index_dir, meta)
+
+
+class VowelIndex:
+    """
+    Prefix and substring queries over the vowel notation of indexed primes.
+
+    Query results are sorted NumPy arrays of the matching primes.
+    """
+
+    def __init__(self, index_dir: str, meta: dict):
+        import numpy as np
+
+        self.index_dir = index_dir
+        self.lo = meta["lo"]
+        self.hi = meta["hi"]
+        self.gram_size = meta["gram_size"]
+        self.primes = np.load(os.path.join(index_dir, "primes.npy"), mmap_mode="r")
+        self.offsets = np.load(os.path.join(index_dir, "offsets.npy"))
+        self.postings = np.load(os.path.join(index_dir, "postings.npy"), mmap_mode="r")
+
+    def __len__(self) -> int:
+        return len(self.primes)
+
+    def _special(self, pattern: str):
+        """Handle the notation "U" of the prime 2, which has no digit form."""
+        import numpy as np
+
+        if "U" not in pattern.upper():
+            return None
+        has_two = self.lo <= 2 < self.hi
+        found = pattern.upper() == "U" and has_two
+        return np.array([2] if found else [], dtype=self.primes.dtype)
+
+    def _without_two(self, primes: "np.ndarray") -> "np.ndarray":
+        # 2 is spelled "U", so it never matches a digit pattern
+        if len(primes) and primes[0] == 2:
+            return primes[1:]
+        return primes
+
+    def starts_with(self, pattern: str) -> "np.ndarray":
+        """
+        Primes whose vowel notation starts with pattern.
+
+        Args:
+            pattern: Vowel-notation prefix, e.g. "AE".
+
+        Returns:
+            np.ndarray: Matching primes in ascending order.
+        """
+        import numpy as np
+
+        if not pattern:
+            return np.array(self.primes)
+        special = self._special(pattern)
+        if special is not None:
+            return special
+        instrumentation.incr("vowel_index.queries")
+        digits = _pattern_digits(pattern)
+        max_length = len(str(self.hi))
+        if digits[0] == "0" or len(digits) > max_length:
+            return np.array([], dtype=self.primes.dtype)
+        prefix = int(digits)
+        bounds = []
+        for length in range(len(digits), max_length + 1):
+            scale = 10 ** (length - len(digits))
+            bounds += [prefix * scale, (prefix + 1) * scale]
+        edges = [self._rank(bound) for bound in bounds]
+        pieces = [self.primes[a:b] for a, b in zip(edges[::2], edges[1::2])]
+        return self._without_two(np.concatenate(pieces))
+
+    def _rank(self, value: int) -> int:
+        """Number of indexed primes below value."""
+        import numpy as np
+
+        if value >= self.hi:
+            return len(self.primes)
+        # A scalar of the array's own dtype keeps searchsorted from casting
+        # (and so copying) the whole memory-mapped array
+        return int(np.searchsorted(self.primes, self.primes.dtype.type(value)))
+
+    def _posting(self, gram: int) -> "np.ndarray":
+        return self.postings[self.offsets[gram] : self.offsets[gram + 1]]
+
+    def contains(self, pattern: str) -> "np.ndarray":
+        """
+        Primes whose vowel notation contains pattern.
+
+        Args:
+            pattern: Vowel-notation substring, e.g. "OIO".
+
+        Returns:
+            np.ndarray: Matching primes in ascending order.
+        """
+        import numpy as np
+
+        if not pattern:
+            return np.array(self.primes)
+        special = self._special(pattern)
+        if special is not None:
+            return special
+        instrumentation.incr("vowel_index.queries")
+        digits = _pattern_digits(pattern)
+        size = self.gram_size
+        if len(digits) >= size:
+            grams = {int(digits[i : i + size]) for i in range(len(digits) - size + 1)}
+            lists = sorted((self._posting(g) for g in grams), key=len)
+            positions = np.asarray(lists[0])
+            for other in lists[1:]:
+                if not len(positions):
+                    break
+                positions = np.intersect1d(positions, other, assume_unique=True)
+            candidates = self.primes[positions]
+            if len(digits) > size:
+                candidates = candidates[_has_substring(candidates, digits)]
+            return candidates
+        # Shorter patterns: union of the n-grams that contain them, plus the
+        # few primes too short to have an n-gram at all
+        matched = np.zeros(len(self.primes), dtype=bool)
+        for gram in range(10**size):
+            if digits in str(gram).zfill(size):
+                matched[self._posting(gram)] = True
+        positions = np.flatnonzero(matched)
+        short = self.primes[: self._rank(10 ** (size - 1))]
+        short = short[_has_substring(short, digits)]
+        return self._without_two(np.concatenate((short, self.primes[positions])))
+
+
+def _has_substring(values: "np.ndarray", digits: str) -> "np.ndarray":
+    """Mask of the values whose decimal digits contain the digit string."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.uint64)
+    found = np.zeros(len(values), dtype=bool)
+    target = np.uint64(int(digits))
+    modulus = np.uint64(10 ** len(digits))
+    for length, start, stop in _length_groups(values):
+        block = values[start:stop]
+        for shift in range(length - len(digits) + 1):
+            found[start:stop] |= (block // np.uint64(10**shift)) % modulus == target
+    return found
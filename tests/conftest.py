@@ -0,0 +1,14 @@
+import pytest
+
+from pv_sdk import tuning
+
+
+@pytest.fixture(autouse=True)
+def tuning_profile(tmp_path, monkeypatch):
+    """Keep tests off the user's tuning profile; yields the profile path."""
+    path = tmp_path / "tuning.json"
+    monkeypatch.setenv(tuning.PROFILE_ENV, str(path))
+    monkeypatch.setattr(tuning, "_profile", None)
+    # Also drops values cached from the previous profile
+    tuning.load_profile()
+    return path
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from pv_sdk import aio
+from pv_sdk.aio import AsyncEngine
+from pv_sdk.shared_tables import publish_prime_tables
+
+
+@pytest.fixture
+def engine():
+    engine = AsyncEngine(max_workers=2, max_concurrency=2)
+    yield engine
+    engine.shutdown()
+
+
+def test_afactor_coalesces_duplicate_requests(engine):
+    async def scenario():
+        n = 1000003 * 1000033
+        results = await asyncio.gather(*(engine.afactor(n) for _ in range(5)))
+        assert all(sorted(r) == [1000003, 1000033] for r in results)
+        assert engine._factoring == {}
+
+        first = asyncio.ensure_future(engine.afactor(n))
+        second = asyncio.ensure_future(engine.afactor(n))
+        await asyncio.sleep(0)
+        assert len(engine._factoring) == 1
+        # Cancelling one waiter must not cancel the shared job
+        first.cancel()
+        assert sorted(await second) == [1000003, 1000033]
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(scenario())
+
+
+def test_aiter_primes_streams_segments(engine):
+    async def scenario():
+        chunks = [
+            chunk.tolist()
+            async for chunk in engine.aiter_primes(10, 100, chunk_size=25)
+        ]
+        assert len(chunks) == 4
+        assert sum(chunks, []) == [
+            p for p in range(10, 100) if all(p % d for d in range(2, p))
+        ]
+
+        # Stopping early cancels the prefetched segments
+        stream = engine.aiter_primes(2, 10**6, chunk_size=1000)
+        assert (await stream.__anext__()).tolist()[:3] == [2, 3, 5]
+        await stream.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_aiter_primes_uses_shared_tables(engine, monkeypatch):
+    async def scenario(tables):
+        chunks = [
+            chunk.tolist()
+            async for chunk in engine.aiter_primes(
+                100, 200, chunk_size=30, prefetch=1, tables=tables
+            )
+        ]
+        assert sum(chunks, []) == [
+            p for p in range(100, 200) if all(p % d for d in range(2, p))
+        ]
+        with pytest.raises(ValueError, match="missing 5"):
+            async for _ in engine.aiter_primes(100, 200, tables={"primes": [2, 3]}):
+                pass
+
+        # The module-level wrapper forwards prefetch and tables
+        stream = aio.aiter_primes(100, 200, 30, 1, tables)
+        assert (await stream.__anext__()).tolist() == [101, 103, 107, 109, 113, 127]
+        await stream.aclose()
+
+    monkeypatch.setattr(aio, "_default_engine", engine)
+    with publish_prime_tables(20) as tables:
+        asyncio.run(scenario(tables))
@@ -0,0 +1,66 @@
+import pytest
+
+from pv_sdk.arithmetic import (
+    divisor_count,
+    divisor_sum,
+    euler_phi,
+    iter_multiplicative_segments,
+    mobius,
+    multiplicative_segment,
+    multiplicative_tables,
+)
+
+
+def _reference(n):
+    from sympy import divisor_count as tau
+    from sympy import divisor_sigma, mobius, totient
+
+    return {
+        "phi": int(totient(n)),
+        "mu": int(mobius(n)),
+        "tau": int(tau(n)),
+        "sigma": int(divisor_sigma(n)),
+    }
+
+
+def test_multiplicative_tables_match_sympy():
+    tables = multiplicative_tables(5000)
+    for n in range(1, 5001):
+        assert {name: int(t[n]) for name, t in tables.items()} == _reference(n)
+    assert all(int(t[0]) == 0 for t in tables.values())
+
+
+def test_segments_match_linear_sieve():
+    limit = 200_000
+    tables = multiplicative_tables(limit, functions=("phi", "sigma"))
+    assert set(tables) == {"phi", "sigma"}
+    seen = 1
+    for start, window in iter_multiplicative_segments(
+        1, limit + 1, segment_size=30_011, functions=("phi", "sigma")
+    ):
+        assert start == seen
+        for name, values in window.items():
+            assert (values == tables[name][start : start + len(values)]).all()
+        seen += len(window["phi"])
+    assert seen == limit + 1
+
+
+def test_segment_far_from_zero():
+    lo = 10**12
+    window = multiplicative_segment(lo, lo + 300)
+    for i in range(0, 300, 37):
+        assert {name: int(t[i]) for name, t in window.items()} == _reference(lo + i)
+
+
+def test_point_lookups():
+    # Table hits, and factoring fallbacks beyond the table bound
+    for n in (1, 2, 12, 97, 720720, 2**40, 10**12 + 39, 600851475143, 10**18 + 9):
+        ref = _reference(n)
+        assert euler_phi(n) == ref["phi"]
+        assert mobius(n) == ref["mu"]
+        assert divisor_count(n) == ref["tau"]
+        assert divisor_sum(n) == ref["sigma"]
+    with pytest.raises(ValueError):
+        euler_phi(0)
+    with pytest.raises(ValueError):
+        multiplicative_tables(10, functions=("lambda",))
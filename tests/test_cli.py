@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from pv_sdk.cli import main
+from pv_sdk.documentation import load_from_binary
+
+
+def test_sieve_ndjson_across_segments(capsys):
+    main(["sieve", "--lo", "10", "--hi", "50", "--chunk-size", "7"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["prime"] for r in records] == [11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+    assert records[0]["vowel"] == "A"
+
+
+def test_twins_and_gaps_csv_with_workers(capsys, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    main(["twins", "--hi", "100", "--chunk-size", "9", "--format", "csv"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "p1,p2"
+    assert lines[1:4] == ["3,5", "5,7", "11,13"]
+    assert len(lines) - 1 == 8
+
+    args = ["gaps", "--hi", "30", "--chunk-size", "4", "--format", "csv"]
+    main(args + ["--workers", "2", "--cache-dir", cache_dir])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1] == "2,3,1"
+    assert lines[-1] == "23,29,6"
+    assert len(lines) - 1 == 9
+
+
+def test_factor_streams_input_file(capsys, tmp_path):
+    inputs = tmp_path / "numbers.txt"
+    inputs.write_text("1001\n# comment\n\n97\n360\n")
+    main(["factor", str(inputs), "--chunk-size", "2"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records == [
+        {"n": 1001, "factors": {"7": 1, "11": 1, "13": 1}},
+        {"n": 97, "factors": {"97": 1}},
+        {"n": 360, "factors": {"2": 3, "3": 2, "5": 1}},
+    ]
+
+
+def test_export_writes_binary(capsys, tmp_path):
+    output = str(tmp_path / "primes.pvb")
+    main(["export", "--hi", "100", "--output", output, "--chunk-size", "16"])
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert output in captured.err
+    loaded = load_from_binary(output)
+    assert loaded["prime_count"] == 25
+    assert loaded["twin_prime_count"] == 8
+    assert loaded["primes"][-1] == 97
+
+
+@pytest.mark.parametrize("hi, prime_count, max_gap", [(1, 0, 0), (4, 2, 1)])
+def test_export_range_without_twins(tmp_path, hi, prime_count, max_gap):
+    output = str(tmp_path / "primes.pvb")
+    main(["export", "--lo", "0", "--hi", str(hi), "--output", output])
+    loaded = load_from_binary(output)
+    assert loaded["prime_count"] == prime_count
+    assert loaded["twin_prime_count"] == 0
+    assert loaded["max_gap"] == max_gap
+    assert loaded["twin_primes"].shape == (0, 2)
@@ -0,0 +1,59 @@
+import numpy as np
+
+from pv_sdk.documentation import load_from_binary, save_to_binary
+
+
+def test_binary_round_trip(tmp_path):
+    filename = str(tmp_path / "results.pvb")
+    content = {
+        "primes": [2, 3, 5, 7, 11, 13],
+        "modular_results": {2: 2, 3: 3, 5: 5, 7: 0, 11: 4, 13: 6},
+        "twin_primes": [(3, 5), (5, 7), (11, 13)],
+        "big": [2**40, 2**40 + 1],
+        "label": "PrimeVox",
+        "empty": [],
+    }
+    save_to_binary(filename, content)
+
+    for mmap in (True, False):
+        loaded = load_from_binary(filename, mmap=mmap)
+        assert loaded["primes"].tolist() == content["primes"]
+        assert loaded["primes"].dtype == np.uint8
+        assert loaded["twin_primes"].shape == (3, 2)
+        assert loaded["big"].tolist() == content["big"]
+        mapping = loaded["modular_results"]
+        assert dict(zip(mapping["keys"].tolist(), mapping["values"].tolist())) == (
+            content["modular_results"]
+        )
+        assert loaded["label"] == "PrimeVox"
+        assert loaded["empty"] == []
+
+    assert isinstance(load_from_binary(filename)["primes"], np.memmap)
+
+
+def test_binary_round_trip_empty_arrays(tmp_path):
+    filename = str(tmp_path / "empty.pvb")
+    content = {
+        "primes": np.empty(0, dtype=np.int64),
+        "twin_primes": np.empty((0, 2), dtype=np.int64),
+        "gaps": np.empty(0, dtype=np.float64),
+    }
+    save_to_binary(filename, content)
+
+    for mmap in (True, False):
+        loaded = load_from_binary(filename, mmap=mmap)
+        assert loaded["primes"].shape == (0,)
+        assert loaded["twin_primes"].shape == (0, 2)
+        assert loaded["twin_primes"].dtype == np.int64
+        assert loaded["gaps"] == []
+
+
+def test_binary_round_trip_mixed_sign_64_bit(tmp_path):
+    filename = str(tmp_path / "mixed.pvb")
+    values = [-1, 2**62 + 1, -(2**40)]
+    save_to_binary(filename, {"values": values, "array": np.array(values)})
+
+    loaded = load_from_binary(filename)
+    for key in ("values", "array"):
+        assert loaded[key].dtype == np.int64
+        assert loaded[key].tolist() == values
@@ -1,171 +1,156 @@
-"""
-High-performance integer factorization module for PrimeVox SDK.
-
-This module provides functions to factor large composites (up to ~40 digits)
-using Pollard's Rho with Brent's cycle detection, plus a deterministic Miller-Rabin
-primality test for 64-bit numbers.
-
-Public API:
-  - prime_to_vowel_notation(prime: int) -> str
-  - factor(n: int) -> List[int]
-  - factor_frequencies(n: int) -> Dict[int, int]
-  - factor_and_map(n: int) -> List[str]
-"""
-import logging
-import math
 import random
-from typing import Dict, List, Optional
-
-logger = logging.getLogger(__name__)
-
-_digit_to_vowel: Dict[str, str] = {
-    "1": "A",  # primes ending in 1 → A
-    "3": "E",  # primes ending in 3 → E
-    "5": "Y",  # primes ending in 5 → Y
-    "7": "I",  # primes ending in 7 → I
-    "9": "O",  # primes ending in 9 → O
-}
-
-
-def prime_to_vowel_notation(prime: int) -> str:
-    """
-    Map a prime number to its vowel notation based on its final digit.
-
-    Special case:
-      - 2 -> 'U'
-
-    Args:
-        prime: A prime integer.
-    Returns:
-        A string of vowel characters representing the prime.
-    """
-    if prime == 2:
-        return "U"
-    return "".join(_digit_to_vowel.get(d, d) for d in str(prime))
-
-
-def _pollards_rho_brent(n: int, max_iter: int = 100_000) -> Optional[int]:
-    """
-    Pollard's Rho algorithm with Brent's cycle detection to find a nontrivial factor.
-
-    Args:
-        n: Composite integer to factor.
-        max_iter: Maximum cycle iterations before giving up.
-    Returns:
-        A nontrivial factor of n, or None if it fails.
-    """
-    if n % 2 == 0:
-        return 2
-    y = random.randrange(1, n)
-    c = random.randrange(1, n)
-    m = random.randrange(1, n)
-    g = r = q = 1
-    x = y
-
-    while g == 1 and r < max_iter:
-        x = y
-        for _ in range(r):
-            y = (y * y + c) % n
-        k = 0
-        while k < r and g == 1:
-            ys = y
-            for _ in range(min(m, r - k)):
-                y = (y * y + c) % n
-                q = (q * abs(x - y)) % n
-            g = math.gcd(q, n)
-            k += m
-        r *= 2
-
-    if g is None or g == n:
-        while True:
-            ys = (ys * ys + c) % n  # type: ignore
-            g = math.gcd(abs(x - ys), n)
-            if g and g < n:
-                break
-
-    return g if g and g < n else None
-
-
-def _is_prime(n: int) -> bool:
-    """
-    Deterministic Miller-Rabin for n < 2^64 using fixed bases.
-
-    Args:
-        n: Integer to test.
-    Returns:
-        True if n is (probably) prime, False otherwise.
-    """
-    if n < 2:
-        return False
-    small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29)
-    for p in small_primes:
-        if n == p:
-            return True
-        if n % p == 0:
-            return False
-    d, s = n - 1, 0
-    while not d & 1:
-        d >>= 1
-        s += 1
-    for a in (2, 325, 9375, 28178, 450775, 9780504, 1795265022):
-        x = pow(a, d, n)
-        if x == 1 or x == n - 1:
-            continue
-        for _ in range(s - 1):
-            x = pow(x, 2, n)
-            if x == n - 1:
-                break
-        else:
-            return False
-    return True
-
-
-def factor(n: int) -> List[int]:
-    """
-    Recursively factor an integer into its prime factors.
-
-    Args:
-        n: Integer > 1 to factor.
-    Returns:
-        A list of prime factors (unsorted).
-    """
-    if n <= 1:
-        return []
-    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29):
-        if n % p == 0:
-            return [p] + factor(n // p)
-    if _is_prime(n):
-        return [n]
-    divisor = None
-    while divisor is None:
-        divisor = _pollards_rho_brent(n)
-    return factor(divisor) + factor(n // divisor)
-
-
-def factor_frequencies(n: int) -> Dict[int, int]:
-    """
-    Count prime factor multiplicities for a composite number.
-
-    Args:
-        n: Integer > 1.
-    Returns:
-        A dict mapping prime -> exponent.
-    """
-    freqs: Dict[int, int] = {}
-    for p in factor(n):
-        freqs[p] = freqs.get(p, 0) + 1
-    return freqs
-
-
-def factor_and_map(number: int) -> List[str]:
-    """
-    Factor a composite into primes and map each to vowel notation.
-
-    Args:
-        number: Composite integer to factor.
-    Returns:
-        A list of vowel-mapped factor strings.
-    """
-    from pv_sdk.factoring import prime_to_vowel_notation
-
-    return [prime_to_vowel_notation(p) for p in factor(number)]
+
+import pytest
+
+from pv_sdk.factoring import (
+    _integer_root,
+    _is_prime,
+    _perfect_power,
+    _pollard_pm1,
+    _pollards_rho_brent,
+    _stage1_exponent,
+    _williams_pp1,
+    batch_trial_division,
+    factor,
+    factor_and_map,
+    factor_frequencies,
+    factor_many,
+    factor_range,
+    factor_with_methods,
+    make_strategy,
+    prime_to_vowel_notation,
+)
+
+# 2 * 3^2 * 5 * ... * 53 + 1: p - 1 is 53-smooth
+PM1_SMOOTH_PRIME = 97767475431570134191
+# 2 * 3 * 5 * 7^2 * ... * 53 - 1: p + 1 is 53-smooth
+PP1_SMOOTH_PRIME = 228124109340330313109
+# p - 1 = 43-smooth * 50021, only found by stage 2
+PM1_STAGE2_PRIME = 8507366459429065418191
+# Neither q - 1 nor q + 1 is smooth
+LARGE_PRIME = 10**25 + 13
+
+
+def test_is_prime_small_values():
+    primes = {p for p in range(2, 2000) if all(p % d for d in range(2, p))}
+    assert all(_is_prime(n) == (n in primes) for n in range(2000))
+    # Bases that are multiples of n must not mark n composite
+    assert _is_prime(193) is True
+    assert _is_prime(2**61 - 1) is True
+    assert _is_prime(3215031751) is False
+
+
+def test_rho_backtrack_gives_up_when_the_batch_gcd_is_n():
+    # Tiny composites often collapse a whole batch to gcd n; the backtrack
+    # must then return None (caller retries) instead of looping forever
+    random.seed(0)
+    for n in (9, 15, 25, 49, 121, 143, 169):
+        for _ in range(200):
+            d = _pollards_rho_brent(n)
+            assert d is None or (1 < d < n and n % d == 0)
+
+
+def test_stage1_exponent_includes_exact_prime_powers():
+    assert _stage1_exponent(243) % 3**5 == 0
+    assert _stage1_exponent(243) % 3**6 != 0
+    assert _stage1_exponent(1) == 1
+
+
+def test_factor_and_frequencies():
+    assert factor(1) == []
+    assert sorted(factor(1001)) == [7, 11, 13]
+    assert factor_frequencies(360) == {2: 3, 3: 2, 5: 1}
+    # Cofactor 193 * 319836241 previously sent a prime into Pollard-Brent
+    assert factor_frequencies(123456789026) == {2: 1, 193: 1, 319836241: 1}
+    assert sorted(factor(1000003 * 1000033)) == [1000003, 1000033]
+
+
+def test_vowel_notation():
+    assert prime_to_vowel_notation(2) == "U"
+    assert prime_to_vowel_notation(13) == "AE"
+    assert sorted(factor_and_map(1001)) == ["AA", "AE", "I"]
+
+
+def test_batch_trial_division_and_factor_many():
+    numbers = [0, 1, 2, 97, 360, 65521**3 * 7, 53 * 59 * 61 * 67 * 71 * 73 * 79]
+    numbers += [3**50 * 65537**2 * (2**61 - 1), 1000003 * 1000033]
+    expected = [{} if n <= 1 else factor_frequencies(n) for n in numbers]
+
+    assert factor_many(numbers, batch_size=4) == expected
+
+    stripped = batch_trial_division(numbers, bound=100)
+    assert stripped[4] == ({2: 3, 3: 2, 5: 1}, 1)
+    assert stripped[5] == ({7: 1}, 65521**3)
+    assert stripped[-1] == ({}, 1000003 * 1000033)
+
+
+def test_pollard_pm1_and_williams_pp1():
+    assert _pollard_pm1(PM1_SMOOTH_PRIME * LARGE_PRIME) == PM1_SMOOTH_PRIME
+    n = PM1_STAGE2_PRIME * LARGE_PRIME
+    assert _pollard_pm1(n, b1=10_000, b2=0) is None
+    assert _pollard_pm1(n, b1=10_000, b2=100_000) == PM1_STAGE2_PRIME
+    assert _williams_pp1(PP1_SMOOTH_PRIME * LARGE_PRIME) == PP1_SMOOTH_PRIME
+    assert _williams_pp1(PP1_SMOOTH_PRIME * LARGE_PRIME, b1=20) is None
+
+
+def test_factor_with_methods_reports_stage():
+    n = 4 * PM1_SMOOTH_PRIME * LARGE_PRIME
+    found = dict(factor_with_methods(n, make_strategy(pp1_bound=None)))
+    assert found == {
+        2: "trial_division",
+        PM1_SMOOTH_PRIME: "pollard_pm1",
+        LARGE_PRIME: "pollard_pm1",
+    }
+
+    n = PP1_SMOOTH_PRIME * LARGE_PRIME
+    found = dict(factor_with_methods(n, make_strategy(pm1_bounds=None)))
+    assert found[PP1_SMOOTH_PRIME] == "williams_pp1"
+
+    assert factor_with_methods(LARGE_PRIME) == [(LARGE_PRIME, "primality_test")]
+    # Rho-only strategy still factors everything
+    rho_only = make_strategy(pm1_bounds=None, pp1_bound=None, siqs=False)
+    assert [stage.name for stage in rho_only] == ["pollard_rho", "pollard_rho"]
+    assert sorted(factor(1000003 * 1000033, rho_only)) == [1000003, 1000033]
+
+
+def test_perfect_power_detection():
+    for n in (2, 10**20, 99, 2**64 + 1):
+        for k in (2, 3, 5, 7):
+            root = _integer_root(n, k)
+            assert root**k <= n < (root + 1) ** k
+    assert _perfect_power(2**12) == (2, 12)
+    assert _perfect_power(3**10 * 5**15) == (3**2 * 5**3, 5)
+    assert _perfect_power(1000003**2 + 1) is None
+    assert _perfect_power(LARGE_PRIME) is None
+
+
+def test_factor_prime_powers():
+    p, q = 1000000007, 10000000019
+    assert factor_frequencies(p**5) == {p: 5}
+    assert factor_frequencies(p**2 * q**2) == {p: 2, q: 2}
+    assert factor_frequencies(31**3 * LARGE_PRIME**2) == {31: 3, LARGE_PRIME: 2}
+    assert factor_with_methods(LARGE_PRIME**3) == [(LARGE_PRIME, "perfect_power")] * 3
+
+
+def test_factor_range_matches_factor_frequencies():
+    lo, hi = 10**12 - 50, 10**12 + 50
+    segments = list(factor_range(lo, hi, segment_size=37))
+    assert [start for start, _ in segments] == [lo, lo + 37, lo + 74]
+    flat = [freqs for _, part in segments for freqs in part]
+    assert flat == [factor_frequencies(n) for n in range(lo, hi)]
+
+    (start, segment), *_ = factor_range(0, 30, compact=True)
+    assert start == 0 and segment.factors_of(0) == segment.factors_of(1) == {}
+    assert segment.factors_of(24) == {2: 3, 3: 1}
+    assert segment.frequencies()[29] == {29: 1}
+    assert int(segment.indptr[-1]) == sum(len(factor_frequencies(n)) for n in range(30))
+
+
+def test_factor_range_rejects_short_tables():
+    import numpy as np
+
+    short = {"primes": np.array([2, 3, 5, 7])}
+    # 11 * 11 = 121 would come out as a prime
+    with pytest.raises(ValueError, match="missing 11"):
+        list(factor_range(100, 200, tables=short))
+    assert dict(factor_range(100, 120, tables=short))[100][19] == {7: 1, 17: 1}
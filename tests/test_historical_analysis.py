@@ -0,0 +1,110 @@
+import json
+import multiprocessing
+
+import pytest
+
+from pv_sdk.historical_analysis import (
+    HistoricalLog,
+    HistoricalStore,
+    append_historical_record,
+    load_historical_data,
+)
+
+
+def _append_many(path, worker, count):
+    with HistoricalLog(path, fsync_every=8) as log:
+        for i in range(count):
+            log.append(f"worker{worker}-{i}", i)
+
+
+def test_append_and_load_jsonl(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    append_historical_record(path, "run", {"prime_limit": 50})
+    append_historical_record(path, "run", {"prime_limit": 100})
+    append_historical_record(path, "other", 1)
+
+    assert load_historical_data(path) == {"run": {"prime_limit": 100}, "other": 1}
+
+    # Appends never rewrite earlier lines
+    with open(path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+
+
+def test_torn_line_is_skipped_and_terminated(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    with HistoricalLog(path) as log:
+        log.append("a", 1)
+    with open(path, "ab") as f:
+        f.write(b'{"key": "b", "val')  # simulated crash mid-write
+
+    with HistoricalLog(path) as log:
+        assert log.as_dict() == {"a": 1}
+        log.append("c", 3)
+        assert log.as_dict() == {"a": 1, "c": 3}
+
+    assert HistoricalLog(path).as_dict() == {"a": 1, "c": 3}
+
+
+def test_compaction_keeps_latest_values(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    with HistoricalLog(path, compact_ratio=2.0, min_compact_records=10) as log:
+        for i in range(25):
+            log.append("counter", i)
+        assert log.get("counter") == 24
+
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) < 10
+    assert lines[-1]["value"] == 24
+
+
+def test_compaction_keeps_record_timestamps(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_text(
+        '{"key":"a","value":1,"ts":100.0}\n'
+        '{"key":"b","value":2,"ts":200.0}\n'
+        '{"key":"a","value":3,"ts":300.0}\n'
+    )
+    with HistoricalLog(str(path)) as log:
+        log.compact()
+        assert log.as_dict() == {"a": 3, "b": 2}
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert sorted((r["key"], r["ts"]) for r in lines) == [("a", 300.0), ("b", 200.0)]
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    workers = [
+        multiprocessing.Process(target=_append_many, args=(path, w, 50))
+        for w in range(4)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+    data = HistoricalLog(path).as_dict()
+    assert len(data) == 200
+
+
+def test_historical_store_queries_and_aggregates(tmp_path):
+    with HistoricalStore(str(tmp_path / "runs.db")) as store:
+        store.record_many(
+            [("runs", float(ts), {"duration": ts * 0.5}) for ts in range(100)]
+        )
+        store.record("other", {"duration": 1000.0}, ts=5.0)
+
+        assert store.keys() == ["other", "runs"]
+        window = store.query("runs", start=10, end=20)
+        assert [ts for ts, _ in window] == [float(ts) for ts in range(10, 20)]
+        assert store.latest("runs") == {"duration": 49.5}
+
+        stats = store.aggregate("runs", "duration", start=0, end=10)
+        assert stats == {"count": 10, "min": 0.0, "max": 4.5, "mean": 2.25}
+
+        buckets = store.downsample("runs", "duration", 25, agg="max")
+        assert buckets == [(0, 12.0), (25, 24.5), (50, 37.0), (75, 49.5)]
+
+        with pytest.raises(ValueError):
+            store.downsample("runs", "duration", 25, agg="median")
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("numpy", "sympy", "scipy", "networkx", "matplotlib")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "pv_sdk",
+        "pv_sdk.aio",
+        "pv_sdk.analysis",
+        "pv_sdk.arithmetic",
+        "pv_sdk.cli",
+        "pv_sdk.documentation",
+        "pv_sdk.factoring",
+        "pv_sdk.historical_analysis",
+        "pv_sdk.instrumentation",
+        "pv_sdk.prime",
+        "pv_sdk.prime_bitmap",
+        "pv_sdk.prime_vowel_factorizer",
+        "pv_sdk.sieve_jobs",
+        "pv_sdk.shared_tables",
+        "pv_sdk.tuning",
+        "pv_sdk.siqs",
+        "pv_sdk.twin_primes",
+        "pv_sdk.visualization",
+        "pv_sdk.vowel_graph",
+        "pv_sdk.vowel_index",
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == ""
@@ -0,0 +1,59 @@
+import json
+
+from pv_sdk import instrumentation
+from pv_sdk.factoring import factor
+from pv_sdk.instrumentation import collect_metrics
+from pv_sdk.prime import generate_primes_and_map
+from pv_sdk.twin_primes import find_twin_primes
+
+
+def test_disabled_instrumentation_is_a_no_op():
+    assert instrumentation._collector is None
+    instrumentation.incr("unused")
+    with instrumentation.timer("unused"):
+        pass
+    assert instrumentation._collector is None
+
+
+def test_collect_metrics_counts_hot_paths(tmp_path):
+    cache = str(tmp_path / "cache.pkl")
+    with collect_metrics() as metrics:
+        assert sorted(factor(1000003 * 1000033)) == [1000003, 1000033]
+        generate_primes_and_map(100, pickle_file=cache)
+        generate_primes_and_map(50, pickle_file=cache)
+        find_twin_primes(100)
+
+    counters = metrics.counters
+    assert counters["factoring.rho_calls"] >= 1
+    assert counters["factoring.rho_iterations"] > 0
+    assert counters["factoring.gcd_calls"] > 0
+    assert counters["prime.cache_misses"] == 1
+    assert counters["prime.cache_hits"] == 1
+    assert counters["twin_primes.pairs_found"] == 8
+    assert metrics.timers["factoring.pollard_rho"]["count"] >= 1
+    assert instrumentation._collector is None
+
+
+def test_nested_collectors_and_exports(tmp_path):
+    with collect_metrics() as outer:
+        instrumentation.incr("outer")
+        with collect_metrics(profile=True, trace_memory=True) as inner:
+            instrumentation.incr("inner", 3)
+            with instrumentation.timer("block"):
+                sum(range(1000))
+        instrumentation.incr("outer")
+
+    assert outer.counters == {"outer": 2}
+    assert inner.counters == {"inner": 3}
+    assert inner.memory_peak_bytes is not None
+    assert "function calls" in inner.profile_stats()
+
+    json_path = tmp_path / "metrics.json"
+    inner.write_json(str(json_path))
+    assert json.loads(json_path.read_text())["counters"] == {"inner": 3}
+
+    prom_path = tmp_path / "metrics.prom"
+    inner.write_prometheus(str(prom_path))
+    text = prom_path.read_text()
+    assert "pvsdk_inner_total 3" in text
+    assert "pvsdk_block_seconds_count 1" in text
@@ -1,7 +1,13 @@
+import pytest
+
 from pv_sdk.prime import (
     create_composite_mappings,
     generate_primes_and_map,
+    goldbach_partitions,
     is_prime,
+    is_prime_many,
+    nth_prime,
+    prime_count,
     prime_to_vowel,
 )
 
@@ -14,6 +20,66 @@ def test_is_prime():
     assert is_prime(-3) is False
 
 
+def test_is_prime_many(monkeypatch):
+    import multiprocessing
+    from multiprocessing import Pool
+
+    import numpy as np
+
+    import pv_sdk.prime
+    from pv_sdk.factoring import _is_prime
+
+    rng = np.random.default_rng(0)
+    values = np.concatenate(
+        [
+            np.arange(2000, dtype=np.uint64),
+            rng.integers(1 << 20, 1 << 32, 3000, dtype=np.uint64),
+            rng.integers(1 << 32, 1 << 50, 3000, dtype=np.uint64),
+            rng.integers(1 << 50, (1 << 64) - 1, 3000, dtype=np.uint64),
+        ]
+    )
+    # Strong pseudoprimes to several small bases, and large primes
+    special = [3215031751, 4759123141, 3825123056546413051, 2**61 - 1, 2**49 - 1]
+    values = np.concatenate([values, np.array(special, dtype=np.uint64)])
+    expected = [_is_prime(v) for v in values.tolist()]
+    assert is_prime_many(values).tolist() == expected
+    # Several wide batches, so workers=2 goes through the process pool
+    pools = []
+    monkeypatch.setattr(pv_sdk.prime, "PRIMALITY_BATCH_SIZE", 100)
+    monkeypatch.setattr(
+        multiprocessing, "Pool", lambda *args: pools.append(args) or Pool(*args)
+    )
+    assert is_prime_many(values, workers=2).tolist() == expected
+    assert pools == [(2,)]
+    assert is_prime_many([[2, 4], [5, 9]]).tolist() == [[True, False], [True, False]]
+
+
+def test_goldbach_partitions(monkeypatch):
+    from collections import Counter
+
+    import pv_sdk.prime
+
+    limit = 3000
+    primes = [p for p in range(2, limit + 1) if is_prime(p)]
+    ordered = Counter(p + q for p in primes for q in primes if p + q <= limit)
+    unordered = Counter(
+        p + q for p in primes for q in primes if p <= q and p + q <= limit
+    )
+    expected = [unordered[n] for n in range(limit + 1)]
+    expected_ordered = [ordered[n] for n in range(limit + 1)]
+    assert goldbach_partitions(limit).tolist() == expected
+    assert goldbach_partitions(limit, ordered=True).tolist() == expected_ordered
+
+    # Force the blockwise convolution used for large limits
+    monkeypatch.setattr(pv_sdk.prime, "GOLDBACH_FFT_BLOCK", 64)
+    assert goldbach_partitions(limit).tolist() == expected
+    assert goldbach_partitions(limit, ordered=True).tolist() == expected_ordered
+
+    monkeypatch.undo()
+    assert goldbach_partitions(10**6)[10**6] == 5402
+    assert goldbach_partitions(3).tolist() == [0, 0, 0, 0]
+
+
 def test_prime_to_vowel():
     assert prime_to_vowel(2) == "E"
     assert prime_to_vowel(5) == "O"
@@ -40,3 +106,23 @@ def test_create_composite_mappings():
     composite_example = composites[0]
     expected_keys = {"pair", "vowel_pair", "sum", "product", "exponent"}
     assert set(composite_example.keys()) == expected_keys
+
+
+def test_prime_count():
+    assert prime_count(1) == 0
+    assert prime_count(2) == 1
+    assert prime_count(100) == 25
+    assert prime_count(1_000_000) == 78498
+    # Above the sieve threshold the sublinear method takes over
+    assert prime_count(1_000_001) == 78498
+    assert prime_count(10**9) == 50847534
+
+
+def test_nth_prime():
+    assert nth_prime(1) == 2
+    assert nth_prime(5) == 11
+    assert nth_prime(25) == 97
+    assert nth_prime(1_000_000) == 15485863
+
+    with pytest.raises(ValueError):
+        nth_prime(0)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pv_sdk.prime import _sieve_primes
+from pv_sdk.prime_bitmap import build_prime_bitmap, open_prime_bitmap
+from pv_sdk.twin_primes import is_twin_prime
+
+LIMIT = 200_000
+
+
+@pytest.fixture(scope="module")
+def bitmap(tmp_path_factory):
+    index_dir = str(tmp_path_factory.mktemp("bitmap"))
+    # Small segments so the build crosses several segment and block boundaries
+    build_prime_bitmap(index_dir, LIMIT, segment_bytes=512)
+    return open_prime_bitmap(index_dir)
+
+
+def test_membership_matches_sieve(bitmap):
+    primes = _sieve_primes(bitmap.hi + 2)
+    is_prime = np.zeros(bitmap.hi + 3, dtype=bool)
+    is_prime[primes] = True
+    is_twin = is_prime.copy()
+    is_twin[2:-2] &= is_prime[:-4] | is_prime[4:]
+    is_twin[2] = False
+
+    values = np.arange(-3, bitmap.hi)
+    assert bitmap.hi == LIMIT + 10
+    assert (bitmap.is_prime_many(values) == is_prime[np.maximum(values, 0)]).all()
+    assert (bitmap.is_twin_many(values) == is_twin[np.maximum(values, 0)]).all()
+    assert [n for n in range(40) if bitmap.is_twin(n)] == [
+        3,
+        5,
+        7,
+        11,
+        13,
+        17,
+        19,
+        29,
+        31,
+    ]
+    assert [bitmap.is_prime(n) for n in (1, 2, 9, 199_999)] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert is_twin_prime(29, 31, bitmap) and not is_twin_prime(23, 25, bitmap)
+    with pytest.raises(ValueError):
+        bitmap.is_prime(bitmap.hi)
+
+
+def test_rank_and_select(bitmap):
+    primes = _sieve_primes(bitmap.hi + 2)
+    firsts = primes[:-1][np.diff(primes) == 2]
+    for n in (0, 2, 3, 6, 30, 31, 7681, 100_000, bitmap.hi):
+        assert bitmap.prime_rank(n) == np.searchsorted(primes, n)
+        assert bitmap.twin_rank(n) == np.searchsorted(firsts, n)
+    assert bitmap.prime_count(100, 1000) == 168 - 25
+    assert bitmap.twin_count(0, 1000) == 35
+    for k in (0, 2, 3, 1000, bitmap.prime_rank(bitmap.hi) - 1):
+        assert bitmap.prime_select(k) == primes[k]
+    for k in (0, 1, 2, len(firsts[firsts < bitmap.hi]) - 1):
+        assert bitmap.twin_select(k) == firsts[k]
+    with pytest.raises(IndexError):
+        bitmap.prime_select(bitmap.prime_rank(bitmap.hi))
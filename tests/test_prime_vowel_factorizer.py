@@ -0,0 +1,56 @@
+from sympy import factorint
+
+from pv_sdk.prime_vowel_factorizer import (
+    draw_factor_graph,
+    factor_graph_labels,
+    factor_graph_matrix,
+    factor_sharing_graph,
+    load_factor_graph,
+    prime_to_vowel_notation,
+    sample_factor_graph,
+    save_factor_graph,
+)
+
+
+def test_factor_sharing_graph_matches_factorint():
+    graph = factor_sharing_graph(0, 5000, segment_size=777)
+    assert len(graph.indptr) == 5002
+    for n in range(5001):
+        expected = sorted(factorint(n).items()) if n > 1 else []
+        assert graph.factors_of(n) == expected
+
+    lo = 10**12
+    far = factor_sharing_graph(lo, lo + 200)
+    for n in range(lo, lo + 201, 17):
+        assert far.factors_of(n) == sorted(factorint(n).items())
+
+
+def test_labels_matrix_and_export(tmp_path):
+    graph = factor_sharing_graph(2, 100)
+    primes, labels = factor_graph_labels(graph)
+    assert primes.tolist() == sorted(set(graph.factors.tolist()))
+    assert labels == [prime_to_vowel_notation(p) for p in primes.tolist()]
+
+    matrix = factor_graph_matrix(graph)
+    assert matrix.shape == (99, len(primes))
+    column = {p: i for i, p in enumerate(primes.tolist())}
+    assert matrix[72 - 2, column[2]] == 3 and matrix[72 - 2, column[3]] == 2
+
+    path = str(tmp_path / "graph.npz")
+    save_factor_graph(graph, path)
+    loaded = load_factor_graph(path)
+    assert loaded.lo == 2 and loaded.factors_of(96) == [(2, 5), (3, 1)]
+
+
+def test_sample_and_draw(tmp_path):
+    graph = factor_sharing_graph(1000, 2000)
+    numbers, sample = sample_factor_graph(graph, 50, seed=1)
+    assert len(numbers) == 50 and len(sample.indptr) == 51
+    for row, n in enumerate(numbers.tolist()):
+        start, stop = sample.indptr[row], sample.indptr[row + 1]
+        edges = list(zip(sample.factors[start:stop], sample.exponents[start:stop]))
+        assert edges == graph.factors_of(n)
+
+    output = tmp_path / "factors.png"
+    draw_factor_graph(graph, output_file=str(output), max_numbers=40)
+    assert output.stat().st_size > 0
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+
+import pytest
+
+from pv_sdk.service import FactorClient, FactorServer
+
+
+@pytest.fixture
+def server_port():
+    ready = threading.Event()
+    state = {}
+
+    def run():
+        async def main():
+            server = FactorServer(workers=1, batch_window=0.01)
+            await server.start()
+            state["port"] = server.address[1]
+            state["stop"] = asyncio.Event()
+            state["loop"] = asyncio.get_running_loop()
+            ready.set()
+            await state["stop"].wait()
+            await server.close()
+
+        asyncio.run(main())
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    ready.wait(timeout=30)
+    yield state["port"]
+    state["loop"].call_soon_threadsafe(state["stop"].set)
+    thread.join(timeout=30)
+
+
+def test_client_round_trip_batching_and_metrics(server_port):
+    with FactorClient(port=server_port, timeout=30) as client:
+        assert client.factor_frequencies(1001) == {7: 1, 11: 1, 13: 1}
+        results = client.factor_many([360, 97, 360, 123456789026])
+        assert results == [
+            {2: 3, 3: 2, 5: 1},
+            {97: 1},
+            {2: 3, 3: 2, 5: 1},
+            {2: 1, 193: 1, 319836241: 1},
+        ]
+        with pytest.raises(ValueError):
+            client.factor_frequencies("not a number")
+
+        metrics = client.metrics()
+        counters = metrics["counters"]
+        assert counters["service.requests"] == 5
+        # Pipelined requests inside one window share pool tasks
+        assert counters["service.batches"] < counters["service.requests"]
+        assert counters["service.errors"] == 1
+        assert metrics["cache_entries"] == 4
+
+
+def test_close_finishes_dispatched_batches():
+    async def main():
+        server = FactorServer(workers=1, batch_window=0.0)
+        await server.start()
+        request = asyncio.create_task(server.factor(2**61 - 1))
+        # Wait until the batch is dispatched, then close while it may still run
+        while "service.batches" not in server.metrics.counters:
+            await asyncio.sleep(0.001)
+        await server.close()
+        assert not server._batch_tasks
+        return await request
+
+    assert asyncio.run(main()) == {2**61 - 1: 1}
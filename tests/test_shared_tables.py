@@ -0,0 +1,58 @@
+import pickle
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from pv_sdk.factoring import factor_frequencies, factor_many
+from pv_sdk.shared_tables import publish_prime_tables
+from pv_sdk.twin_primes import find_twin_primes, twin_primes_in_segment
+
+
+def _table_sum(tables):
+    return int(tables["primes"].sum()), tables["primes"].flags.writeable
+
+
+def test_tables_pickle_to_a_handle_and_attach_in_workers():
+    with publish_prime_tables(1000, spf_limit=100) as tables:
+        assert tables["primes"][:5].tolist() == [2, 3, 5, 7, 11]
+        assert tables["spf"][91] == 7 and tables["spf"][97] == 97
+        assert "spf" in tables and "gaps" not in tables
+        assert len(pickle.dumps(tables)) < 1000
+
+        with Pool(2) as pool:
+            results = pool.map(_table_sum, [tables] * 4)
+        assert results == [(int(tables["primes"].sum()), False)] * 4
+        name = tables.name
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+def test_owner_views_outlive_unlink():
+    with publish_prime_tables(100, spf_limit=10) as tables:
+        primes = tables["primes"]
+        spf = tables["spf"][:5]
+    assert primes[:5].tolist() == [2, 3, 5, 7, 11]
+    assert spf.tolist() == [0, 1, 2, 3, 2]
+    assert tables["primes"][-1] == 97
+    with pytest.raises(ValueError):
+        primes[0] = 1
+
+
+def test_factor_many_and_twins_with_tables():
+    numbers = [0, 1, 97, 360, 2**61 - 1, 1001 * 65537, 3**5 * 65521 * 65519]
+    with publish_prime_tables(1 << 16, spf_limit=1 << 12) as tables:
+        assert factor_many(numbers, tables=tables) == factor_many(numbers)
+        firsts = twin_primes_in_segment(0, 1000, tables)
+    # A table that stops short of the bound would miss factors silently
+    with pytest.raises(ValueError, match="missing 11"):
+        factor_many([1009 * 1013 * 1019], tables={"primes": np.array([2, 3, 5, 7])})
+    with pytest.raises(ValueError):
+        twin_primes_in_segment(0, 1000, {"primes": np.array([2, 3, 5, 7])})
+    # Complete up to the bound even though the last prime is below it
+    assert factor_many(
+        [360], bound=12, tables={"primes": np.array([2, 3, 5, 7, 11])}
+    ) == [factor_frequencies(360)]
+    assert firsts.tolist() == [p for p, _ in find_twin_primes(1001) if p < 1000]
+    assert twin_primes_in_segment(100, 110).tolist() == [101, 107]
@@ -0,0 +1,83 @@
+import json
+import multiprocessing
+import os
+import socket
+import time
+
+import pytest
+
+from pv_sdk.cli import main
+from pv_sdk.prime import _sieve_primes
+from pv_sdk.sieve_jobs import (
+    create_job,
+    job_status,
+    merge_job,
+    run_local_job,
+    run_worker,
+)
+
+
+def _expected(lo, hi):
+    primes = [p for p in _sieve_primes(hi + 1).tolist() if lo <= p < hi]
+    gaps = [b - a for a, b in zip(primes, primes[1:])]
+    all_primes = set(_sieve_primes(hi + 2).tolist())
+    twins = sum(1 for p in primes if p + 2 in all_primes)
+    return primes, gaps, twins
+
+
+def test_local_multi_process_job_matches_direct_sieve(tmp_path):
+    result = run_local_job(str(tmp_path), 10, 20_000, workers=3, segment_size=997)
+    primes, gaps, twins = _expected(10, 20_000)
+    assert result["prime_count"] == len(primes)
+    assert result["twin_prime_count"] == twins
+    assert result["first_prime"] == 11 and result["last_prime"] == primes[-1]
+    assert sum(result["gap_counts"].values()) == len(gaps)
+    assert result["max_gap"]["gap"] == max(gaps)
+    assert json.loads((tmp_path / "result.json").read_text()) == result
+
+
+def test_restarted_job_skips_finished_segments(tmp_path):
+    job_dir = str(tmp_path)
+    create_job(job_dir, 2, 10_000, segment_size=1000)
+    assert run_worker(job_dir, max_segments=4) == 4
+    assert job_status(job_dir)["done"] == 4
+    with pytest.raises(RuntimeError):
+        merge_job(job_dir)
+    assert run_worker(job_dir) == 6
+    assert merge_job(job_dir)["prime_count"] == len(_expected(2, 10_000)[0])
+    with pytest.raises(ValueError):
+        create_job(job_dir, 2, 20_000, segment_size=1000)
+
+
+def test_dead_workers_lock_is_reclaimed(tmp_path):
+    job_dir = str(tmp_path)
+    create_job(job_dir, 2, 3000, segment_size=1000)
+    dead = multiprocessing.Process(target=int)
+    dead.start()
+    dead.join()
+    lock = tmp_path / "locks" / "00000001.lock"
+    lock.write_text(json.dumps({"host": socket.gethostname(), "pid": dead.pid}))
+    assert job_status(job_dir)["claimed"] == 1
+    assert run_worker(job_dir) == 3
+
+
+def test_empty_lock_is_reclaimed_once_stale(tmp_path):
+    job_dir = str(tmp_path)
+    create_job(job_dir, 2, 2000, segment_size=1000)
+    # A worker died between creating its lock and writing the owner
+    lock = tmp_path / "locks" / "00000000.lock"
+    lock.write_text("")
+    assert run_worker(job_dir) == 1
+    os.utime(lock, (time.time() - 120, time.time() - 120))
+    assert run_worker(job_dir, stale_after=60) == 1
+    assert job_status(job_dir)["done"] == 2
+
+
+def test_cli_job_commands(tmp_path, capsys):
+    job_dir = str(tmp_path / "job")
+    main(["job", "init", job_dir, "--hi", "999", "--chunk-size", "100"])
+    main(["job", "work", job_dir, "--workers", "2"])
+    main(["job", "merge", job_dir])
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[1])["done"] == 10
+    assert json.loads(lines[2])["prime_count"] == 168
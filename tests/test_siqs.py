@@ -0,0 +1,36 @@
+from pv_sdk.factoring import factor_with_methods, make_strategy
+from pv_sdk.siqs import _find_dependencies, _sqrt_mod_prime, siqs_factor
+
+# Balanced 33-digit semiprime; neither p - 1 nor p + 1 is smooth
+P, Q = 3536064131233763, 91596079753302653
+
+
+def test_sqrt_mod_prime():
+    for p in (3, 13, 17, 97, 7681, 65537):
+        for a in range(1, 50):
+            if pow(a, (p - 1) // 2, p) == 1:
+                root = _sqrt_mod_prime(a, p)
+                assert root * root % p == a % p
+
+
+def test_find_dependencies():
+    vectors = [0b011, 0b110, 0b101, 0b100]
+    dependencies = _find_dependencies(vectors)
+    assert dependencies
+    for dependency in dependencies:
+        combined = 0
+        for i, vec in enumerate(vectors):
+            if dependency >> i & 1:
+                combined ^= vec
+        assert combined == 0
+
+
+def test_siqs_factor():
+    assert siqs_factor(P * Q) in (P, Q)
+    assert siqs_factor(P * Q, workers=2, seed=1) in (P, Q)
+
+
+def test_strategy_selects_siqs():
+    assert dict(factor_with_methods(P * Q)) == {P: "siqs", Q: "siqs"}
+    without = make_strategy(siqs=False, pm1_bounds=None, pp1_bound=None)
+    assert "siqs" not in [stage.name for stage in without]
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from pv_sdk import factoring, tuning
+from pv_sdk.cli import main
+from pv_sdk.factoring import DEFAULT_STRATEGY, _is_prime, factor_range
+from pv_sdk.prime import create_composite_mappings
+
+
+def test_settings_precedence(tuning_profile):
+    assert tuning.get("sieve_segment_size") == tuning.TUNABLES["sieve_segment_size"]
+    tuning_profile.write_text(
+        json.dumps({"settings": {"sieve_segment_size": 64, "workers": 0, "bogus": 1}})
+    )
+    assert tuning.load_profile() == {"sieve_segment_size": 64}
+    assert tuning.get("sieve_segment_size") == 64
+    with tuning.overrides(sieve_segment_size=32):
+        assert tuning.get("sieve_segment_size") == 32
+        assert tuning.get("sieve_segment_size", 16) == 16
+        assert [start for start, _ in factor_range(0, 100)] == [0, 32, 64, 96]
+    assert len(list(factor_range(0, 100))) == 2
+    with pytest.raises(KeyError):
+        tuning.get("bogus")
+
+    (siqs,) = [stage for stage in DEFAULT_STRATEGY if stage.name == "siqs"]
+    n = 10**20 + 39
+    assert siqs.cost(n) == float("inf")
+    with tuning.overrides(siqs_min_digits=20):
+        assert siqs.cost(n) < float("inf")
+    tuning.save_profile({"siqs_min_digits": 15})
+    assert siqs.cost(n) < float("inf")
+
+    with tuning.overrides(composite_exponent_limit=4, trial_division_primes=1):
+        mappings = create_composite_mappings([2, 3, 5], ["U", "E", "I"])
+        assert [m["exponent"] for m in mappings] == [8, None, None]
+        assert [n for n in range(100) if _is_prime(n)][-3:] == [83, 89, 97]
+
+
+def test_calibrate_and_cli_use_profile(tuning_profile, capsys):
+    result = tuning.calibrate(quick=True)
+    assert set(result["settings"]) <= set(tuning.TUNABLES)
+    assert result["settings"]["workers"] <= result["measurements"]["cpus"]
+    lo, hi = tuning.SIQS_DIGIT_RANGE
+    assert lo <= result["settings"]["siqs_min_digits"] <= hi
+
+    tuning.save_profile({"sieve_segment_size": 7}, measurements={"cpus": 1})
+    assert json.loads(tuning_profile.read_text())["settings"] == {
+        "sieve_segment_size": 7
+    }
+    tuning.load_profile()
+    main(["sieve", "--lo", "10", "--hi", "30"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["prime"] for r in records] == [11, 13, 17, 19, 23, 29]
+
+
+def test_is_prime_follows_profile_changes(tuning_profile):
+    assert _is_prime(89 * 97) is False
+    assert len(factoring._trial_division_primes) == 10
+    tuning.save_profile({"trial_division_primes": 1})
+    assert _is_prime(97) and factoring._trial_division_primes == (2,)
+    with tuning.overrides(trial_division_primes=25):
+        assert _is_prime(97) and len(factoring._trial_division_primes) == 25
+    assert _is_prime(89 * 97) is False
+    assert factoring._trial_division_primes == (2,)
+
+
+def test_pool_and_segment_defaults_follow_profile(tuning_profile):
+    from pv_sdk.aio import AsyncEngine
+    from pv_sdk.arithmetic import iter_multiplicative_segments
+    from pv_sdk.prime import nth_prime
+    from pv_sdk.service import FactorServer
+
+    tuning.save_profile({"workers": 3, "sieve_segment_size": 40})
+    assert AsyncEngine().max_workers == FactorServer().workers == 3
+    assert AsyncEngine(max_workers=2).max_workers == 2
+    starts = [
+        start for start, _ in iter_multiplicative_segments(1, 100, functions=["mu"])
+    ]
+    assert starts == [1, 41, 81]
+    assert nth_prime(100_000) == 1_299_709
@@ -1,9 +1,15 @@
 import networkx as nx
 
+from pv_sdk.prime import is_prime, prime_to_vowel
 from pv_sdk.visualization import (
+    VOWEL_COLORS,
     calculate_centrality_measures,
     detect_graph_communities,
     graphical_representation_with_labels,
+    residue_heatmap,
+    save_raster,
+    ulam_spiral,
+    vowel_class_grid,
 )
 
 
@@ -41,3 +47,41 @@ def test_calculate_centrality_measures():
     for measure_values in centralities.values():
         assert isinstance(measure_values, dict)
         assert all(isinstance(v, float) for v in measure_values.values())
+
+
+def test_ulam_spiral():
+    # 1 at the center, 2 to its right, then counter-clockwise
+    expected = [
+        [37, 36, 35, 34, 33, 32, 31],
+        [38, 17, 16, 15, 14, 13, 30],
+        [39, 18, 5, 4, 3, 12, 29],
+        [40, 19, 6, 1, 2, 11, 28],
+        [41, 20, 7, 8, 9, 10, 27],
+        [42, 21, 22, 23, 24, 25, 26],
+        [43, 44, 45, 46, 47, 48, 49],
+    ]
+    image = ulam_spiral(7)
+    assert image.tolist() == [[is_prime(v) for v in row] for row in expected]
+    shifted = ulam_spiral(7, start=41)
+    assert shifted.tolist() == [[is_prime(v + 40) for v in row] for row in expected]
+    # Even sizes cut through the outermost ring
+    assert ulam_spiral(8)[:7, :7].tolist() == image.tolist()
+
+
+def test_vowel_class_grid_and_residue_heatmap(tmp_path):
+    grid = vowel_class_grid(90, 20, 5)
+    vowels = list(VOWEL_COLORS)
+    for i, value in enumerate(grid.ravel().tolist(), start=90):
+        expected = 1 + vowels.index(prime_to_vowel(i)) if is_prime(i) else 0
+        assert value == expected
+
+    heatmap = residue_heatmap(1000, 6, 4, lo=0)
+    assert heatmap.shape == (6, 4)
+    assert heatmap.sum() == 168
+    assert heatmap[[0, 4]].sum() == 0 and heatmap[2].sum() == 1
+    assert heatmap[3].sum() == 1 and heatmap[:, 0].sum() == 53  # primes < 250
+
+    save_raster(grid, str(tmp_path / "grid.png"))
+    save_raster(heatmap, str(tmp_path / "heat.png"), cmap="viridis", title="mod 6")
+    assert (tmp_path / "grid.png").stat().st_size > 0
+    assert (tmp_path / "heat.png").stat().st_size > 0
@@ -0,0 +1,62 @@
+from collections import Counter
+
+import pytest
+
+from pv_sdk.analysis import analyze_graph_properties
+from pv_sdk.prime import generate_primes_and_map
+from pv_sdk.visualization import calculate_centrality_measures
+from pv_sdk.vowel_graph import PrimeVowelGraph
+
+
+def _expected(graph):
+    import networkx as nx
+
+    g = graph.graph
+    assert g.number_of_edges() == graph.number_of_edges()
+    assert sorted(map(sorted, nx.connected_components(g))) == sorted(
+        map(sorted, graph.communities())
+    )
+    return analyze_graph_properties(g), calculate_centrality_measures(g)
+
+
+def _check(graph, properties, centralities):
+    result = graph.properties()
+    for key, value in properties.items():
+        assert result[key] == pytest.approx(value), key
+    for measure, values in graph.centralities().items():
+        assert values == pytest.approx(centralities[measure]), measure
+
+
+def test_incremental_updates_match_networkx(tmp_path):
+    graph = PrimeVowelGraph()
+    for limit in (2, 3, 20, 60, 150):
+        graph.extend_to(limit)
+        primes, vowels = generate_primes_and_map(
+            limit, pickle_file=str(tmp_path / f"c{limit}.pkl")
+        )
+        assert len(graph) == len(primes)
+        reference = PrimeVowelGraph(primes, vowels)
+        _check(graph, *_expected(reference))
+
+    # The lazily built graph is extended in place on later appends
+    built = graph.graph
+    graph.extend_to(300)
+    assert graph.graph is built
+    _check(graph, *_expected(graph))
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "graph.json")
+    graph = PrimeVowelGraph.load(path)
+    assert len(graph) == 0
+    assert graph.properties()["avg_degree"] == 0.0
+    graph.extend_to(100)
+    graph.save(path)
+
+    restored = PrimeVowelGraph.load(path)
+    assert restored.limit == 100
+    assert restored.class_sizes() == graph.class_sizes()
+    assert restored.extend_to(100) == 0
+    assert restored.extend_to(110) == 4  # 101, 103, 107, 109
+    degrees = dict(restored.graph.degree()).values()
+    assert restored.degree_histogram() == dict(Counter(degrees))
@@ -0,0 +1,53 @@
+import pytest
+
+from pv_sdk.factoring import prime_to_vowel_notation
+from pv_sdk.vowel_index import build_vowel_index, open_vowel_index
+
+PATTERNS = [
+    "AE",
+    "OIO",
+    "A",
+    "Y",
+    "2",
+    "0",
+    "AEIO",
+    "40A",
+    "IIII",
+    "AA",
+    "8A",
+    "U",
+    "AEIOAEIO",
+]
+
+
+@pytest.fixture(scope="module")
+def notations():
+    from sympy import primerange
+
+    return [(p, prime_to_vowel_notation(p)) for p in primerange(2, 300_000)]
+
+
+def test_queries_match_notation_strings(tmp_path, notations):
+    # Several small segments exercise the chunked two-pass build
+    index = build_vowel_index(str(tmp_path), 300_000, segment_size=40_000)
+    assert len(index) == len(notations)
+    for pattern in PATTERNS:
+        expected = [p for p, s in notations if pattern in s]
+        assert index.contains(pattern).tolist() == expected, pattern
+        expected = [p for p, s in notations if s.startswith(pattern)]
+        assert index.starts_with(pattern).tolist() == expected, pattern
+
+
+def test_reopen_and_subrange(tmp_path, notations):
+    build_vowel_index(str(tmp_path), 200_000, lo=100_000, gram_size=4)
+    index = open_vowel_index(str(tmp_path))
+    subrange = [(p, s) for p, s in notations if 100_000 <= p < 200_000]
+    for pattern in ("AEI", "AEIO", "OOO", "AYY"):
+        expected = [p for p, s in subrange if pattern in s]
+        assert index.contains(pattern).tolist() == expected
+    assert index.contains("U").tolist() == []
+    assert index.starts_with("AEIOAEIO").dtype == index.primes.dtype
+    with pytest.raises(ValueError):
+        index.contains("AB")
+    with pytest.raises(FileNotFoundError):
+        open_vowel_index(str(tmp_path / "missing"))